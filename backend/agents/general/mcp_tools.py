@@ -35,6 +35,9 @@ except ImportError:
 from shared.expression_evaluator import ExpressionEvaluator  # noqa: E402
 from shared.llm_text import strip_reasoning_markup  # noqa: E402
 
+# evaluate_batch marker for a row whose expression raised.
+_EVAL_FAILED = object()
+
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
@@ -321,15 +324,17 @@ def modify_data(
                     except Exception as e:
                         return create_ui_response([Alert(message=f"Invalid expression '{expression}': {e}", variant="error")])
                     
+                    keep_failed = str(default).lower() == 'true'
+                    verdicts = ExpressionEvaluator.evaluate_batch(
+                        expression, rows, default=_EVAL_FAILED)
                     filtered_rows = []
-                    for row in rows:
-                        try:
-                            if evaluator.evaluate(row):
-                                filtered_rows.append(row)
-                        except Exception:
+                    for row, verdict in zip(rows, verdicts):
+                        if verdict is _EVAL_FAILED:
                             # if error evaluating, keep or drop? let's drop if evaluate fails unless default is True
-                            if str(default).lower() == 'true':
+                            if keep_failed:
                                 filtered_rows.append(row)
+                        elif verdict:
+                            filtered_rows.append(row)
                     rows = filtered_rows
                     if df is not None and PANDAS_AVAILABLE:
                         df = pd.DataFrame(rows)
@@ -363,13 +368,16 @@ def modify_data(
                         Alert(message=f"Invalid expression '{expression}': {e}", variant="error")
                     ])
             
-            # Apply modification row by row
+            # Evaluate the whole column in one batch, then apply row by row
+            results = None
+            if expression and evaluator:
+                results = ExpressionEvaluator.evaluate_batch(
+                    expression, rows, default=_EVAL_FAILED)
             for i, row in enumerate(rows):
                 result = None
-                if expression and evaluator:
-                    try:
-                        result = evaluator.evaluate(row)
-                    except Exception:
+                if results is not None:
+                    result = results[i]
+                    if result is _EVAL_FAILED:
                         result = default if default is not None else value
                 else:
                     result = value
@@ -34,6 +34,7 @@ from __future__ import annotations
 import json
 import logging
 import uuid
+from contextlib import closing
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -363,48 +364,47 @@ class AuditRepository:
     # ------------------------------------------------------------------
 
     def verify_chain(self, actor_user_id: str) -> Optional[str]:
-        """Walk the user's chain forward; return the first bad event_id or ``None``."""
-        conn = self._db._get_connection()
-        try:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    SELECT * FROM audit_events
-                    WHERE actor_user_id = %s
-                    ORDER BY recorded_at ASC, event_id ASC
-                    """,
-                    (actor_user_id,),
-                )
-                rows = cur.fetchall()
-        finally:
-            conn.close()
+        """Walk the user's chain forward; return the first bad event_id or ``None``.
+
+        Rows stream from a server-side cursor, so a long-lived user's full
+        history is never held in memory at once.
+        """
+        rows = self._db.iter_all(
+            """
+            SELECT * FROM audit_events
+            WHERE actor_user_id = ?
+            ORDER BY recorded_at ASC, event_id ASC
+            """,
+            (actor_user_id,),
+        )
         prev = GENESIS_PREV_HASH
-        for r in rows:
-            row_for_chain = {
-                "schema_version": r["schema_version"],
-                "event_id": str(r["event_id"]),
-                "actor_user_id": r["actor_user_id"],
-                "auth_principal": r["auth_principal"],
-                "agent_id": r.get("agent_id"),
-                "event_class": r["event_class"],
-                "action_type": r["action_type"],
-                "description": r["description"],
-                "conversation_id": r.get("conversation_id"),
-                "correlation_id": str(r["correlation_id"]),
-                "outcome": r["outcome"],
-                "outcome_detail": r.get("outcome_detail"),
-                "inputs_meta": r["inputs_meta"],
-                "outputs_meta": r["outputs_meta"],
-                "artifact_pointers": r["artifact_pointers"],
-                "started_at": r["started_at"].astimezone(timezone.utc).isoformat() if r["started_at"] else None,
-                "completed_at": r["completed_at"].astimezone(timezone.utc).isoformat() if r["completed_at"] else None,
-            }
-            expected, _ = chain_hmac(prev, _canonical_row_bytes(row_for_chain), key_id=r["key_id"])
-            stored_prev = bytes(r["prev_hash"])
-            stored_entry = bytes(r["entry_hash"])
-            if stored_prev != prev or stored_entry != expected:
-                return str(r["event_id"])
-            prev = stored_entry
+        with closing(rows):
+            for r in rows:
+                row_for_chain = {
+                    "schema_version": r["schema_version"],
+                    "event_id": str(r["event_id"]),
+                    "actor_user_id": r["actor_user_id"],
+                    "auth_principal": r["auth_principal"],
+                    "agent_id": r.get("agent_id"),
+                    "event_class": r["event_class"],
+                    "action_type": r["action_type"],
+                    "description": r["description"],
+                    "conversation_id": r.get("conversation_id"),
+                    "correlation_id": str(r["correlation_id"]),
+                    "outcome": r["outcome"],
+                    "outcome_detail": r.get("outcome_detail"),
+                    "inputs_meta": r["inputs_meta"],
+                    "outputs_meta": r["outputs_meta"],
+                    "artifact_pointers": r["artifact_pointers"],
+                    "started_at": r["started_at"].astimezone(timezone.utc).isoformat() if r["started_at"] else None,
+                    "completed_at": r["completed_at"].astimezone(timezone.utc).isoformat() if r["completed_at"] else None,
+                }
+                expected, _ = chain_hmac(prev, _canonical_row_bytes(row_for_chain), key_id=r["key_id"])
+                stored_prev = bytes(r["prev_hash"])
+                stored_entry = bytes(r["entry_hash"])
+                if stored_prev != prev or stored_entry != expected:
+                    return str(r["event_id"])
+                prev = stored_entry
         return None
 
     def purge_older_than(self, cutoff: datetime) -> int:
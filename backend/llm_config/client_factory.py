@@ -19,14 +19,24 @@ factory only materializes the client, so the no-fallback invariant is
 structural rather than conditional.
 
 The factory is pure and uncached, so a ``clear`` (which re-gates the user)
-is observed on the very next call.
+is observed on the very next call. Only the HTTP transport underneath is
+shared: every client rides one process-wide connection pool, so a call
+reuses a warm keep-alive connection to its provider instead of paying a new
+TCP/TLS handshake. Credentials never live in the pool — each client sends
+its own key as a per-request header.
 """
 from __future__ import annotations
 
+import threading
 from typing import Optional, Protocol, Tuple
 
 from openai import OpenAI
 
+try:
+    from openai import DefaultHttpxClient
+except ImportError:  # openai < 1.17: each client keeps its own transport
+    DefaultHttpxClient = None
+
 from .types import CredentialSource, LLMUnavailable, ResolvedConfig
 
 
@@ -38,6 +48,22 @@ class LLMConfigLike(Protocol):
     model: str
 
 
+_shared_http_client = None
+_shared_http_lock = threading.Lock()
+
+
+def _shared_transport():
+    """The process-wide HTTP client every LLM client is built on (or None)."""
+    global _shared_http_client
+    if DefaultHttpxClient is None:
+        return None
+    if _shared_http_client is None:
+        with _shared_http_lock:
+            if _shared_http_client is None:
+                _shared_http_client = DefaultHttpxClient()
+    return _shared_http_client
+
+
 def build_llm_client(
     config: Optional[LLMConfigLike],
     source: CredentialSource,
@@ -86,6 +112,9 @@ def build_llm_client(
     kwargs["api_key"] = config.api_key or "not-needed"
     if timeout is not None:
         kwargs["timeout"] = timeout
+    transport = _shared_transport()
+    if transport is not None:
+        kwargs["http_client"] = transport
     client = OpenAI(**kwargs)
     return (
         client,
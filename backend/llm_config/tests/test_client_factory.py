@@ -108,6 +108,14 @@ class TestFactoryIsPureAndUncached:
         c2, _, _ = build_llm_client(cfg, CredentialSource.USER)
         assert c1 is not c2
 
+    def test_fresh_clients_share_one_connection_pool(self):
+        c1, _, _ = build_llm_client(_cfg(), CredentialSource.USER)
+        c2, _, _ = build_llm_client(
+            _cfg(api_key="sk-other-key-1234567890abcd",
+                 base_url="https://other.example/v1"), CredentialSource.SYSTEM)
+        assert c1._client is c2._client
+        assert c1.api_key != c2.api_key
+
 
 class TestTimeoutPassthrough:
     def test_timeout_kwarg_is_threaded_through(self):
@@ -24,7 +24,9 @@ NAT, so ``BaseA2AAgent``'s inbound uvicorn server is both too heavy and the wron
 topology. See specs/058-byo-agents-runtime/contracts/host-bundle.md.
 """
 import asyncio
+from collections import OrderedDict
 from dataclasses import dataclass
+import functools
 import hashlib
 import json
 import logging
@@ -38,6 +40,7 @@ from openai import OpenAI
 from httpx import Timeout
 
 from orchestrator.agent_spec import generate_llm_prompt_section
+from shared.feature_flags import flags
 
 logger = logging.getLogger("AgentGenerator")
 
@@ -593,6 +596,148 @@ def security_rules_block(self_contained: bool = False) -> str:
     return _SECURITY_RULES_BYO if self_contained else _SECURITY_RULES_BACKEND
 
 
+# ─── LLM reply → source ─────────────────────────────────────────────────
+
+_FENCED_BLOCK_RE = re.compile(r"^```[\w+-]*[ \t]*\n(.*?)^```[ \t]*$", re.DOTALL | re.MULTILINE)
+
+
+def _extract_code(reply: Optional[str]) -> str:
+    """The Python source in a codegen reply.
+
+    Replies are asked for bare code, but models still wrap it in a markdown
+    fence or put a sentence before the fence. A leading fence is stripped as
+    before; otherwise a reply that does not compile as-is is reduced to its
+    first fenced block, so prose around the code does not fail the whole
+    generation at the syntax gate."""
+    code = (reply or "").strip()
+    if code.startswith("```"):
+        lines = code.split("\n")
+        # Remove first and last fence lines
+        if lines[0].startswith("```"):
+            lines = lines[1:]
+        if lines and lines[-1].strip() == "```":
+            lines = lines[:-1]
+        return "\n".join(lines)
+    if "```" not in code:
+        return code
+    try:
+        compile(code, "<codegen>", "exec")
+        return code
+    except SyntaxError:
+        match = _FENCED_BLOCK_RE.search(code)
+        return match.group(1).rstrip() if match else code
+
+
+# ─── Codegen system prompts ─────────────────────────────────────────────
+
+_CODEGEN_SYSTEM = ("You are a precise Python code generator. Output ONLY valid "
+                   "Python code, no markdown fences or explanations.")
+
+
+@functools.lru_cache(maxsize=None)
+def _generate_instructions(self_contained: bool) -> str:
+    """System prompt for ``generate_tools_file``.
+
+    Holds every instruction that does not depend on the agent (UI spec,
+    credential and security rules), so the long prefix is byte-identical
+    across drafts and provider-side prefix caching can hit; the agent's name,
+    tools and knowledge context follow in the user message."""
+    return f"""{_CODEGEN_SYSTEM}
+
+You are a Python code generator for an agent tool system. You write a complete `mcp_tools.py` file for the agent described in the user message.
+
+{generate_llm_prompt_section(self_contained=self_contained)}
+
+## CREDENTIAL DECLARATION
+
+If this agent needs external API keys, OAuth tokens, or other secrets for **third-party services**
+(e.g. a weather API, email service, database), declare them with REQUIRED_CREDENTIALS:
+
+```python
+REQUIRED_CREDENTIALS = [
+    {{
+        "key": "SERVICE_API_KEY",        # UPPER_SNAKE_CASE key name
+        "label": "Service API Key",      # Human-readable label
+        "description": "Get this from ...",  # Help text for the user
+        "required": True,                # True if agent cannot work without it
+        "type": "api_key"                # One of: api_key, oauth_client_id, oauth_client_secret, token, password, username
+    }},
+]
+```
+
+If the agent does NOT need any external credentials (e.g. it only generates data locally
+or uses public APIs), set `REQUIRED_CREDENTIALS = []`.
+
+**NEVER declare credentials for the LLM itself** (no OpenAI key, no model config, no AI/LLM API keys).
+The LLM is provided by the system and shared across all agents — agents do not need their own LLM credentials.
+Only declare credentials for external third-party services the agent's tools call directly.
+
+IMPORTANT: Credentials are injected at runtime via the `_credentials` dict parameter.
+Inside tool functions, accept `**kwargs` and access them like:
+`api_key = kwargs.get("_credentials", {{}}).get("SERVICE_API_KEY", "")`
+Do NOT hardcode secrets. Do NOT use os.environ for secrets.
+
+## SECURITY RULES — You MUST follow these:
+{security_rules_block(self_contained)}"""
+
+
+@functools.lru_cache(maxsize=None)
+def _refine_instructions(self_contained: bool) -> str:
+    """System prompt for ``refine_tools_file`` — the refine counterpart of
+    ``_generate_instructions``; the current code and requested changes follow
+    in the user message."""
+    return f"""{_CODEGEN_SYSTEM}
+
+You are refining the tool implementations for an agent. The user message holds the agent, its current mcp_tools.py and the requested changes.
+
+{generate_llm_prompt_section(self_contained=self_contained)}
+
+IMPORTANT: Ensure all UI components use the astralprims classes (Card, MetricCard, Alert, etc.)
+and call `.to_dict()` to serialize them. Do NOT use raw dicts for UI components.
+
+## CREDENTIAL DECLARATION
+
+The file must include a `REQUIRED_CREDENTIALS` list at the module level. If the agent needs
+external API keys, OAuth tokens, or other secrets for **third-party services**, declare each one:
+
+```python
+REQUIRED_CREDENTIALS = [
+    {{"key": "SERVICE_API_KEY", "label": "Service API Key", "description": "Get this from ...", "required": True, "type": "api_key"}},
+]
+```
+
+If no credentials are needed, set `REQUIRED_CREDENTIALS = []`.
+If the refinement adds or removes API integrations, update REQUIRED_CREDENTIALS accordingly.
+Access credentials at runtime via: `kwargs.get("_credentials", {{}}).get("KEY", "")`
+
+**NEVER declare credentials for the LLM/AI model** (no OpenAI key, no model config).
+The LLM is system-provided and shared across all agents. Only declare credentials for external services.
+
+## SECURITY RULES — You MUST follow these:
+{security_rules_block(self_contained)}"""
+
+
+# ─── Tools-file prompt cache ────────────────────────────────────────────
+
+#: How long, and how many, identical ``generate_tools_file`` prompts are
+#: answered from memory instead of a fresh multi-second completion.
+_TOOLS_CACHE_TTL_SECONDS = 3600.0
+_TOOLS_CACHE_MAX = 64
+
+
+def _tools_prompt_key(client: Any, model: Optional[str],
+                      messages: List[Dict[str, str]]) -> str:
+    """Identity of one tools-file completion: endpoint, credential, model and
+    the exact prompt. The credential is part of it so code paid for on one
+    owner's LLM is never handed to another owner."""
+    blob = json.dumps(
+        [str(getattr(client, "base_url", "")), str(getattr(client, "api_key", "")),
+         model, messages],
+        sort_keys=True,
+    )
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
 # ─── Code Generator ─────────────────────────────────────────────────────
 
 class AgentCodeGenerator:
@@ -613,6 +758,38 @@ class AgentCodeGenerator:
         self.llm_client = llm_client
         self.llm_model = llm_model
         self._config_resolver = config_resolver
+        # key -> (stored_at, code); see _tools_prompt_key / forget_tools_file.
+        self._tools_cache: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+
+    def _cached_tools_file(self, key: str) -> Optional[str]:
+        if not flags.is_enabled("codegen_prompt_cache"):
+            return None
+        entry = self._tools_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, code = entry
+        if time.monotonic() - stored_at > _TOOLS_CACHE_TTL_SECONDS:
+            del self._tools_cache[key]
+            return None
+        self._tools_cache.move_to_end(key)
+        return code
+
+    def _remember_tools_file(self, key: str, code: str) -> None:
+        if not flags.is_enabled("codegen_prompt_cache"):
+            return
+        self._tools_cache[key] = (time.monotonic(), code)
+        self._tools_cache.move_to_end(key)
+        while len(self._tools_cache) > _TOOLS_CACHE_MAX:
+            self._tools_cache.popitem(last=False)
+
+    def forget_tools_file(self, code: str) -> None:
+        """Drop every cached prompt that produced ``code``.
+
+        The lifecycle calls this when generated code did not survive its gates
+        unchanged (syntax, security, spec validation, auto-fix), so a retry of
+        the same draft asks the LLM again instead of replaying a bad answer."""
+        for key in [k for k, (_, c) in self._tools_cache.items() if c == code]:
+            del self._tools_cache[key]
 
     async def _aresolve_client(self, config_resolver=None):
         """Resolve (client, model) for one generation call, or (None, None).
@@ -912,8 +1089,6 @@ class AgentCodeGenerator:
                 "`agents.`, and NEVER touch `sys.path`."
             )
 
-        ui_spec = generate_llm_prompt_section(self_contained=self_contained)
-
         knowledge_section = ""
         if knowledge_context:
             knowledge_section = f"""
@@ -923,7 +1098,7 @@ The following patterns have been learned from production usage and should inform
 {knowledge_context}
 """
 
-        prompt = f"""You are a Python code generator for an agent tool system. Generate a complete `mcp_tools.py` file.
+        prompt = f"""Generate a complete `mcp_tools.py` file.
 
 ## Agent Info
 - Name: {agent_name}
@@ -932,49 +1107,21 @@ The following patterns have been learned from production usage and should inform
 ## Tools to Implement
 {tools_description if tools_description else "Create appropriate tools based on the agent description."}
 {packages_note}
-
-{ui_spec}
 {knowledge_section}
 
-## CREDENTIAL DECLARATION
-
-If this agent needs external API keys, OAuth tokens, or other secrets for **third-party services**
-(e.g. a weather API, email service, database), declare them with REQUIRED_CREDENTIALS:
-
-```python
-REQUIRED_CREDENTIALS = [
-    {{
-        "key": "SERVICE_API_KEY",        # UPPER_SNAKE_CASE key name
-        "label": "Service API Key",      # Human-readable label
-        "description": "Get this from ...",  # Help text for the user
-        "required": True,                # True if agent cannot work without it
-        "type": "api_key"                # One of: api_key, oauth_client_id, oauth_client_secret, token, password, username
-    }},
-]
-```
-
-If the agent does NOT need any external credentials (e.g. it only generates data locally
-or uses public APIs), set `REQUIRED_CREDENTIALS = []`.
-
-**NEVER declare credentials for the LLM itself** (no OpenAI key, no model config, no AI/LLM API keys).
-The LLM is provided by the system and shared across all agents — agents do not need their own LLM credentials.
-Only declare credentials for external third-party services the agent's tools call directly.
-
-IMPORTANT: Credentials are injected at runtime via the `_credentials` dict parameter.
-Inside tool functions, accept `**kwargs` and access them like:
-`api_key = kwargs.get("_credentials", {{}}).get("SERVICE_API_KEY", "")`
-Do NOT hardcode secrets. Do NOT use os.environ for secrets.
-
-## SECURITY RULES — You MUST follow these:
-{security_rules_block(self_contained)}
-
 Output ONLY the Python code. No markdown fences, no explanations."""
 
         messages = [
-            {"role": "system", "content": "You are a precise Python code generator. Output ONLY valid Python code, no markdown fences or explanations."},
+            {"role": "system", "content": _generate_instructions(bool(self_contained))},
             {"role": "user", "content": prompt}
         ]
 
+        key = _tools_prompt_key(_client, _model, messages)
+        cached = self._cached_tools_file(key)
+        if cached is not None:
+            logger.info("agent codegen: reusing tools file for an identical prompt")
+            return cached
+
         response = await asyncio.to_thread(
             _client.chat.completions.create,
             model=_model,
@@ -982,17 +1129,8 @@ Output ONLY the Python code. No markdown fences, no explanations."""
             temperature=0.2,
         )
 
-        code = response.choices[0].message.content.strip()
-        # Strip markdown fences if present
-        if code.startswith("```"):
-            lines = code.split("\n")
-            # Remove first and last fence lines
-            if lines[0].startswith("```"):
-                lines = lines[1:]
-            if lines and lines[-1].strip() == "```":
-                lines = lines[:-1]
-            code = "\n".join(lines)
-
+        code = _extract_code(response.choices[0].message.content)
+        self._remember_tools_file(key, code)
         return code
 
     async def refine_tools_file(self, current_code: str, user_message: str,
@@ -1011,9 +1149,7 @@ Output ONLY the Python code. No markdown fences, no explanations."""
         if not _client:
             raise RuntimeError("LLM not configured — cannot refine agent tools")
 
-        ui_spec = generate_llm_prompt_section(self_contained=self_contained)
-
-        prompt = f"""You are refining the tool implementations for an agent.
+        prompt = f"""Refine the tool implementations for this agent.
 
 ## Agent Info
 - Name: {agent_name}
@@ -1027,37 +1163,11 @@ Output ONLY the Python code. No markdown fences, no explanations."""
 ## User's requested changes:
 {user_message}
 
-{ui_spec}
-
-IMPORTANT: Ensure all UI components use the astralprims classes (Card, MetricCard, Alert, etc.)
-and call `.to_dict()` to serialize them. Do NOT use raw dicts for UI components.
-
-## CREDENTIAL DECLARATION
-
-The file must include a `REQUIRED_CREDENTIALS` list at the module level. If the agent needs
-external API keys, OAuth tokens, or other secrets for **third-party services**, declare each one:
-
-```python
-REQUIRED_CREDENTIALS = [
-    {{"key": "SERVICE_API_KEY", "label": "Service API Key", "description": "Get this from ...", "required": True, "type": "api_key"}},
-]
-```
-
-If no credentials are needed, set `REQUIRED_CREDENTIALS = []`.
-If the refinement adds or removes API integrations, update REQUIRED_CREDENTIALS accordingly.
-Access credentials at runtime via: `kwargs.get("_credentials", {{}}).get("KEY", "")`
-
-**NEVER declare credentials for the LLM/AI model** (no OpenAI key, no model config).
-The LLM is system-provided and shared across all agents. Only declare credentials for external services.
-
-## SECURITY RULES — You MUST follow these:
-{security_rules_block(self_contained)}
-
 Apply the requested changes and output the COMPLETE updated mcp_tools.py file.
 Output ONLY the Python code. No markdown fences, no explanations."""
 
         messages = [
-            {"role": "system", "content": "You are a precise Python code generator. Output ONLY valid Python code, no markdown fences or explanations."},
+            {"role": "system", "content": _refine_instructions(bool(self_contained))},
             {"role": "user", "content": prompt}
         ]
 
@@ -1068,13 +1178,4 @@ Output ONLY the Python code. No markdown fences, no explanations."""
             temperature=0.2,
         )
 
-        code = response.choices[0].message.content.strip()
-        if code.startswith("```"):
-            lines = code.split("\n")
-            if lines[0].startswith("```"):
-                lines = lines[1:]
-            if lines and lines[-1].strip() == "```":
-                lines = lines[:-1]
-            code = "\n".join(lines)
-
-        return code
+        return _extract_code(response.choices[0].message.content)
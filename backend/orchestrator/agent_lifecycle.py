@@ -1201,12 +1201,8 @@ class AgentLifecycleManager:
 
     def _append_log(self, draft_id: str, message: str):
         """Append a message to the draft's generation_log."""
-        draft = self.db.get_draft_agent(draft_id)
-        if not draft:
-            return
-        log = json.loads(draft.get("generation_log") or "[]")
-        log.append({"message": message, "timestamp": int(time.time() * 1000)})
-        self.db.update_draft_agent(draft_id, generation_log=json.dumps(log))
+        self.db.append_draft_log(
+            draft_id, {"message": message, "timestamp": int(time.time() * 1000)})
 
     def _extract_required_credentials(self, tools_code: str) -> list:
         """Extract REQUIRED_CREDENTIALS from generated mcp_tools.py using AST (no exec)."""
@@ -1247,10 +1243,16 @@ class AgentLifecycleManager:
                 VALIDATING,
             )
 
+            # Off the event loop: the runtime pass imports the module and calls
+            # every tool, which can sit in network timeouts for seconds. Its
+            # import step edits sys.path, so the validator serializes it behind
+            # a module-level lock rather than letting drafts race.
             if static_only:
-                report = self.validator.validate_static(tools_code, slug)
+                report = await asyncio.to_thread(
+                    self.validator.validate_static, tools_code, slug)
             else:
-                report = self.validator.validate(tools_code, slug, self._agents_dir)
+                report = await asyncio.to_thread(
+                    self.validator.validate, tools_code, slug, self._agents_dir)
             await asyncio.to_thread(
                 self._append_log,
                 draft_id,
@@ -1325,6 +1327,18 @@ class AgentLifecycleManager:
 
         return tools_code, report
 
+    @staticmethod
+    def _first_syntax_error(files: Dict[str, str], slug: str) -> Optional[str]:
+        """The first generated ``.py`` file that does not compile, as a message."""
+        for fname, code in files.items():
+            if not fname.endswith(".py"):
+                continue
+            try:
+                compile(code, f"{slug}/{fname}", "exec")
+            except SyntaxError as e:
+                return f"Syntax error in {fname} (line {e.lineno}): {e.msg}"
+        return None
+
     @staticmethod
     def _byo_import_violations(files: Dict[str, str]) -> List[str]:
         """Forbidden backend-coupling imports found anywhere in a BYO bundle."""
@@ -1552,6 +1566,10 @@ class AgentLifecycleManager:
 
         await asyncio.to_thread(self._append_log, draft_id, "Starting code generation...")
 
+        # The LLM's first answer stays in the generator's prompt cache only if
+        # it came through every gate below unchanged.
+        generated_tools = None
+        keep_generated = False
         try:
             # Step 1: Generate template files (no LLM needed)
             await self._send_progress(websocket, draft_id, "generating_template",
@@ -1611,6 +1629,7 @@ class AgentLifecycleManager:
                 self_contained=is_byo,
                 config_resolver=codegen_resolver,
             )
+            generated_tools = tools_code
 
             all_files = {**template_files, "mcp_tools.py": tools_code}
 
@@ -1619,21 +1638,42 @@ class AgentLifecycleManager:
                                        "Validating Python syntax...", GENERATING)
             await asyncio.to_thread(self._append_log, draft_id, "Validating syntax of generated files...")
 
-            for fname, code in all_files.items():
-                if not fname.endswith(".py"):
-                    continue
+            error_msg = await asyncio.to_thread(self._first_syntax_error, all_files, slug)
+            if error_msg and error_msg.startswith("Syntax error in mcp_tools.py"):
+                # The templates are deterministic, so only the LLM's file can be
+                # broken: give it one repair round with the compiler's message
+                # before failing the draft. The candidate is promoted only if
+                # the whole file set then compiles.
+                await self._send_progress(websocket, draft_id, "auto_fixing",
+                                           "Fixing a syntax error in the generated tools...",
+                                           GENERATING)
+                await asyncio.to_thread(self._append_log, draft_id, f"Syntax repair: {error_msg}")
                 try:
-                    compile(code, f"{slug}/{fname}", "exec")
-                except SyntaxError as e:
-                    error_msg = f"Syntax error in {fname} (line {e.lineno}): {e.msg}"
-                    logger.error(f"Generated code has syntax error: {error_msg}")
-                    state = await finish_generation(
-                        ERROR, error_message=error_msg
+                    candidate = await self.generator.refine_tools_file(
+                        current_code=tools_code,
+                        user_message=(f"The file does not compile. {error_msg}. "
+                                      "Fix the syntax without changing the tools' behavior."),
+                        agent_name=agent_name,
+                        description=description,
+                        self_contained=is_byo,
+                        config_resolver=codegen_resolver,
                     )
-                    await self._send_progress(websocket, draft_id, "syntax_error",
-                                               error_msg, ERROR)
-                    await asyncio.to_thread(self._append_log, draft_id, f"SYNTAX ERROR: {error_msg}")
-                    return state
+                except Exception as e:
+                    logger.warning(f"Syntax repair failed for {draft_id}: {e}")
+                    candidate = None
+                if candidate:
+                    repaired = {**template_files, "mcp_tools.py": candidate}
+                    if not await asyncio.to_thread(self._first_syntax_error, repaired, slug):
+                        tools_code, all_files, error_msg = candidate, repaired, None
+            if error_msg:
+                logger.error(f"Generated code has syntax error: {error_msg}")
+                state = await finish_generation(
+                    ERROR, error_message=error_msg
+                )
+                await self._send_progress(websocket, draft_id, "syntax_error",
+                                           error_msg, ERROR)
+                await asyncio.to_thread(self._append_log, draft_id, f"SYNTAX ERROR: {error_msg}")
+                return state
 
             # Step 2.6 (BYO): the bundle must be self-contained — the desktop host
             # ships no backend package, so a `from shared…` import is a dead agent
@@ -1656,7 +1696,8 @@ class AgentLifecycleManager:
                                        "Running security analysis...", GENERATING)
             await asyncio.to_thread(self._append_log, draft_id, "Running security analysis on generated code...")
 
-            report = self.security.analyze(tools_code, filename=f"{slug}/mcp_tools.py")
+            report = await asyncio.to_thread(
+                self.security.analyze, tools_code, filename=f"{slug}/mcp_tools.py")
 
             if not report.passed and report.max_severity == Severity.CRITICAL:
                 state = await finish_generation(
@@ -1805,6 +1846,7 @@ class AgentLifecycleManager:
             state = await finish_generation(GENERATED, **update_kwargs)
             if state.get("generation_outcome") == "conflict":
                 return state
+            keep_generated = validation_report.passed and tools_code == generated_tools
 
             status_msg = (
                 "Agent files generated and validated successfully!"
@@ -1856,6 +1898,9 @@ class AgentLifecycleManager:
                                        f"Code generation failed: {e}", ERROR)
             await asyncio.to_thread(self._append_log, draft_id, f"ERROR: {e}")
             return state
+        finally:
+            if generated_tools is not None and not keep_generated:
+                self.generator.forget_tools_file(generated_tools)
 
     # Start Draft Agent for Testing
 
@@ -1955,12 +2000,16 @@ class AgentLifecycleManager:
             logger.exception("C-S6 sandbox setup failed; launching unsandboxed")
             sandbox_kwargs = {}
 
-        proc = self.process_supervisor.spawn(
-            process_id=uuid.uuid4(),
-            owner=ProcessOwner(owner_kind="draft_agent", owner_id=draft_id),
-            argv=(python_exe, agent_script, "--port", str(port)),
-            cwd=agent_dir,
-            **sandbox_kwargs,
+        # Off the event loop: fork/exec of this (large) process, plus a
+        # preexec_fn sandbox, stalls every other session while it runs.
+        proc = await asyncio.to_thread(
+            lambda: self.process_supervisor.spawn(
+                process_id=uuid.uuid4(),
+                owner=ProcessOwner(owner_kind="draft_agent", owner_id=draft_id),
+                argv=(python_exe, agent_script, "--port", str(port)),
+                cwd=agent_dir,
+                **sandbox_kwargs,
+            )
         )
         self._draft_processes[draft_id] = proc
 
@@ -2625,6 +2674,25 @@ class AgentLifecycleManager:
 
     # Delete Draft
 
+    @staticmethod
+    def _force_remove_dir(agent_dir: str) -> None:
+        """Remove whatever files and dirs are unlocked, then the dir itself."""
+        for root, dirs, files in os.walk(agent_dir, topdown=False):
+            for name in files:
+                try:
+                    os.remove(os.path.join(root, name))
+                except OSError:
+                    pass
+            for name in dirs:
+                try:
+                    os.rmdir(os.path.join(root, name))
+                except OSError:
+                    pass
+        try:
+            os.rmdir(agent_dir)
+        except OSError:
+            logger.warning(f"Directory still locked: {agent_dir}")
+
     async def delete_draft(self, draft_id: str) -> bool:
         """Delete a draft agent — stops process, removes files, deletes DB record."""
         draft = self.db.get_draft_agent(draft_id)
@@ -2639,10 +2707,10 @@ class AgentLifecycleManager:
         # Remove files — retry on Windows where handles may linger
         slug = draft["agent_slug"]
         agent_dir = os.path.join(self._agents_dir, slug)
-        if os.path.exists(agent_dir):
+        if os.path.isdir(agent_dir):
             for attempt in range(3):
                 try:
-                    shutil.rmtree(agent_dir)
+                    await asyncio.to_thread(shutil.rmtree, agent_dir)
                     logger.info(f"Removed agent directory: {agent_dir}")
                     break
                 except (PermissionError, OSError) as e:
@@ -2651,22 +2719,7 @@ class AgentLifecycleManager:
                         await asyncio.sleep(1)
                     else:
                         logger.warning(f"Could not fully remove {agent_dir}: {e}")
-                        # Force-remove individual files then try the directory
-                        for root, dirs, files in os.walk(agent_dir, topdown=False):
-                            for name in files:
-                                try:
-                                    os.remove(os.path.join(root, name))
-                                except OSError:
-                                    pass
-                            for name in dirs:
-                                try:
-                                    os.rmdir(os.path.join(root, name))
-                                except OSError:
-                                    pass
-                        try:
-                            os.rmdir(agent_dir)
-                        except OSError:
-                            logger.warning(f"Directory still locked: {agent_dir}")
+                        await asyncio.to_thread(self._force_remove_dir, agent_dir)
 
         # Delete DB record
         self.db.delete_draft_agent(draft_id)
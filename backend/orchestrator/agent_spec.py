@@ -5,6 +5,7 @@ Auto-derives the primitives spec from shared/primitives.py dataclass fields
 so it never drifts out of sync. Provides the LLM prompt section used by
 both generate_tools_file() and refine_tools_file().
 """
+import functools
 import os
 import sys
 from typing import Dict, Any, Set
@@ -170,6 +171,7 @@ COMPONENT_REFERENCE = _build_component_reference()
 
 # ─── LLM prompt section generator ───────────────────────────────────────
 
+@functools.lru_cache(maxsize=None)
 def generate_llm_prompt_section(self_contained: bool = False) -> str:
     """Generate the complete UI component specification for LLM prompts.
 
@@ -179,6 +181,9 @@ def generate_llm_prompt_section(self_contained: bool = False) -> str:
     ``self_contained`` (BYO, 058): emit the required-imports block WITHOUT the
     backend ``sys.path`` shim — the bundle runs on the owner's desktop, and the
     self-containment gate REFUSES any file containing ``sys.path.insert``.
+
+    Everything it renders is fixed at import, so each variant is built once
+    and the same string is reused by every generate/refine prompt.
     """
     imports_block = BYO_REQUIRED_IMPORTS_BLOCK if self_contained else REQUIRED_IMPORTS_BLOCK
     return f"""## UI COMPONENT SYSTEM — YOU MUST FOLLOW THIS EXACTLY
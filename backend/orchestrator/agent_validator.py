@@ -24,6 +24,7 @@ import importlib.util
 import logging
 import os
 import sys
+import threading
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 from typing import Dict, Any, Optional, List, Set, Tuple
@@ -32,6 +33,10 @@ from orchestrator.agent_spec import VALID_COMPONENT_TYPES, PRIMITIVES_SPEC
 
 logger = logging.getLogger("AgentValidator")
 
+#: Serializes :meth:`AgentSpecValidator._load_registry`, which edits sys.path and
+#: exec's generated modules while draft validations run on worker threads.
+_REGISTRY_LOAD_LOCK = threading.Lock()
+
 #: Everything a BYO bundle is allowed to import: the standard library (which the
 #: host's interpreter always has) plus astralprims (the one client-side
 #: third-party dependency, Constitution V carve-out).
@@ -424,58 +429,66 @@ class AgentSpecValidator:
                        f"mcp_tools.py not found at {module_path}")
             return None
 
-        # Ensure backend is on sys.path for shared imports
+        # Ensure backend is on sys.path for shared imports. sys.path and the
+        # import machinery are process-global and this may run on a worker
+        # thread (agent_lifecycle), so loads are serialized and only the entry
+        # added here is removed afterwards -- never a stale snapshot restore.
         backend_dir = os.path.abspath(os.path.join(agents_dir, '..'))
-        original_path = sys.path.copy()
-        if backend_dir not in sys.path:
-            sys.path.insert(0, backend_dir)
-
-        try:
-            # Create a unique module name to avoid caching issues
-            module_name = f"_validator_{slug}_{id(report)}"
-            spec = importlib.util.spec_from_file_location(module_name, module_path)
-            if spec is None or spec.loader is None:
+        with _REGISTRY_LOAD_LOCK:
+            inserted = backend_dir not in sys.path
+            if inserted:
+                sys.path.insert(0, backend_dir)
+
+            try:
+                # Create a unique module name to avoid caching issues
+                module_name = f"_validator_{slug}_{id(report)}"
+                spec = importlib.util.spec_from_file_location(module_name, module_path)
+                if spec is None or spec.loader is None:
+                    report.add(ValidationSeverity.ERROR, "REGISTRY",
+                               "Failed to create module spec for mcp_tools.py")
+                    return None
+
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+
+                registry = getattr(module, "TOOL_REGISTRY", None)
+                if registry is None:
+                    report.add(ValidationSeverity.ERROR, "REGISTRY",
+                               "TOOL_REGISTRY not found in mcp_tools.py. "
+                               "The file must export a TOOL_REGISTRY dict.")
+                    return None
+
+                if not isinstance(registry, dict):
+                    report.add(ValidationSeverity.ERROR, "REGISTRY",
+                               f"TOOL_REGISTRY is {type(registry).__name__}, expected dict.")
+                    return None
+
+                if not registry:
+                    report.add(ValidationSeverity.ERROR, "REGISTRY",
+                               "TOOL_REGISTRY is empty — no tools defined.")
+                    return None
+
+                return registry
+
+            except STRUCTURAL_EXCEPTIONS as e:
                 report.add(ValidationSeverity.ERROR, "REGISTRY",
-                           "Failed to create module spec for mcp_tools.py")
+                           f"Failed to import mcp_tools.py: {type(e).__name__}: {e}")
                 return None
-
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-
-            registry = getattr(module, "TOOL_REGISTRY", None)
-            if registry is None:
-                report.add(ValidationSeverity.ERROR, "REGISTRY",
-                           "TOOL_REGISTRY not found in mcp_tools.py. "
-                           "The file must export a TOOL_REGISTRY dict.")
-                return None
-
-            if not isinstance(registry, dict):
-                report.add(ValidationSeverity.ERROR, "REGISTRY",
-                           f"TOOL_REGISTRY is {type(registry).__name__}, expected dict.")
+            except NETWORK_EXCEPTIONS as e:
+                report.add(ValidationSeverity.WARNING, "REGISTRY",
+                           f"Module import triggered network call that failed: {e}. "
+                           "Avoid making network calls at module level.")
                 return None
-
-            if not registry:
+            except Exception as e:
                 report.add(ValidationSeverity.ERROR, "REGISTRY",
-                           "TOOL_REGISTRY is empty — no tools defined.")
+                           f"Unexpected error loading mcp_tools.py: {type(e).__name__}: {e}")
                 return None
-
-            return registry
-
-        except STRUCTURAL_EXCEPTIONS as e:
-            report.add(ValidationSeverity.ERROR, "REGISTRY",
-                       f"Failed to import mcp_tools.py: {type(e).__name__}: {e}")
-            return None
-        except NETWORK_EXCEPTIONS as e:
-            report.add(ValidationSeverity.WARNING, "REGISTRY",
-                       f"Module import triggered network call that failed: {e}. "
-                       "Avoid making network calls at module level.")
-            return None
-        except Exception as e:
-            report.add(ValidationSeverity.ERROR, "REGISTRY",
-                       f"Unexpected error loading mcp_tools.py: {type(e).__name__}: {e}")
-            return None
-        finally:
-            sys.path = original_path
+            finally:
+                if inserted:
+                    try:
+                        sys.path.remove(backend_dir)
+                    except ValueError:
+                        pass
 
     def _validate_tool(self, tool_name: str, tool_info: Dict,
                        report: ValidationReport):
@@ -19,6 +19,7 @@ from fastapi import APIRouter, Request
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.responses import JSONResponse, FileResponse
+from jose import JWTError
 from jose import jwt as jose_jwt
 
 import shared  # noqa: F401 — normalizes USE_MOCK_AUTH/KEYCLOAK_* env aliases before the import-time read below
@@ -182,15 +183,24 @@ async def get_current_user_payload(request: Request, credentials: HTTPAuthorizat
         raise HTTPException(status_code=500, detail="Auth not configured")
         
     try:
-        # Feature 028 D8: cached JWKS (kid-miss refetch) replaces per-request fetch.
-        jwks_url = f"{authority}/protocol/openid-connect/certs"
-        from shared.jwks_cache import get_jwks
-        jwks = await get_jwks(jwks_url, token=token)
-
-        payload = jose_jwt.decode(
-            token, jwks, algorithms=["RS256"],
-            options={"verify_aud": False, "verify_at_hash": False}
-        )
+        from shared.jwks_cache import (
+            accepted_algorithms, cached_claims, get_jwks, is_acceptable_token,
+            recently_rejected, remember_claims, signing_key, token_header)
+        payload = cached_claims(token)
+        if payload is None:
+            header = token_header(token)
+            if not is_acceptable_token(token, header) or recently_rejected(token):
+                raise HTTPException(status_code=401, detail="Invalid token")
+            # Feature 028 D8: cached JWKS (kid-miss refetch) replaces per-request fetch.
+            jwks_url = f"{authority}/protocol/openid-connect/certs"
+            jwks = signing_key(
+                await get_jwks(jwks_url, token=token, header=header), token, header)
+            # Off the event loop: the RSA verify is pure CPU.
+            payload = await asyncio.to_thread(
+                jose_jwt.decode, token, jwks, algorithms=list(accepted_algorithms()),
+                options={"verify_aud": False, "verify_at_hash": False}
+            )
+            remember_claims(token, payload)
         # Accept the web client (client_id) plus any first-party clients in the
         # KEYCLOAK_ALLOWED_AZP allow-list (e.g. the native desktop's dedicated
         # public client astral-desktop). Empty allow-list ⇒ web client only.
@@ -203,8 +213,17 @@ async def get_current_user_payload(request: Request, credentials: HTTPAuthorizat
         except Exception:
             pass
         return payload
+    except JWTError as e:
+        from shared.jwks_cache import remember_rejection
+        remember_rejection(token)
+        logger.info("Token rejected in auth wrapper: %s", e)
+        raise HTTPException(status_code=401, detail="Invalid token")
+    except HTTPException:
+        # Deliberate rejections above (malformed, recently rejected, foreign
+        # azp) are expected traffic, not validation faults.
+        raise
     except Exception as e:
-        logger.error(f"Token validation failed in auth wrapper: {e}")
+        logger.error("Token validation failed in auth wrapper: %s", e)
         raise HTTPException(status_code=401, detail="Invalid token")
 
 
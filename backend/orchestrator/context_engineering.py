@@ -20,9 +20,15 @@ land dormant behind ``FF_CONTEXT_ENGINEERING`` (default off):
    tombstone while preserving each message's ``role`` / ``tool_call_id`` /
    ``name`` so the assistant→tool pairing the Chat Completions API requires
    stays intact.
+
+3. :func:`clip_tool_output` — bound what a *single* tool result contributes
+   to the window. An oversized result is replaced by a short structural
+   outline plus the head of its text, so one large payload cannot dominate
+   the prefill of every later turn in the loop.
 """
 from __future__ import annotations
 
+import json
 import logging
 from typing import Any, Dict, List, Tuple
 
@@ -38,6 +44,9 @@ CANVAS_CONTEXT_MARK = "%%ASTRAL_CANVAS_CONTEXT%%"
 # Default tombstone text substituted for stale tool output.
 TOMBSTONE = "[older tool output cleared to save context]"
 
+# Roughly 2k tokens: the most text one tool result may put in the window.
+MAX_TOOL_CONTENT_CHARS = 8000
+
 
 def compose_system_prompt(
     template: str,
@@ -156,3 +165,41 @@ def edit_context(
         out[i] = edited
         n += 1
     return out, n
+
+
+def _outline(value: Any) -> str:
+    """One-line shape of a decoded JSON value: type, size, top-level keys."""
+    if isinstance(value, dict):
+        parts = []
+        for key, item in list(value.items())[:20]:
+            if isinstance(item, (list, dict)):
+                parts.append(f"{key} ({type(item).__name__}, {len(item)} items)")
+            else:
+                parts.append(f"{key} ({type(item).__name__})")
+        more = f", +{len(value) - 20} more" if len(value) > 20 else ""
+        return f"object with {len(value)} keys: " + ", ".join(parts) + more
+    if isinstance(value, list):
+        return f"array of {len(value)} items"
+    return type(value).__name__
+
+
+def clip_tool_output(content: str, *, max_chars: int = MAX_TOOL_CONTENT_CHARS) -> str:
+    """Bound one tool result's LLM-visible text to about ``max_chars``.
+
+    Content within the limit is returned unchanged. Longer content becomes a
+    header naming its full size and, when it parses as JSON, its structure
+    (top-level keys with item counts), followed by as much of the original
+    text as fits. The full result still reaches the UI through the tool's
+    components; only the model's copy is clipped. Total: non-string or
+    unparseable input is clipped as plain text.
+    """
+    if not isinstance(content, str) or len(content) <= max_chars:
+        return content
+    header = f"[tool output clipped: {len(content):,} chars total"
+    try:
+        header += "; structure: " + _outline(json.loads(content))
+    except (ValueError, RecursionError):
+        pass
+    header += "; showing the beginning]\n"
+    keep = max(max_chars - len(header), 0)
+    return header + content[:keep]
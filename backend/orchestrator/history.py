@@ -1483,6 +1483,27 @@ class ConversationCommitRepository:
                 connection.close()
 
 
+# Every character a JSON document can start with once leading JSON whitespace
+# is skipped (including Python's NaN/Infinity extensions). Stored text that
+# starts with anything else cannot parse, so it skips the attempt.
+_JSON_FIRST_CHARS = frozenset('{["-0123456789tfnNI')
+
+
+def _decode_stored_content(content: Any) -> Any:
+    """Stored message content, JSON-decoded when it is JSON, else unchanged.
+
+    Plain-text turns are the common case; failing them on the first
+    character instead of raising ``JSONDecodeError`` keeps history loads
+    from paying an exception per message, with identical results.
+    """
+    if isinstance(content, str) and content.lstrip(" \t\n\r")[:1] not in _JSON_FIRST_CHARS:
+        return content
+    try:
+        return json.loads(content)
+    except (json.JSONDecodeError, TypeError):
+        return content
+
+
 def _component_preview_text(components) -> str:
     """Flatten a component-list message into human-readable preview text.
 
@@ -1548,16 +1569,17 @@ class HistoryManager:
                     (chat_id, 'legacy', chat_data.get('title'), chat_data.get('created_at'), chat_data.get('updated_at'))
                 )
                 
+                rows = []
                 for msg in chat_data.get('messages', []):
                     # Serialize content if it's not a string
                     content = msg.get('content')
                     if not isinstance(content, str):
                         content = json.dumps(content)
-                        
-                    self.db.execute(
-                        "INSERT INTO messages (chat_id, user_id, role, content, timestamp) VALUES (?, ?, ?, ?, ?)",
-                        (chat_id, 'legacy', msg.get('role'), content, msg.get('timestamp'))
-                    )
+                    rows.append((chat_id, 'legacy', msg.get('role'), content, msg.get('timestamp')))
+                self.db.execute_many(
+                    "INSERT INTO messages (chat_id, user_id, role, content, timestamp) VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
             
             # Rename JSON file to backup to prevent re-migration
             os.rename(self.json_file, self.json_file + ".bak")
@@ -1724,13 +1746,8 @@ class HistoryManager:
         )
         messages = []
         for row in messages_rows:
-            content = row['content']
-            # Try to deserialize JSON content
-            try:
-                content = json.loads(content)
-            except (json.JSONDecodeError, TypeError):
-                pass # Keep as string
-            
+            content = _decode_stored_content(row['content'])
+
             messages.append({
                 "id": row['id'],
                 "role": row['role'],
@@ -1740,10 +1757,7 @@ class HistoryManager:
 
         if stage is not None and stage.matches(self, chat_id, user_id):
             for offset, message in enumerate(stage.messages, start=1):
-                try:
-                    content = json.loads(message.content)
-                except (json.JSONDecodeError, TypeError):
-                    content = message.content
+                content = _decode_stored_content(message.content)
                 messages.append(
                     {
                         "id": None,
@@ -1816,7 +1830,7 @@ class HistoryManager:
             preview = ""
             if content is not None:
                 try:
-                    content_obj = json.loads(content)
+                    content_obj = _decode_stored_content(content)
                 except Exception:
                     content_obj = content
                 if isinstance(content_obj, str):
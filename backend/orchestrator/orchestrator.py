@@ -11,6 +11,7 @@ Responsibilities:
 import asyncio
 import contextvars
 import hashlib
+import importlib
 import json
 import time
 import os
@@ -32,6 +33,7 @@ import uvicorn
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
+from jose import JWTError
 from jose import jwt as jose_jwt
 from dotenv import load_dotenv
 
@@ -82,7 +84,7 @@ from shared.protocol import (
     ConversationCommitReady,
     ToolStreamData, ToolStreamEnd, ToolStreamCancel,
     AgentHopRequest, AgentHopResponse,
-    validate_streaming_metadata,
+    decode_agent_frame, validate_streaming_metadata,
 )
 from astralprims import (
     Text, Card, Alert, Button, Collapsible
@@ -110,6 +112,30 @@ CONNECTION_LEASE_RENEW_SECONDS = 5.0
 # the first durable server phase.
 OPERATION_PROGRESS_PHASE_SECONDS = 1.0
 _CONNECTION_CLAIM_POLL_SECONDS = 0.25
+# Agent discovery sweep: probe every MIN seconds while the agent set is
+# changing, doubling up to MAX while it stays stable. A disconnect wakes the
+# monitor immediately.
+_AGENT_MONITOR_MIN_INTERVAL = 5.0
+_AGENT_MONITOR_MAX_INTERVAL = 60.0
+# Concurrent chat-title summaries. Titles are best-effort side work; bounding
+# them keeps a burst of new chats from filling the worker threads the turn's
+# own completion calls run on.
+_TITLE_SUMMARY_CONCURRENCY = 2
+# _call_llm retry classification: one scan of the error text per class
+# (case-sensitive, matching the substrings it always checked for).
+_LLM_TRANSIENT_ERROR_RE = re.compile(
+    r"502|503|504|Bad Gateway|Service Unavailable|Connection|timeout")
+_LLM_FATAL_ERROR_RE = re.compile(
+    r"424|401|403|Repository Not Found|Invalid username")
+# Upper bound on agent tool calls awaiting a response. A dispatch past it is
+# refused (retryable) instead of parking yet another future for the timeout.
+_MAX_PENDING_REQUESTS = 10_000
+# Per-turn text scans, compiled once: the legacy upload-mapping sentence in a
+# user message, and the markdown heading or table line that promotes a long
+# narrative to a canvas card (030) — one alternation, so one pass over the text.
+_UPLOAD_MAPPING_RE = re.compile(r"I have uploaded (.*?) to the backend at: `(.*?)`")
+_MD_STRUCTURE_RE = re.compile(r"(?m)^(?:#{1,6}\s|\|.+\|\s*$)")
+_MD_HEADING_TITLE_RE = re.compile(r"(?m)^#{1,6}\s+(.+)$")
 LLM_CREDENTIAL_ATTEMPT_TIMEOUT_SECONDS = 10.0
 PERSONAL_AGENT_STARTUP_TIMEOUT_SECONDS = 5.0
 PERSONAL_AGENT_HEARTBEAT_TIMEOUT_SECONDS = 5.0
@@ -166,6 +192,37 @@ _CONNECTION_IDENTITY_FIELDS = frozenset(
     }
 )
 
+# Reserved pseudo-agent ids whose tools are orchestrator meta-tools, mapped to
+# the ``orchestrator`` submodule exposing their ``handle_meta_tool``. One
+# table serves the single and parallel dispatch paths, so both resolve a
+# meta-tool call with a single lookup and can never drift apart.
+_META_TOOL_MODULES = {
+    "__orchestrator__": "agentic_creation",    # 027 create/extend capability
+    "__scheduler__": "scheduling_chat",        # 030 consent card only
+    "__memory__": "memory_chat",               # 030 PHI-gated, no card
+    "__desktop_codegen__": "desktop_codegen",  # 039 verified download card
+    "__subtasks__": "subtasks",                # 056 US4 bounded sub-tasks
+}
+
+# Fixed chat_status frames, serialized once at import. The chat loop sends
+# these several times per turn; only the frames whose message text varies
+# are built per send.
+_CHAT_STATUS_DONE = json.dumps({"type": "chat_status", "status": "done", "message": ""})
+_CHAT_STATUS_PLANNING = json.dumps({
+    "type": "chat_status", "status": "thinking",
+    "message": "Analyzing request and planning actions...",
+})
+_CHAT_STATUS_ANALYZING = json.dumps({
+    "type": "chat_status", "status": "thinking",
+    "message": "Analyzing results and writing the response...",
+})
+_CHAT_STATUS_AFTER_FIX = json.dumps({
+    "type": "chat_status", "status": "thinking", "message": "Continuing after fix...",
+})
+_CHAT_STATUS_CONTINUING = json.dumps({
+    "type": "chat_status", "status": "thinking", "message": "Continuing...",
+})
+
 # The admission wrapper and the application handler execute in the same
 # context.  This lets the existing UI router stay wire-compatible while the
 # normal synchronous-chat path reuses the already-owned operation/fence.
@@ -177,6 +234,39 @@ _WORKSPACE_MUTATION_LOCKS: contextvars.ContextVar[frozenset[str]] = (
 )
 
 
+class _UIClientRegistry:
+    """Connected UI sockets in connect order, with O(1) membership and removal.
+
+    Keeps the ``append``/``remove`` surface the connection handlers (and the
+    in-process drivers) already use. Iteration walks a snapshot, so a fan-out
+    loop that awaits between sends may race a connect/disconnect safely.
+    """
+
+    __slots__ = ("_sockets",)
+
+    def __init__(self) -> None:
+        self._sockets: Dict[Any, None] = {}
+
+    def append(self, websocket) -> None:
+        self._sockets[websocket] = None
+
+    def remove(self, websocket) -> None:
+        try:
+            del self._sockets[websocket]
+        except KeyError:
+            # Same contract as ``list.remove``: callers catch ValueError.
+            raise ValueError("websocket not registered") from None
+
+    def __contains__(self, websocket) -> bool:
+        return websocket in self._sockets
+
+    def __iter__(self):
+        return iter(tuple(self._sockets))
+
+    def __len__(self) -> int:
+        return len(self._sockets)
+
+
 @dataclass
 class _ConnectionIngressFrame:
     """One parsed, post-registration frame awaiting durable admission."""
@@ -574,6 +664,19 @@ def _tag_source(comp, agent_id, tool_name, tool_params=None, correlation_id=None
                 _tag_source(child, agent_id, tool_name, correlation_id=correlation_id)
 
 
+def _tool_call_params(tool_call) -> Any:
+    """A tool call's decoded arguments; ``{}`` when absent or malformed."""
+    raw_args = tool_call.function.arguments
+    if isinstance(raw_args, dict):
+        return raw_args
+    if not raw_args or not isinstance(raw_args, str):
+        return {}
+    try:
+        return json.loads(raw_args)
+    except ValueError:
+        return {}
+
+
 def _sanitize_text_response(content: str) -> str:
     """Strip leaked tool-call tokens from a text response.
 
@@ -795,6 +898,61 @@ def _native_canvas_components(components) -> List[Dict[str, Any]]:
     return out
 
 
+# Combine/condense prompt vocabulary: a one-line legend of numeric type codes
+# instead of per-primitive JSON skeletons. The LLM emits ``t`` (code) in place
+# of ``type``; ``_decode_combine_type_codes`` maps it back after parsing.
+_COMBINE_TYPE_CODES: Dict[int, str] = {
+    1: "text", 2: "card", 3: "metric", 4: "table", 5: "grid",
+    6: "container", 7: "list", 8: "alert", 9: "progress", 10: "bar_chart",
+    11: "line_chart", 12: "pie_chart", 13: "code", 14: "divider",
+    15: "collapsible",
+}
+_COMBINE_SCHEMA = (
+    "UI primitive type codes: "
+    + " ".join(f"{code}={name}" for code, name in _COMBINE_TYPE_CODES.items())
+    + ".\nEmit \"t\": <code> instead of \"type\" on every node. Fields: "
+    "text{content,variant:body|h1|h2|h3|caption|markdown} card{title,content[]} "
+    "metric{title,value,subtitle,progress:0.0-1.0,"
+    "variant:default|warning|error|success} table{title,headers[],rows[][]} "
+    "grid{columns,gap,children[]} container{children[]} "
+    "list{items[],ordered,variant:default|detailed} "
+    "alert{message,title,variant:info|success|warning|error} "
+    "progress{value:0.0-1.0,label,show_percentage} "
+    "bar_chart/line_chart{title,labels[],datasets[{label,data[]}]} "
+    "pie_chart{title,labels[],data[],colors[]} code{code,language} divider{} "
+    "collapsible{title,content[],default_open}."
+)
+
+# Keys whose list values hold child component nodes. Other containers (table
+# rows, chart datasets) are data and are never decoded.
+_COMBINE_CHILD_KEYS = ("children", "content", "items")
+
+
+def _decode_combine_type_codes(node: Any) -> None:
+    """Rename ``t`` → ``type`` in place across a combine result tree.
+
+    Only component nodes are decoded: the roots and the members of their
+    ``children``/``content``/``items`` lists. Data such as a table row with a
+    ``t`` column is left untouched. A node that already carries ``type`` (the
+    model ignored the legend) is left as-is; an unknown code is kept as its
+    string so the tree validator downgrades it like any other unknown type.
+    """
+    stack = list(node) if isinstance(node, list) else [node]
+    while stack:
+        current = stack.pop()
+        if not isinstance(current, dict):
+            continue
+        if "t" in current and "type" not in current:
+            code = current.pop("t")
+            try:
+                current["type"] = _COMBINE_TYPE_CODES.get(int(code), str(code))
+            except (TypeError, ValueError):
+                current["type"] = str(code)
+        for key in _COMBINE_CHILD_KEYS:
+            children = current.get(key)
+            if isinstance(children, list):
+                stack.extend(children)
+
 class PreparedDispatch(NamedTuple):
     """Outcome of ``Orchestrator._authorize_and_prepare`` when every gate
     allows the call (056 US3). Carries the fully prepared arguments (path
@@ -837,10 +995,15 @@ class Orchestrator:
         # in-process path by a positive membership check here; external A2A and
         # draft-subprocess agents are unaffected.
         self.local_agents: Dict[str, Any] = {}
-        self.ui_clients: List[websockets.WebSocketServerProtocol] = []
+        self.ui_clients = _UIClientRegistry()
         self.ui_sessions: Dict[websockets.WebSocketServerProtocol, Dict] = {}
         self.agent_cards: Dict[str, AgentCard] = {}
         self.agent_capabilities: Dict[str, List[Dict]] = {}
+        # (agent_id, LLM-facing name) -> (AgentSkill, tool definition). Chat
+        # turns rebuild the tool list per user, but the definition for a given
+        # skill only changes when its agent re-registers with a new card, so
+        # it is reused while the cached skill is still the live object.
+        self._tool_def_cache: Dict[Tuple[str, str], Tuple[Any, Dict]] = {}
         self.pending_requests: Dict[str, asyncio.Future] = {}
         # request_id -> the agent id the request was DISPATCHED to. Response
         # correlation is keyed on request_id alone, which is safe only while every
@@ -1274,14 +1437,11 @@ class Orchestrator:
             self._tunnel_sockets.pop(key, None)
             if self.agents.get(agent_id) is sock:
                 self.agents.pop(agent_id, None)
-            for other in list(self.ui_clients):
-                if other is ui_ws or self._get_user_id(other) != owner_sub:
-                    continue
-                try:
-                    await self._safe_send(other, json.dumps(
-                        {"type": "agent_offline", "agent_id": agent_id}))
-                except Exception:
-                    logger.debug("agent_offline notify failed", exc_info=True)
+            await self._fan_out(
+                [other for other in list(self.ui_clients)
+                 if other is not ui_ws and self._get_user_id(other) == owner_sub],
+                json.dumps({"type": "agent_offline", "agent_id": agent_id}),
+            )
         if gone:
             logger.info("058: %d user agent(s) offline on UI disconnect (owner=%s)",
                         len(gone), owner_sub)
@@ -3164,6 +3324,7 @@ class Orchestrator:
         ):
             self.agents.pop(agent_id, None)
         self.agent_cards.pop(agent_id, None)
+        self._forget_tool_defs(agent_id)
         sent_runtime_ids: set[str] = set()
         for runtime_id, socket in fenced_sockets:
             fence = socket.runtime_fence
@@ -3508,18 +3669,34 @@ class Orchestrator:
             except Exception:
                 pass
 
+    def _http_session(self) -> aiohttp.ClientSession:
+        """The orchestrator's shared aiohttp session (created on first use).
+
+        Agent discovery probes every port on each monitor sweep; one pooled
+        session keeps those connections alive instead of building a fresh
+        connector per probe. Closed when the server stops.
+        """
+        session = getattr(self, "_http", None)
+        if session is None or session.closed:
+            session = self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100, limit_per_host=10, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=5, connect=2),
+            )
+        return session
+
     async def discover_agent(self, base_url: str):
         """Discover an agent by fetching its A2A agent card and connecting via WebSocket."""
         try:
             # Fetch agent card
             card_url = f"{base_url}/.well-known/agent-card.json"
-            async with aiohttp.ClientSession() as session:
-                async with session.get(card_url, timeout=aiohttp.ClientTimeout(total=5)) as resp:
-                    if resp.status != 200:
-                        # Log as INFO during discovery to avoid noise during startup
-                        logger.info(f"Agent card not ready yet at {card_url} (status: {resp.status})")
-                        return
-                    card_data = await resp.json()
+            async with self._http_session().get(
+                    card_url, timeout=aiohttp.ClientTimeout(total=5)) as resp:
+                if resp.status != 200:
+                    # Log as INFO during discovery to avoid noise during startup
+                    logger.info(f"Agent card not ready yet at {card_url} (status: {resp.status})")
+                    return
+                card_data = await resp.json()
 
             card = AgentCard.from_dict(card_data)
             agent_id = card.agent_id
@@ -3648,8 +3825,12 @@ class Orchestrator:
             if agent_id in self.agent_cards:
                 del self.agent_cards[agent_id]
                 logger.info(f"Agent {agent_id} deregistered")
+            self._forget_tool_defs(agent_id)
             if agent_id in self.security_flags:
                 del self.security_flags[agent_id]
+            self._fail_pending_requests(agent_id)
+            # Re-probe soon: a restarting agent should not wait out the backoff.
+            self._agent_monitor_event().set()
 
     # =========================================================================
     # MESSAGE HANDLING
@@ -3675,7 +3856,7 @@ class Orchestrator:
     async def handle_agent_message(self, websocket, message: str):
         """Handle message from an agent."""
         try:
-            msg = Message.from_json(message)
+            msg = decode_agent_frame(message)
 
             if isinstance(msg, RegisterAgent):
                 await self.register_agent(websocket, msg)
@@ -6089,7 +6270,13 @@ class Orchestrator:
                 return
             invalid_host_field: str | None = None
             try:
-                msg = Message.from_json(message)
+                # The frame was already decoded above; materialize the typed
+                # message from that dict instead of parsing the text again.
+                msg = (
+                    Message.from_dict(raw_frame)
+                    if raw_frame is not None
+                    else Message.from_json(message)
+                )
             except ProtocolValidationError:
                 # Authenticate/register the UI normally, but refuse only its
                 # malformed optional host capability with the exact safe v2
@@ -6107,7 +6294,7 @@ class Orchestrator:
                 sanitized = dict(raw_frame)
                 sanitized["agent_host"] = False
                 sanitized.pop("host_session_id", None)
-                msg = Message.from_json(json.dumps(sanitized))
+                msg = Message.from_dict(sanitized)
 
             if isinstance(msg, RegisterUI):
                 token = msg.token
@@ -6986,7 +7173,8 @@ class Orchestrator:
                         ])
 
                 elif msg.action == "new_chat":
-                    chat_id = self.history.create_chat(user_id=user_id)
+                    chat_id = await asyncio.to_thread(
+                        self.history.create_chat, user_id=user_id)
                     await self._safe_send(websocket, json.dumps({
                         "type": "chat_created",
                         "payload": {"chat_id": chat_id, "from_message": False}
@@ -7069,7 +7257,7 @@ class Orchestrator:
                                 "component_data": component_data,
                                 "component_type": component_type,
                                 "title": title or component_type.replace('_', ' ').title(),
-                                "created_at": int(time.time() * 1000)
+                                "created_at": time.time_ns() // 1_000_000
                             }
                         }))
                         
@@ -7085,7 +7273,8 @@ class Orchestrator:
 
                 elif msg.action == "get_saved_components":
                     chat_id = msg.payload.get("chat_id")
-                    components = self.history.get_saved_components(chat_id, user_id=user_id)
+                    components = await asyncio.to_thread(
+                        self.history.get_saved_components, chat_id, user_id=user_id)
                     await self._safe_send(websocket, json.dumps({
                         "type": "saved_components_list",
                         "components": components
@@ -7167,8 +7356,12 @@ class Orchestrator:
                         }))
                         return
                     
-                    source = self.history.get_component_by_id(source_id, user_id=user_id)
-                    target = self.history.get_component_by_id(target_id, user_id=user_id)
+                    source, target = await asyncio.gather(
+                        asyncio.to_thread(
+                            self.history.get_component_by_id, source_id, user_id=user_id),
+                        asyncio.to_thread(
+                            self.history.get_component_by_id, target_id, user_id=user_id),
+                    )
                     
                     if not source or not target:
                         await self._safe_send(websocket, json.dumps({
@@ -7527,9 +7720,7 @@ class Orchestrator:
                         await self.send_ui_render(websocket, [
                             Alert(message="Missing tool_name or agent_id for pagination", variant="error").to_dict()
                         ])
-                        await self._safe_send(websocket, json.dumps({
-                            "type": "chat_status", "status": "done", "message": ""
-                        }))
+                        await self._safe_send(websocket, _CHAT_STATUS_DONE)
                         return
 
                     # Inject per-user credentials (E2E encrypted — only agent can decrypt)
@@ -7554,9 +7745,7 @@ class Orchestrator:
                             Alert(message=f"Pagination failed: {e}", variant="error").to_dict()
                         ])
                     finally:
-                        await self._safe_send(websocket, json.dumps({
-                            "type": "chat_status", "status": "done", "message": ""
-                        }))
+                        await self._safe_send(websocket, _CHAT_STATUS_DONE)
 
                 # --- Live Streaming ---
                 elif msg.action == "stream_subscribe":
@@ -7776,7 +7965,7 @@ class Orchestrator:
                         or row.get("title")
                         or component_type.replace("_", " ").title()
                     ),
-                    "created_at": row.get("created_at") or int(time.time() * 1000),
+                    "created_at": row.get("created_at") or time.time_ns() // 1_000_000,
                 }
             )
         return source_ids, rows, ops
@@ -7811,22 +8000,7 @@ class Orchestrator:
         
         components_text = "\n\n".join(component_descriptions)
 
-        schema_description = """Available UI primitive types and their JSON structure:
-- "text": {type: "text", content: "...", variant: "body|h1|h2|h3|caption|markdown"}
-- "card": {type: "card", title: "...", content: [...child components...]}
-- "metric": {type: "metric", title: "...", value: "...", subtitle: "...", progress: 0.0-1.0, variant: "default|warning|error|success"}
-- "table": {type: "table", title: "...", headers: [...], rows: [[...],...]}
-- "grid": {type: "grid", columns: 2, gap: 16, children: [...child components...]}
-- "container": {type: "container", children: [...child components...]}
-- "list": {type: "list", items: [...], ordered: false, variant: "default|detailed"}
-- "alert": {type: "alert", message: "...", title: "...", variant: "info|success|warning|error"}
-- "progress": {type: "progress", value: 0.0-1.0, label: "...", show_percentage: true}
-- "bar_chart": {type: "bar_chart", title: "...", labels: [...], datasets: [{label: "...", data: [...]}]}
-- "line_chart": {type: "line_chart", title: "...", labels: [...], datasets: [{label: "...", data: [...]}]}
-- "pie_chart": {type: "pie_chart", title: "...", labels: [...], data: [...], colors: [...]}
-- "code": {type: "code", code: "...", language: "..."}
-- "divider": {type: "divider"}
-- "collapsible": {type: "collapsible", title: "...", content: [...child components...], default_open: false}"""
+        schema_description = _COMBINE_SCHEMA
 
         if mode == "combine":
             prompt = f"""You are a UI component combiner. You are given 2 UI components and must merge them into a single cohesive component.
@@ -7929,6 +8103,9 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
             
             if "components" not in result or not isinstance(result["components"], list):
                 return {"error": "LLM response missing 'components' array"}
+            _decode_combine_type_codes(
+                [comp.get("component_data") for comp in result["components"]
+                 if isinstance(comp, dict)])
             
             # Feature 029 (FR-020): the renderer registry is the single
             # source of truth for valid types — hand-copied whitelists
@@ -8611,6 +8788,11 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
         binding = getattr(self, "_conversation_scopes", {}).get(id(websocket))
         if binding is None:
             return data
+        # Every scoped frame type is ``ui_*``, so its serialized text contains
+        # '"ui_'. Status, heartbeat and snapshot frames skip the full decode
+        # this per-send pass would otherwise spend on them.
+        if isinstance(data, str) and '"ui_' not in data:
+            return data
         try:
             frame = json.loads(data)
         except (TypeError, json.JSONDecodeError):
@@ -9164,15 +9346,10 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
         except Exception:  # pragma: no cover - defensive
             logger.debug("notify_user: unserializable payload", exc_info=True)
             return
-        sent = 0
-        for ws in list(self.ui_clients):
-            try:
-                if self._get_user_id(ws) != user_id:
-                    continue
-                if await self._safe_send(ws, data):
-                    sent += 1
-            except Exception:  # pragma: no cover - per-socket best-effort
-                logger.debug("notify_user: send failed for one socket", exc_info=True)
+        sent = await self._fan_out(
+            [ws for ws in list(self.ui_clients) if self._get_user_id(ws) == user_id],
+            data,
+        )
         logger.info(
             "notify_user.delivered",
             extra={"user_id": user_id, "sockets": sent, "kind": payload.get("type")},
@@ -9188,22 +9365,35 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
             logger.debug("_send_to_user_sockets: unserializable frame", exc_info=True)
             return 0
         from orchestrator.async_tasks import VirtualWebSocket
-        sent = 0
-        for ws, claims in list(self.ui_sessions.items()):
-            if (claims or {}).get("sub") != user_id:
-                continue
-            # A background turn's own VirtualWebSocket sits in ui_sessions for
-            # the turn's lifetime — "delivering" to it would count as a
-            # notified device and silently skip the register_ui catch-up
-            # replay for users with no real socket connected.
-            if isinstance(ws, VirtualWebSocket):
-                continue
-            try:
-                if await self._safe_send(ws, data):
-                    sent += 1
-            except Exception:  # pragma: no cover - per-socket best-effort
-                logger.debug("_send_to_user_sockets: send failed", exc_info=True)
-        return sent
+        # A background turn's own VirtualWebSocket sits in ui_sessions for
+        # the turn's lifetime — "delivering" to it would count as a
+        # notified device and silently skip the register_ui catch-up
+        # replay for users with no real socket connected.
+        return await self._fan_out(
+            [ws for ws, claims in list(self.ui_sessions.items())
+             if (claims or {}).get("sub") == user_id
+             and not isinstance(ws, VirtualWebSocket)],
+            data,
+        )
+
+    async def _fan_out(self, targets: List[Any], data: str) -> int:
+        """Send one pre-serialized frame to many sockets concurrently.
+
+        ``websockets.broadcast`` does not fit here: UI sockets are mostly
+        FastAPI ``WebSocket`` objects, and ``_safe_send`` applies per-socket
+        conversation scoping. Serializing once and gathering the sends keeps
+        one slow socket from delaying the rest. Returns the number reached.
+        """
+        if not targets:
+            return 0
+        results = await asyncio.gather(
+            *(self._safe_send(ws, data) for ws in targets),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):  # pragma: no cover - best-effort
+                logger.debug("fan-out send failed", exc_info=result)
+        return sum(1 for result in results if result is True)
 
     async def _fan_task_completed(self, bg_task, frame: Dict[str, Any]) -> int:
         """BackgroundTaskManager completion hook (055 bg-continuity): the
@@ -9727,11 +9917,7 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
             return
 
         # Send loading state to UI
-        await self._safe_send(websocket, json.dumps({
-            "type": "chat_status",
-            "status": "thinking",
-            "message": "Analyzing request and planning actions..."
-        }))
+        await self._safe_send(websocket, _CHAT_STATUS_PLANNING)
         
         # Save User Message to History. If display_message is provided, save that instead.
         msg_to_save = display_message if display_message else message
@@ -9786,7 +9972,7 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
             }))
 
         # Capture File Upload Mapping
-        upload_match = re.search(r"I have uploaded (.*?) to the backend at: `(.*?)`" , message)
+        upload_match = _UPLOAD_MAPPING_RE.search(message)
         if upload_match:
             original_name = upload_match.group(1)
             backend_path = upload_match.group(2)
@@ -9961,27 +10147,42 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
             )
 
         # Phase C: emit one tool definition per eligible pair, qualifying
-        # the LLM-facing name when there's a collision.
-        for agent_id, skill in eligible:
+        # the LLM-facing name when there's a collision. Emitted in LLM-name
+        # order rather than agent registration order: the tool schema rides
+        # in the request prefix, so a deterministic order keeps it
+        # byte-identical across turns, chats and agent reconnects and lets the
+        # provider's automatic prefix cache hit.
+        def _llm_name_of(pair):
+            """LLM-facing name for an eligible (agent_id, skill) pair."""
+            agent_id, skill = pair
             if skill.id in colliding_skill_ids:
-                # OpenAI function-name grammar is [a-zA-Z0-9_-]{1,64}; our
-                # agent_ids use hyphens, our skill ids use underscores,
-                # and "__" appears in neither — so it's a safe separator.
-                llm_name = f"{agent_id}__{skill.id}"
-                desc = f"[Provider: {agent_id}] {skill.description or ''}"
+                return f"{agent_id}__{skill.id}"
+            return skill.id
+
+        for agent_id, skill in sorted(eligible, key=_llm_name_of):
+            llm_name = _llm_name_of((agent_id, skill))
+            cached = self._tool_def_cache.get((agent_id, llm_name))
+            if cached is not None and cached[0] is skill:
+                tool_def = cached[1]
             else:
-                llm_name = skill.id
-                desc = skill.description
-
-            schema = self._sanitize_tool_schema(skill.input_schema or {"type": "object", "properties": {}})
-            tool_def = {
-                "type": "function",
-                "function": {
-                    "name": llm_name,
-                    "description": desc,
-                    "parameters": schema
+                if skill.id in colliding_skill_ids:
+                    # OpenAI function-name grammar is [a-zA-Z0-9_-]{1,64}; our
+                    # agent_ids use hyphens, our skill ids use underscores,
+                    # and "__" appears in neither — so it's a safe separator.
+                    desc = f"[Provider: {agent_id}] {skill.description or ''}"
+                else:
+                    desc = skill.description
+
+                schema = self._sanitize_tool_schema(skill.input_schema or {"type": "object", "properties": {}})
+                tool_def = {
+                    "type": "function",
+                    "function": {
+                        "name": llm_name,
+                        "description": desc,
+                        "parameters": schema
+                    }
                 }
-            }
+                self._tool_def_cache[(agent_id, llm_name)] = (skill, tool_def)
             tools_desc.append(tool_def)
             tool_to_agent[llm_name] = agent_id
             tool_to_unqualified[llm_name] = skill.id
@@ -10376,11 +10577,7 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
                             ).to_dict()
                         ],
                     )
-                    await self._safe_send(websocket, json.dumps({
-                        "type": "chat_status",
-                        "status": "done",
-                        "message": ""
-                    }))
+                    await self._safe_send(websocket, _CHAT_STATUS_DONE)
                     return
 
                 turn_count += 1
@@ -10463,11 +10660,7 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
                     task_terminal_on_exit = TaskState.FAILED
                     task_error_on_exit = "LLM returned no response"
                     logger.error("LLM returned None, stopping loop.")
-                    await self._safe_send(websocket, json.dumps({
-                        "type": "chat_status",
-                        "status": "done",
-                        "message": ""
-                    }))
+                    await self._safe_send(websocket, _CHAT_STATUS_DONE)
                     await self.send_ui_render(websocket, [
                         Alert(message="Failed to get a response from the AI model. Please try again.", variant="error").to_dict()
                     ])
@@ -10546,14 +10739,13 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
                     # success trace for skill induction (C-N10). No-op when off.
                     _turn_tools = [tc.function.name for tc in llm_msg.tool_calls]
                     _tools_used += len(_turn_tools)
+                    # Each call's arguments are decoded once for the round and
+                    # shared by the success trace and the components' source tags.
+                    _round_args = [_tool_call_params(tc) for tc in llm_msg.tool_calls]
                     for _i, _tc in enumerate(llm_msg.tool_calls):
                         _r = tool_results[_i] if _i < len(tool_results) else None
                         if _r is not None and not getattr(_r, "error", None):
-                            try:
-                                _ta = json.loads(_tc.function.arguments) if _tc.function.arguments else {}
-                            except Exception:
-                                _ta = {}
-                            _tool_trace.append({"tool": _tc.function.name, "args": _ta})
+                            _tool_trace.append({"tool": _tc.function.name, "args": _round_args[_i]})
                             # MAS payload defense (C-S14): scan the agent's output
                             # for injection markers; log findings. No-op when off.
                             _findings = turn_hooks.scan_payload(
@@ -10580,16 +10772,7 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
                             tc = llm_msg.tool_calls[i_tc] if i_tc < len(llm_msg.tool_calls) else None
                             t_name = tc.function.name if tc else ""
                             a_id = tool_to_agent.get(t_name, "")
-                            t_params: Dict[str, Any] = {}
-                            if tc is not None:
-                                try:
-                                    raw_args = tc.function.arguments
-                                    if isinstance(raw_args, str):
-                                        t_params = json.loads(raw_args) if raw_args else {}
-                                    elif isinstance(raw_args, dict):
-                                        t_params = raw_args
-                                except (ValueError, TypeError):
-                                    t_params = {}
+                            t_params = _round_args[i_tc] if tc is not None else {}
                             corr_id = getattr(res, "correlation_id", None)
                             for comp in res.ui_components:
                                 _tag_source(comp, a_id, t_name, tool_params=t_params, correlation_id=corr_id)
@@ -10629,18 +10812,39 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
                     # LLM-visible text is the two-tier digest (a tool's
                     # `_model_digest` wins; else the existing `_data`/full-result
                     # serialization) — see _tool_result_to_llm_content.
-                    for i, tc in enumerate(llm_msg.tool_calls):
-                        res = tool_results[i] if i < len(tool_results) else None
+                    clip_on = flags.is_enabled("context_engineering")
+
+                    def _encode_tool_content(res):
+                        """Serialize (and spotlight) one tool result for the LLM."""
                         tool_content = self._tool_result_to_llm_content(res)
+                        has_digest = self._result_has_model_digest(res)
+                        # Context engineering: an oversized raw result is cut
+                        # to an outline + head so it cannot dominate every
+                        # later turn's prefill. A digest is already the
+                        # tool's own model-sized summary.
+                        if clip_on and not has_digest:
+                            tool_content = context_engineering.clip_tool_output(tool_content)
                         # Spotlight untrusted tool output. A tool's own
                         # `_model_digest` is tool-authored and trusted; only
                         # raw, non-digest output is wrapped as untrusted data
                         # the model must not obey.
-                        if datamark_on and not self._result_has_model_digest(res):
+                        if datamark_on and not has_digest:
                             tool_content = datamarking.spotlight(
                                 tool_content, turn_sentinel,
                                 sanitize=self._datamark_sanitize_spans,
                             )
+                        return tool_content
+
+                    # Large tool payloads make the encode/sanitize pass CPU
+                    # work, so it runs off the event loop, one thread per
+                    # result, instead of stalling every other socket.
+                    tool_contents = await asyncio.gather(*[
+                        asyncio.to_thread(
+                            _encode_tool_content,
+                            tool_results[i] if i < len(tool_results) else None)
+                        for i in range(len(llm_msg.tool_calls))
+                    ])
+                    for tc, tool_content in zip(llm_msg.tool_calls, tool_contents):
                         messages.append({
                             "role": "tool",
                             "tool_call_id": tc.id,
@@ -10672,11 +10876,7 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
                             # 055 US1: this break used to exit the loop without
                             # a terminal chat_status, leaving client loading
                             # states (skeletons) stuck until disconnect.
-                            await self._safe_send(websocket, json.dumps({
-                                "type": "chat_status",
-                                "status": "done",
-                                "message": ""
-                            }))
+                            await self._safe_send(websocket, _CHAT_STATUS_DONE)
                             break
 
                     # Update task state and track tool calls
@@ -10690,11 +10890,7 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
                     # Loop continues to next turn to let LLM analyze results.
                     # (030: name the writing phase — the walkthrough measured
                     # up to 124 s behind the old static "Analyzing results...")
-                    await self._safe_send(websocket, json.dumps({
-                        "type": "chat_status",
-                        "status": "thinking",
-                        "message": "Analyzing results and writing the response..."
-                    }))
+                    await self._safe_send(websocket, _CHAT_STATUS_ANALYZING)
                 
                 else:
                     # No tool calls -> Final Response
@@ -11361,7 +11557,7 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
         Only retries on transient errors (502, 503, 504). Fails fast on
         non-transient errors like 424 (model not found) or 401 (auth).
 
-        Optional enhancement params, both probe-and-fallback so a plainer
+        Optional enhancement params, all probe-and-fallback so a plainer
         OpenAI-compatible endpoint is never broken by them:
 
         * ``response_format`` (enforced structured output): a
@@ -11370,8 +11566,10 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
         * ``reasoning_effort`` (reasoning-budget knob): ``"minimal"`` /
           ``"low"`` / ``"medium"`` / ``"high"``; falls back to the
           ``LLM_REASONING_EFFORT`` global default when the caller passes None.
+        * ``prompt_cache_key`` (prefix-cache routing): the chat id, sent on
+          the chat loop's route calls when ``FF_CONTEXT_ENGINEERING`` is on.
 
-        If the endpoint rejects either param (400 / unsupported / unknown
+        If the endpoint rejects any of these params (400 / unsupported / unknown
         keyword), it is recorded as unsupported for this (base_url, model) and
         the call is retried without it — the request still succeeds, just
         without the enhancement. Subsequent calls skip the rejected param
@@ -11416,6 +11614,15 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
             extra_kwargs["response_format"] = response_format
         if effort is not None and "reasoning_effort" not in unsupported:
             extra_kwargs["reasoning_effort"] = effort
+        # Cache-routing hint for the chat loop's route calls (the same
+        # ``_NARRATIVE_STREAM_CHAT`` opt-in as streaming): every Re-Act turn of
+        # a chat re-sends the same system prompt + tool schema + history and
+        # only appends, so keying on the chat keeps those calls on the
+        # provider's warm prefix cache. Probe-and-fallback like the others.
+        _cache_chat = _NARRATIVE_STREAM_CHAT.get()
+        if (_cache_chat and flags.is_enabled("context_engineering")
+                and "prompt_cache_key" not in unsupported):
+            extra_kwargs["prompt_cache_key"] = f"chat:{_cache_chat}"
         # Device-capability-aware model router. Cheap-first — pick the cheapest
         # tier that fits this task, capped by the connecting device; a
         # low-confidence response escalates one tier (below). Flag-gated
@@ -11563,8 +11770,8 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
                     attempt -= 1
                     continue
 
-                is_transient = any(code in error_str for code in ["502", "503", "504", "Bad Gateway", "Service Unavailable", "Connection", "timeout"])
-                is_fatal = any(code in error_str for code in ["424", "401", "403", "Repository Not Found", "Invalid username"])
+                is_transient = _LLM_TRANSIENT_ERROR_RE.search(error_str) is not None
+                is_fatal = _LLM_FATAL_ERROR_RE.search(error_str) is not None
 
                 logger.warning(f"LLM Attempt {attempt}/{self.MAX_RETRIES} failed: {e}")
 
@@ -11964,8 +12171,12 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
         2. ``_data`` — the existing convention; serialized as today.
         3. otherwise the whole result is serialized — unchanged behavior.
 
-        Defaulting to (2)/(3) keeps every current tool byte-identical; the
-        digest tier is purely opt-in for a tool that sets ``_model_digest``.
+        Defaulting to (2)/(3) keeps every current tool's content unchanged:
+        an agent response carries the agent's own JSON text for these slices,
+        which is reused as-is (same data, though its whitespace and escaping
+        are the agent's, not ``json.dumps``'s); otherwise the slice is
+        serialized here. The digest tier is purely opt-in for a tool that
+        sets ``_model_digest``.
         """
         if res is None:
             return "No output"
@@ -11977,9 +12188,14 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
         if isinstance(result, dict) and result.get("_model_digest") is not None:
             digest = result["_model_digest"]
             return digest if isinstance(digest, str) else json.dumps(digest)
+        # An agent response decoded by ``decode_agent_frame`` still carries
+        # the agent's own JSON text for these slices — reuse it instead of
+        # re-encoding the dict that was just decoded from it.
         if isinstance(result, dict) and "_data" in result:
-            return json.dumps(result["_data"])
-        return json.dumps(result)
+            raw = getattr(res, "raw_data_json", None)
+            return raw if raw is not None else json.dumps(result["_data"])
+        raw = getattr(res, "raw_result_json", None)
+        return raw if raw is not None else json.dumps(result)
 
     @staticmethod
     def _result_has_model_digest(res) -> bool:
@@ -12877,6 +13093,36 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
             hop_correlation_id=hop_correlation_id,
         )
 
+    def _meta_tool_call(self, agent_id, tool_name, args, tool_to_agent,
+                        tool_to_unqualified, *, user_id, chat_id, websocket):
+        """Coroutine for a meta-tool call, or None when ``agent_id`` is not
+        one of the reserved pseudo-agents in ``_META_TOOL_MODULES``.
+
+        Meta-tools dispatch before the agent gates (the pseudo-agent has no
+        scopes/credentials; ownership and approval gates live inside each
+        handler — contracts/agentic-creation.md). The exemption is keyed on
+        the reserved ids only, so a real agent (or a chained hop) can never
+        reach a meta-tool handler.
+        """
+        module_name = _META_TOOL_MODULES.get(agent_id)
+        if module_name is None:
+            return None
+        if agent_id == "__subtasks__":
+            # A sub-task may use only the tools THIS turn offered (never a
+            # superset — FR-020). Sub-task tool-scoping filters by UNQUALIFIED
+            # skill id (handle_chat_message: ``skill.id not in
+            # selected_tools``), so ``_parent_tools`` carries unqualified ids,
+            # not the qualified LLM names (``forecaster-1__submit_dataset``).
+            args["_parent_tools"] = sorted(
+                {t for t in (tool_to_unqualified or {}).values()
+                 if not str(tool_to_agent.get(t, "")).startswith("__")}
+                or {t for t, a in (tool_to_agent or {}).items()
+                    if not str(a).startswith("__")})
+        module = importlib.import_module(f"orchestrator.{module_name}")
+        return module.handle_meta_tool(
+            self, tool_name, args, user_id=user_id, chat_id=chat_id,
+            websocket=websocket)
+
     async def execute_single_tool(self, websocket, tool_call, tool_to_agent: Dict, chat_id: str = None, user_id: str = None, tool_to_unqualified: Optional[Dict[str, str]] = None, parent_token: Optional[Dict[str, Any]] = None, initiating_agent_id: Optional[str] = None) -> Optional[MCPResponse]:
         """Execute a single tool call and render its UI components. Returns the Result object.
 
@@ -12936,45 +13182,11 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
                 llm_tool_name = matches[0]
                 tool_name = (tool_to_unqualified or {}).get(llm_tool_name, tool_name)
                 agent_id = tool_to_agent.get(llm_tool_name)
-        if agent_id == "__orchestrator__":
-            from orchestrator import agentic_creation
-            return await agentic_creation.handle_meta_tool(
-                self, tool_name, args, user_id=user_id, chat_id=chat_id, websocket=websocket
-            )
-        if agent_id == "__scheduler__":
-            # Feature 030 — scheduling meta-tool: validation + consent card
-            # only; creation happens in the schedule_decision ui_event.
-            from orchestrator import scheduling_chat
-            return await scheduling_chat.handle_meta_tool(
-                self, tool_name, args, user_id=user_id, chat_id=chat_id, websocket=websocket
-            )
-        if agent_id == "__memory__":
-            # 030 — memory meta-tools: execute immediately (PHI-gated), no card.
-            from orchestrator import memory_chat
-            return await memory_chat.handle_meta_tool(
-                self, tool_name, args, user_id=user_id, chat_id=chat_id, websocket=websocket
-            )
-        if agent_id == "__desktop_codegen__":
-            # 039 — desktop codegen: surface the generated code + a verified
-            # download card for the Windows coding-agent .exe.
-            from orchestrator import desktop_codegen
-            return await desktop_codegen.handle_meta_tool(
-                self, tool_name, args, user_id=user_id, chat_id=chat_id, websocket=websocket
-            )
-        if agent_id == "__subtasks__":
-            # 056 US4 — planner decomposition into bounded isolated sub-tasks.
-            # A sub-task may use only the tools THIS turn offered (never a
-            # superset — FR-020); the handler's own gates and the sub-turns'
-            # full gate stacks do the rest.
-            from orchestrator import subtasks as _st
-            args["_parent_tools"] = sorted(
-                {t for t in (tool_to_unqualified or {}).values()
-                 if not str(tool_to_agent.get(t, "")).startswith("__")}
-                or {t for t, a in (tool_to_agent or {}).items()
-                    if not str(a).startswith("__")})
-            return await _st.handle_meta_tool(
-                self, tool_name, args, user_id=user_id, chat_id=chat_id, websocket=websocket
-            )
+        meta_call = self._meta_tool_call(
+            agent_id, tool_name, args, tool_to_agent, tool_to_unqualified,
+            user_id=user_id, chat_id=chat_id, websocket=websocket)
+        if meta_call is not None:
+            return await meta_call
 
         # 056 US3 (FR-017): the FULL gate stack runs in the shared authorizer
         # so single, parallel, and chained dispatch refuse identically. Gate
@@ -13113,16 +13325,10 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
                         await self.send_ui_render(websocket, [
                             Alert(message=f"Auto-fix applied for '{tool_name}'. Agent restarted — try again.", variant="info").to_dict()
                         ])
-                    await self._safe_send(websocket, json.dumps({
-                        "type": "chat_status", "status": "thinking",
-                        "message": "Continuing after fix..."
-                    }))
+                    await self._safe_send(websocket, _CHAT_STATUS_AFTER_FIX)
                 except Exception as e:
                     logger.warning(f"Auto-fix failed for {agent_id}: {e}")
-                    await self._safe_send(websocket, json.dumps({
-                        "type": "chat_status", "status": "thinking",
-                        "message": "Continuing..."
-                    }))
+                    await self._safe_send(websocket, _CHAT_STATUS_CONTINUING)
 
         return result
 
@@ -13658,52 +13864,11 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
             # T008/FR-018 — previously only __orchestrator__ worked here). The
             # exemption stays limited to these reserved ids; real-agent calls
             # (and therefore chained hops) can never reach a meta-tool handler.
-            if agent_id == "__orchestrator__":
-                from orchestrator import agentic_creation
-                prepared.append((idx, tc, tool_name, agent_id, None,
-                                 agentic_creation.handle_meta_tool(
-                                     self, tool_name, args, user_id=user_id,
-                                     chat_id=chat_id, websocket=websocket)))
-                continue
-            if agent_id == "__scheduler__":
-                from orchestrator import scheduling_chat
-                prepared.append((idx, tc, tool_name, agent_id, None,
-                                 scheduling_chat.handle_meta_tool(
-                                     self, tool_name, args, user_id=user_id,
-                                     chat_id=chat_id, websocket=websocket)))
-                continue
-            if agent_id == "__memory__":
-                from orchestrator import memory_chat
-                prepared.append((idx, tc, tool_name, agent_id, None,
-                                 memory_chat.handle_meta_tool(
-                                     self, tool_name, args, user_id=user_id,
-                                     chat_id=chat_id, websocket=websocket)))
-                continue
-            if agent_id == "__desktop_codegen__":
-                from orchestrator import desktop_codegen
-                prepared.append((idx, tc, tool_name, agent_id, None,
-                                 desktop_codegen.handle_meta_tool(
-                                     self, tool_name, args, user_id=user_id,
-                                     chat_id=chat_id, websocket=websocket)))
-                continue
-            if agent_id == "__subtasks__":
-                from orchestrator import subtasks as _st
-                # Sub-task tool-scoping filters by UNQUALIFIED skill id
-                # (handle_chat_message: ``skill.id not in selected_tools``), so
-                # ``_parent_tools`` must carry unqualified ids — identical to
-                # the single-tool path. Passing the qualified LLM names
-                # (``tool_to_agent`` keys like ``forecaster-1__submit_dataset``)
-                # made every collision-qualified tool silently unmatched and
-                # dropped from the sub-task's allow-list.
-                args["_parent_tools"] = sorted(
-                    {t for t in (tool_to_unqualified or {}).values()
-                     if not str(tool_to_agent.get(t, "")).startswith("__")}
-                    or {t for t, a in (tool_to_agent or {}).items()
-                        if not str(a).startswith("__")})
-                prepared.append((idx, tc, tool_name, agent_id, None,
-                                 _st.handle_meta_tool(
-                                     self, tool_name, args, user_id=user_id,
-                                     chat_id=chat_id, websocket=websocket)))
+            meta_call = self._meta_tool_call(
+                agent_id, tool_name, args, tool_to_agent, tool_to_unqualified,
+                user_id=user_id, chat_id=chat_id, websocket=websocket)
+            if meta_call is not None:
+                prepared.append((idx, tc, tool_name, agent_id, None, meta_call))
                 continue
 
             # 056 US3 (T007/FR-017): the FULL single-path gate stack via the
@@ -13758,18 +13923,56 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
         for idx, coro in error_items:
             results_by_idx[idx] = await coro
 
-        # Execute parallel-safe tools concurrently (capped)
-        if parallel_items:
-            sem = asyncio.Semaphore(self._MAX_PARALLEL_CONCURRENCY)
-            async def _sem_wrap(coro):
-                async with sem:
-                    return await coro
-            par_results = await asyncio.gather(
-                *[_sem_wrap(coro) for _, _, coro in parallel_items],
-                return_exceptions=True
-            )
-            for (idx, _, _), res in zip(parallel_items, par_results):
-                results_by_idx[idx] = res
+        # Execute parallel-safe tools concurrently (capped). A lone call is
+        # awaited in place and a wave within the cap skips the semaphore
+        # wrapper — both only add scheduling hops when nothing can contend.
+        if len(parallel_items) == 1:
+            idx, _, coro = parallel_items[0]
+            try:
+                results_by_idx[idx] = await coro
+            except Exception as e:
+                results_by_idx[idx] = e
+        elif parallel_items:
+            coros = [coro for _, _, coro in parallel_items]
+            if len(coros) > self._MAX_PARALLEL_CONCURRENCY:
+                sem = asyncio.Semaphore(self._MAX_PARALLEL_CONCURRENCY)
+                async def _sem_wrap(coro):
+                    async with sem:
+                        return await coro
+                coros = [_sem_wrap(coro) for coro in coros]
+            # Collect results as they finish rather than all at once, so the
+            # status line can narrow to the calls still running while a slow
+            # tool holds the wave open. Components are still delivered as one
+            # batch by the caller (the adaptive designer arranges the round).
+            task_slots = {asyncio.ensure_future(coro): (idx, name)
+                          for (idx, name, _), coro in zip(parallel_items, coros)}
+            pending = set(task_slots)
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        idx = task_slots[task][0]
+                        if task.cancelled():
+                            results_by_idx[idx] = asyncio.CancelledError()
+                        else:
+                            results_by_idx[idx] = task.exception() or task.result()
+                    if pending:
+                        still_running = sorted(task_slots[t][1] for t in pending)
+                        await self._safe_send(websocket, json.dumps({
+                            "type": "chat_status",
+                            "status": "executing",
+                            "message": (
+                                f"Running: {', '.join(still_running)}... "
+                                f"({len(task_slots) - len(pending)}/{len(task_slots)} done)"),
+                        }))
+            finally:
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    # Reap the cancelled calls so their outcomes are retrieved
+                    # (no "Task exception was never retrieved" at GC).
+                    await asyncio.gather(*pending, return_exceptions=True)
 
         # Execute serial (write/system) tools one at a time
         for idx, tool_name, agent_id, args in serial_items:
@@ -13846,16 +14049,10 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
                             await self.send_ui_render(websocket, [
                                 Alert(message=f"Auto-fix applied for '{t_name}'. Agent restarted — try again.", variant="info").to_dict()
                             ])
-                            await self._safe_send(websocket, json.dumps({
-                                "type": "chat_status", "status": "thinking",
-                                "message": "Continuing after fix..."
-                            }))
+                            await self._safe_send(websocket, _CHAT_STATUS_AFTER_FIX)
                         except Exception as e:
                             logger.warning(f"Auto-fix failed for {a_id}: {e}")
-                            await self._safe_send(websocket, json.dumps({
-                                "type": "chat_status", "status": "thinking",
-                                "message": "Continuing..."
-                            }))
+                            await self._safe_send(websocket, _CHAT_STATUS_CONTINUING)
 
         return final_results
 
@@ -14063,6 +14260,11 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
         # authority from ``_dispatch_context`` (confused-deputy). uuid4 is
         # os.urandom-backed, so neither collision nor guessing is feasible.
         request_id = f"req_{tool_name}_{_uuid.uuid4().hex}"
+        if len(self.pending_requests) >= _MAX_PENDING_REQUESTS:
+            logger.error("Refusing tool call %s: %d calls already in flight",
+                         tool_name, len(self.pending_requests))
+            return MCPResponse(request_id=request_id, error={
+                "message": "Too many tool calls in flight", "retryable": True})
 
         request = MCPRequest(
             request_id=request_id,
@@ -14288,6 +14490,11 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
         # ``_dispatch_context``, the record a mediated hop resolves authority
         # from, so it must be neither collidable nor guessable.
         request_id = f"req_{tool_name}_{_uuid.uuid4().hex}"
+        if len(self.pending_requests) >= _MAX_PENDING_REQUESTS:
+            logger.error("Refusing tool call %s: %d calls already in flight",
+                         tool_name, len(self.pending_requests))
+            return MCPResponse(request_id=request_id, error={
+                "message": "Too many tool calls in flight", "retryable": True})
         # Private copy so in-agent credential decryption never writes plaintext
         # back into the caller's args dict (callers may retain/audit it).
         call_args = copy.deepcopy(args)
@@ -15824,9 +16031,7 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
                 Alert(message=f"The action failed: {e}", variant="error").to_dict()
             ], target="chat")
         finally:
-            await self._safe_send(websocket, json.dumps({
-                "type": "chat_status", "status": "done", "message": ""
-            }))
+            await self._safe_send(websocket, _CHAT_STATUS_DONE)
 
     async def _refine_restore_gate(self, websocket, user_id: str,
                                    payload: Dict[str, Any]):
@@ -15995,9 +16200,7 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
                 Alert(message=f"The refine failed: {e}", variant="error").to_dict()
             ], target="chat")
         finally:
-            await self._safe_send(websocket, json.dumps({
-                "type": "chat_status", "status": "done", "message": ""
-            }))
+            await self._safe_send(websocket, _CHAT_STATUS_DONE)
 
     async def _handle_component_restore(self, websocket, user_id: str, payload: Dict[str, Any]):
         """055 US4 (FR-024): restore an archived component_version under the
@@ -16056,9 +16259,7 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
                 Alert(message=f"The restore failed: {e}", variant="error").to_dict()
             ], target="chat")
         finally:
-            await self._safe_send(websocket, json.dumps({
-                "type": "chat_status", "status": "done", "message": ""
-            }))
+            await self._safe_send(websocket, _CHAT_STATUS_DONE)
 
     async def _refine_component_llm(self, websocket, component: Dict[str, Any],
                                     instruction: str) -> Optional[Dict[str, Any]]:
@@ -16141,7 +16342,7 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
         try:
             def _stamp_and_snapshot():
                 """Stamp identities, snapshot, and materialize off the event loop."""
-                now_ms = int(time.time() * 1000)
+                now_ms = time.time_ns() // 1_000_000
                 for row in self.workspace.live_rows(chat_id, user_id):
                     if row.get("component_id"):
                         continue
@@ -16629,6 +16830,22 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
             logger.debug("web_auth: session_token unavailable", exc_info=True)
             return ""
 
+    def _fail_pending_requests(self, agent_id: str) -> None:
+        """Resolve every in-flight call sent to ``agent_id`` with a retryable
+        error, so its waiters return now rather than at their timeout."""
+        targets = getattr(self, "_pending_request_agent", None) or {}
+        for req_id in [r for r, a in targets.items() if a == agent_id]:
+            future = self.pending_requests.get(req_id)
+            if future is not None and not future.done():
+                future.set_result(MCPResponse(request_id=req_id, error={
+                    "message": f"Agent {agent_id} disconnected", "retryable": True}))
+
+    def _forget_tool_defs(self, agent_id: str) -> None:
+        """Drop the cached chat tool definitions of a deregistered agent."""
+        cache = getattr(self, "_tool_def_cache", None) or {}
+        for key in [k for k in cache if k[0] == agent_id]:
+            del cache[key]
+
     @staticmethod
     def _sanitize_tool_schema(schema: dict) -> dict:
         """Fix common agent-generated schema issues before sending to the LLM.
@@ -16860,8 +17077,7 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
         """True when a final narrative is too long/structured for the chat rail."""
         c = content or ""
         return (len(c) > cls._NARRATIVE_PROMOTE_CHARS
-                or bool(re.search(r"(?m)^#{1,6}\s", c))
-                or bool(re.search(r"(?m)^\|.+\|\s*$", c)))
+                or _MD_STRUCTURE_RE.search(c) is not None)
 
     @staticmethod
     def _concise_lead(content: str, limit: int = 320) -> str:
@@ -16895,7 +17111,7 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
         if not text and (content or "").strip():
             _log_stripped_empty("doc_card", chat_id, content)
             text = _LEAK_FALLBACK_TEXT
-        m = re.search(r"(?m)^#{1,6}\s+(.+)$", text)
+        m = _MD_HEADING_TITLE_RE.search(text)
         title = (m.group(1).strip()[:120] if m else "Document")
         digest = hashlib.sha1(f"{chat_id}|{title}".encode("utf-8")).hexdigest()[:12]
         return Card(id=f"doc_{digest}", title=title, content=[
@@ -17666,6 +17882,9 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
         try:
             await server.serve()
         finally:
+            http = getattr(self, "_http", None)
+            if http is not None and not http.closed:
+                await http.close()
             watchdog = getattr(self, "_personal_agent_watchdog_task", None)
             if watchdog is not None:
                 watchdog.cancel()
@@ -17761,16 +17980,43 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
         """Continuously monitor and discover agents across a range of ports."""
         logger.info(f"Starting agent monitor for ports {start_port} to {start_port + max_ports - 1}...")
 
+        wake = self._agent_monitor_event()
+        interval = _AGENT_MONITOR_MIN_INTERVAL
         while True:
+            before = frozenset(self.agents)
+            connected = {self.agent_urls.get(a) for a in before}
             for port in range(start_port, start_port + max_ports):
                 agent_url = f"http://localhost:{port}"
+                if agent_url in connected:
+                    continue
                 try:
                     # This will connect if not already connected
                     await self.discover_agent(agent_url)
                 except Exception:
                     pass
-            
-            await asyncio.sleep(5)  # Check every 5 seconds
+
+            if frozenset(self.agents) != before or wake.is_set():
+                interval = _AGENT_MONITOR_MIN_INTERVAL
+            else:
+                interval = min(interval * 2, _AGENT_MONITOR_MAX_INTERVAL)
+            wake.clear()
+            if await self._agent_monitor_sleep(wake, interval):
+                interval = _AGENT_MONITOR_MIN_INTERVAL
+
+    async def _agent_monitor_sleep(self, wake: asyncio.Event, timeout: float) -> bool:
+        """Sleep up to ``timeout`` seconds; True when ``wake`` cut it short."""
+        try:
+            await asyncio.wait_for(wake.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def _agent_monitor_event(self) -> asyncio.Event:
+        """Event that cuts the discovery monitor's backoff sleep short."""
+        wake = getattr(self, "_agent_monitor_wake", None)
+        if wake is None:
+            wake = self._agent_monitor_wake = asyncio.Event()
+        return wake
 
     async def summarize_chat_title(self, chat_id: str, message: str, user_id: str = 'legacy', websocket=None):
         """Generate a concise title for the chat using LLM.
@@ -17794,16 +18040,29 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
             )
             return
 
+        # A title is a SMALL-tier task: with the model router on, it runs on
+        # the configured small model instead of competing with the turn's main
+        # call for the chat model (unmapped tiers fall back to the default).
+        title_model = resolved.model
+        if model_router.router_enabled():
+            title_model = model_router.resolve_model(model_router.SMALL, resolved.model)
+        slots = getattr(self, "_title_summary_slots", None)
+        if slots is None:
+            slots = self._title_summary_slots = asyncio.Semaphore(
+                _TITLE_SUMMARY_CONCURRENCY)
+
         try:
-            response = await asyncio.to_thread(
-                client.chat.completions.create,
-                model=resolved.model,
-                messages=[
-                    {"role": "system", "content": "Summarize the following user request into a concise 3-5 word title. Return ONLY the title, no quotes or other text."},
-                    {"role": "user", "content": message}
-                ],
-                max_tokens=20
-            )
+            async with slots:
+                response = await asyncio.to_thread(
+                    client.chat.completions.create,
+                    model=title_model,
+                    messages=[
+                        {"role": "system", "content": "Summarize the following user request into a concise 3-5 word title. Return ONLY the title, no quotes or other text."},
+                        {"role": "user", "content": message}
+                    ],
+                    max_tokens=20,
+                    temperature=0,
+                )
             usage = getattr(response, "usage", None)
             total_tokens = getattr(usage, "total_tokens", None) if usage else None
             await self._record_llm_call(
@@ -17818,7 +18077,7 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
             )
             if source == self._CredentialSource.USER and websocket is not None:
                 await self._emit_llm_usage_report(
-                    websocket, feature=feature, model=resolved.model,
+                    websocket, feature=feature, model=title_model,
                     usage=usage, outcome="success",
                 )
             content = strip_reasoning_markup(response.choices[0].message.content)
@@ -17827,7 +18086,8 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
             title = content.strip().strip('"')
 
             # Update history and notify UI
-            self.history.update_chat_title(chat_id, title, user_id=user_id)
+            await asyncio.to_thread(
+                self.history.update_chat_title, chat_id, title, user_id=user_id)
 
             # Broadcast update (each user gets their own history)
             await self._broadcast_user_history()
@@ -17847,7 +18107,7 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
             )
             if source == self._CredentialSource.USER and websocket is not None:
                 await self._emit_llm_usage_report(
-                    websocket, feature=feature, model=resolved.model,
+                    websocket, feature=feature, model=title_model,
                     usage=None, outcome="failure",
                 )
 
@@ -17894,21 +18154,35 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
                 logger.warning("Auth not configured (KEYCLOAK_AUTHORITY/CLIENT_ID missing)")
                 return None
 
-            # Fetch JWKS (feature 028 D8: cached with kid-miss refetch — the
-            # pre-028 per-call fetch made every WS register an IdP round-trip)
-            jwks_url = f"{authority}/protocol/openid-connect/certs"
-            from shared.jwks_cache import get_jwks
-            jwks = await get_jwks(jwks_url, token=token)
-
-            # Verify token — skip strict audience check since Keycloak
-            # confidential clients set aud="account", not the client_id.
-            # We validate azp (authorized party) instead.
-            payload = jose_jwt.decode(
-                token,
-                jwks,
-                algorithms=["RS256"],
-                options={"verify_aud": False, "verify_at_hash": False}
-            )
+            from shared.jwks_cache import (
+                accepted_algorithms, cached_claims, get_jwks, is_acceptable_token,
+                recently_rejected, remember_claims, signing_key, token_header)
+            payload = cached_claims(token)
+            if payload is None:
+                header = token_header(token)
+                if not is_acceptable_token(token, header):
+                    logger.warning("Token rejected: not a compact JWT with an accepted alg")
+                    return None
+                if recently_rejected(token):
+                    return None
+                # Fetch JWKS (feature 028 D8: cached with kid-miss refetch — the
+                # pre-028 per-call fetch made every WS register an IdP round-trip)
+                jwks_url = f"{authority}/protocol/openid-connect/certs"
+                jwks = signing_key(
+                    await get_jwks(jwks_url, token=token, header=header), token, header)
+
+                # Verify token — skip strict audience check since Keycloak
+                # confidential clients set aud="account", not the client_id.
+                # We validate azp (authorized party) instead.
+                # Off the event loop: the RSA verify is pure CPU.
+                payload = await asyncio.to_thread(
+                    jose_jwt.decode,
+                    token,
+                    jwks,
+                    algorithms=list(accepted_algorithms()),
+                    options={"verify_aud": False, "verify_at_hash": False}
+                )
+                remember_claims(token, payload)
 
             # Bind the token to our realm: reject when the issuer claim is
             # present and does not match the configured authority (defense
@@ -17933,26 +18207,38 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
                 )
                 return None
 
-            # Extract Roles
-            client_id = os.getenv("KEYCLOAK_CLIENT_ID", "astral-frontend")
+            # Extract Roles (expected_client is KEYCLOAK_CLIENT_ID, read above)
             roles = payload.get("realm_access", {}).get("roles", [])
             if "resource_access" in payload:
-                if client_id in payload["resource_access"]:
-                    client_roles = payload["resource_access"][client_id].get("roles", [])
+                if expected_client in payload["resource_access"]:
+                    client_roles = payload["resource_access"][expected_client].get("roles", [])
                     roles.extend(client_roles)
                 if "account" in payload["resource_access"]:
                     account_roles = payload["resource_access"]["account"].get("roles", [])
                     roles.extend(account_roles)
             
-            logger.debug(f"Token validation: extracted roles {roles} from payload keys {list(payload.keys())}")
+            logger.debug("Token validation: extracted roles %s from payload keys %s",
+                         roles, list(payload.keys()))
             
             if "admin" not in roles and "user" not in roles:
                 logger.warning(f"Token unauthorized (Requires 'admin' or 'user' role). Found roles: {roles}")
                 return None
 
             return payload
+        except JWTError as e:
+            # Bad signature / expired / bad claims — routine client-side
+            # failures (an expired token precedes every refresh).
+            from shared.jwks_cache import remember_rejection
+            remember_rejection(token)
+            logger.info("Token rejected: %s", e)
+            return None
+        except aiohttp.ClientError as e:
+            # IdP unreachable on a JWKS (re)fetch; the background warm loop
+            # keeps retrying with backoff.
+            logger.warning("Token validation could not fetch the JWKS: %s", e)
+            return None
         except Exception as e:
-            logger.error(f"Token validation failed: {e}")
+            logger.error("Token validation failed: %s", e)
             return None
 
     def _get_user_id(self, websocket) -> str:
@@ -17989,4 +18275,12 @@ Respond with ONLY valid JSON (no markdown code fences) in this format:
 
 if __name__ == "__main__":
     orch = Orchestrator()
-    asyncio.run(orch.start())
+    # uvloop is an optional accelerator, not a dependency: when the
+    # deployment image happens to ship it, the hub's socket fan-out runs on
+    # it; otherwise the stock asyncio loop is used unchanged.
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(orch.start())
+    else:
+        uvloop.run(orch.start())
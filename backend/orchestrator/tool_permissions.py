@@ -203,18 +203,20 @@ class ToolPermissionManager:
             scopes: Dict of {scope: enabled} for each scope to set.
         """
         now = int(time.time() * 1000)
+        rows = []
         for scope, enabled in scopes.items():
             if scope not in VALID_SCOPES:
                 logger.warning(f"Ignoring invalid scope: {scope}")
                 continue
-            self.db.execute(
-                """INSERT INTO agent_scopes
-                   (user_id, agent_id, scope, enabled, updated_at)
-                   VALUES (?, ?, ?, ?, ?)
-                   ON CONFLICT (user_id, agent_id, scope)
-                   DO UPDATE SET enabled = EXCLUDED.enabled, updated_at = EXCLUDED.updated_at""",
-                (user_id, agent_id, scope, bool(enabled), now)
-            )
+            rows.append((user_id, agent_id, scope, bool(enabled), now))
+        self.db.execute_many(
+            """INSERT INTO agent_scopes
+               (user_id, agent_id, scope, enabled, updated_at)
+               VALUES (?, ?, ?, ?, ?)
+               ON CONFLICT (user_id, agent_id, scope)
+               DO UPDATE SET enabled = EXCLUDED.enabled, updated_at = EXCLUDED.updated_at""",
+            rows,
+        )
         logger.info(
             f"Scopes updated: user={user_id} agent={agent_id} "
             f"scopes={scopes}"
@@ -584,20 +586,21 @@ class ToolPermissionManager:
         )
         existing_pairs = {(r["tool_name"], r["permission_kind"]) for r in existing}
         now = int(time.time() * 1000)
-        inserted = 0
-        for tool_name, required_scope in scope_map.items():
-            if (tool_name, required_scope) in existing_pairs:
-                continue
-            enabled = bool(scope_state.get(required_scope, False))
-            self.db.execute(
-                """INSERT INTO tool_overrides
-                   (user_id, agent_id, tool_name, permission_kind, enabled, updated_at)
-                   VALUES (?, ?, ?, ?, ?, ?)
-                   ON CONFLICT (user_id, agent_id, tool_name, COALESCE(permission_kind, ''))
-                   DO NOTHING""",
-                (user_id, agent_id, tool_name, required_scope, enabled, now),
-            )
-            inserted += 1
+        rows = [
+            (user_id, agent_id, tool_name, required_scope,
+             bool(scope_state.get(required_scope, False)), now)
+            for tool_name, required_scope in scope_map.items()
+            if (tool_name, required_scope) not in existing_pairs
+        ]
+        self.db.execute_many(
+            """INSERT INTO tool_overrides
+               (user_id, agent_id, tool_name, permission_kind, enabled, updated_at)
+               VALUES (?, ?, ?, ?, ?, ?)
+               ON CONFLICT (user_id, agent_id, tool_name, COALESCE(permission_kind, ''))
+               DO NOTHING""",
+            rows,
+        )
+        inserted = len(rows)
         if inserted:
             logger.info(
                 "Backfilled %d per-tool permission rows for user=%s agent=%s",
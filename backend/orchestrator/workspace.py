@@ -698,22 +698,24 @@ class WorkspaceManager:
                         "WHERE chat_id = ? AND user_id = ? AND layout_key = ?",
                         (json.dumps(pruned), _now_ms(), chat_id, user_id, other["layout_key"]),
                     )
-        existing = self.db.fetch_one(
-            "SELECT id FROM workspace_layout WHERE chat_id = ? AND user_id = ? AND layout_key = ?",
-            (chat_id, user_id, layout_key),
+        # Update in place first: re-designs of a known key are the common case
+        # and cost one statement. Only a miss pays for the position scan; the
+        # insert still upserts in case a concurrent save created the row.
+        encoded, now = json.dumps(layout), _now_ms()
+        cur = self.db.execute(
+            "UPDATE workspace_layout SET layout = ?, updated_at = ? "
+            "WHERE chat_id = ? AND user_id = ? AND layout_key = ?",
+            (encoded, now, chat_id, user_id, layout_key),
         )
-        if existing:
-            self.db.execute(
-                "UPDATE workspace_layout SET layout = ?, updated_at = ? "
-                "WHERE chat_id = ? AND user_id = ? AND layout_key = ?",
-                (json.dumps(layout), _now_ms(), chat_id, user_id, layout_key),
-            )
-        else:
+        if not getattr(cur, "rowcount", 0):
             self.db.execute(
                 "INSERT INTO workspace_layout (chat_id, user_id, layout_key, position, "
-                "layout, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                "layout, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (chat_id, layout_key) DO UPDATE SET "
+                "layout = EXCLUDED.layout, updated_at = EXCLUDED.updated_at "
+                "WHERE workspace_layout.user_id = EXCLUDED.user_id",
                 (chat_id, user_id, layout_key, self.next_canvas_position(chat_id, user_id),
-                 json.dumps(layout), _now_ms(), _now_ms()),
+                 encoded, now, now),
             )
         return True
 
@@ -57,6 +57,9 @@ def create_sse_router() -> APIRouter:
             headers={
                 "Cache-Control": "no-cache",
                 "Connection": "keep-alive",
+                # Keep a buffering reverse proxy (nginx) from holding frames
+                # back, which would show up as SSE latency in the benchmark.
+                "X-Accel-Buffering": "no",
                 "X-Connection-Id": conn_id,
             },
         )
@@ -4,8 +4,10 @@ Database migration script to add user_id columns for session isolation.
 
 This script:
 1. Adds user_id column to all relevant tables (if not exists)
-2. Sets user_id = 'legacy' for existing data
+2. Sets user_id = 'legacy' for existing data (via the column default when
+   the column is new, so no table rewrite)
 3. Creates indexes for performance
+4. Refreshes planner statistics for the migrated tables
 
 Note: For fresh PostgreSQL deployments, the schema already includes user_id columns.
 This script is for migrating existing databases that predate session isolation.
@@ -43,8 +45,12 @@ def migrate():
     # Tables to migrate
     tables = ["chats", "messages", "saved_components", "chat_files"]
 
-    # 1. Add user_id columns
+    # 1. Add user_id columns. A constant DEFAULT is stored as catalog
+    # metadata (PostgreSQL 11+), so existing rows read back 'legacy' without
+    # a table rewrite; dropping the default afterwards keeps the column
+    # identical to the fresh schema and leaves those rows as they are.
     print("\n1. Adding user_id columns...")
+    added = set()
     for table_name in tables:
         cursor.execute(
             "SELECT 1 FROM information_schema.columns WHERE table_name = %s AND column_name = 'user_id'",
@@ -54,14 +60,19 @@ def migrate():
             print(f"  [~] user_id already exists in {table_name}")
         else:
             try:
-                cursor.execute(f"ALTER TABLE {table_name} ADD COLUMN user_id TEXT")
-                print(f"  [+] Added user_id to {table_name}")
+                cursor.execute(f"ALTER TABLE {table_name} ADD COLUMN user_id TEXT DEFAULT 'legacy'")
+                cursor.execute(f"ALTER TABLE {table_name} ALTER COLUMN user_id DROP DEFAULT")
+                added.add(table_name)
+                print(f"  [+] Added user_id to {table_name} (existing rows read as 'legacy')")
             except Exception as e:
                 print(f"  [-] Failed to add user_id to {table_name}: {e}")
 
-    # 2. Set legacy user_id for existing data
+    # 2. Set legacy user_id for existing data (only columns that predate this
+    # run can still hold NULLs)
     print("\n2. Setting user_id='legacy' for existing data...")
     for table_name in tables:
+        if table_name in added:
+            continue
         try:
             cursor.execute(f"UPDATE {table_name} SET user_id = 'legacy' WHERE user_id IS NULL")
             updated = cursor.rowcount
@@ -77,6 +88,9 @@ def migrate():
         "CREATE INDEX IF NOT EXISTS idx_saved_components_user_id ON saved_components(user_id)",
         "CREATE INDEX IF NOT EXISTS idx_chat_files_user_id ON chat_files(user_id)",
         "CREATE INDEX IF NOT EXISTS idx_chats_user_updated ON chats(user_id, updated_at)",
+        "CREATE INDEX IF NOT EXISTS idx_messages_chat_ts ON messages(chat_id, timestamp)",
+        "CREATE INDEX IF NOT EXISTS idx_saved_components_chat ON saved_components(chat_id, created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_chat_files_chat ON chat_files(chat_id, uploaded_at)",
     ]
 
     for index_sql in indexes:
@@ -87,8 +101,18 @@ def migrate():
         except Exception as e:
             print(f"  [~] Index already exists or error: {e}")
 
-    # 4. Verify migration
-    print("\n4. Verifying migration...")
+    # 4. Refresh planner statistics: the legacy sweep rewrote every row, and
+    # the new user_id indexes are only chosen once the stats know about them.
+    print("\n4. Analyzing migrated tables...")
+    for table_name in tables:
+        try:
+            cursor.execute(f"ANALYZE {table_name}")
+            print(f"  [+] Analyzed {table_name}")
+        except Exception as e:
+            print(f"  [-] Failed to analyze {table_name}: {e}")
+
+    # 5. Verify migration
+    print("\n5. Verifying migration...")
     cursor.execute(
         "SELECT table_name FROM information_schema.tables WHERE table_schema = 'public'"
     )
@@ -20,8 +20,9 @@ compatible).
 """
 from __future__ import annotations
 
+import functools
 import os
-from typing import Set
+from typing import FrozenSet, Set
 
 
 def _primary_client_id() -> str:
@@ -34,14 +35,18 @@ def _primary_client_id() -> str:
     ).strip()
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_allow_list(raw: str) -> FrozenSet[str]:
+    return frozenset(cid.strip() for cid in raw.split(",") if cid.strip())
+
+
 def allowed_azps() -> Set[str]:
     """The set of accepted ``azp`` client ids (primary web client + allow-list)."""
-    ids = {_primary_client_id()}
-    for raw in os.getenv("KEYCLOAK_ALLOWED_AZP", "").split(","):
-        cid = raw.strip()
-        if cid:
-            ids.add(cid)
-    return {cid for cid in ids if cid}
+    ids = set(_parse_allow_list(os.getenv("KEYCLOAK_ALLOWED_AZP", "")))
+    primary = _primary_client_id()
+    if primary:
+        ids.add(primary)
+    return ids
 
 
 def is_azp_allowed(azp: str) -> bool:
@@ -53,4 +58,8 @@ def is_azp_allowed(azp: str) -> bool:
     """
     if not azp:
         return True
-    return azp in allowed_azps()
+    # Nearly every token is the web client's; settle that without building
+    # the set. The env is still read per call so a config change applies live.
+    if azp == _primary_client_id():
+        return True
+    return azp in _parse_allow_list(os.getenv("KEYCLOAK_ALLOWED_AZP", ""))
@@ -1,6 +1,6 @@
 import psycopg2
 import psycopg2.pool
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_batch
 import asyncio
 import atexit
 import hashlib
@@ -29,7 +29,9 @@ logger = logging.getLogger('Database')
 #          runtime, draft publication, maintenance, conversation-commit
 #          coordination, and owner-scoped Run-now reconciliation. Additive and
 #          guarded by fixed PostgreSQL advisory transaction identities.
-SCHEMA_REVISION = '060.004'
+# 060.005: + (chat_id, time) indexes on messages, saved_components and
+#          chat_files for per-chat history reads — additive
+SCHEMA_REVISION = '060.005'
 
 _SCHEMA_ADVISORY_LOCK = (1095980114, 60001)
 _USER_AGENT_POLICY_ADVISORY_LOCK = (1095980114, 60002)
@@ -788,6 +790,12 @@ class Database:
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_messages_user_id ON messages(user_id)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_saved_components_user_id ON saved_components(user_id)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_chat_files_user_id ON chat_files(user_id)')
+        # Per-chat reads filter on chat_id and order by time; these let the
+        # history page and the recent-chat preview walk the index instead of
+        # sorting every row of the chat.
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_messages_chat_ts ON messages(chat_id, timestamp)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_saved_components_chat ON saved_components(chat_id, created_at)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_chat_files_chat ON chat_files(chat_id, uploaded_at)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_agent_scopes_user_id ON agent_scopes(user_id, agent_id)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_tool_overrides_user_agent ON tool_overrides(user_id, agent_id)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_draft_agents_user_id ON draft_agents(user_id)')
@@ -3134,6 +3142,57 @@ class Database:
                 raise
         return self._run_with_retry(op)
 
+    def iter_all(self, query: str, params: Tuple = (), batch_size: int = 500):
+        """Yield rows one at a time from a server-side cursor.
+
+        Unlike ``fetch_all`` the result set is never materialized: Postgres
+        sends ``batch_size`` rows per round trip, so walking a large table
+        costs constant memory. The connection stays borrowed until the
+        generator is exhausted or closed, so consume it promptly.
+        """
+        conn, pooled = self._borrow()
+        discard = False
+        try:
+            with conn.cursor(name=f"iter_{uuid.uuid4().hex}") as cursor:
+                cursor.itersize = batch_size
+                cursor.execute(self._translate_query(query), params)
+                yield from cursor
+        except Exception:
+            # A failed fetch can leave the transaction aborted (or the socket
+            # dead); never hand that connection to the next borrower.
+            discard = True
+            raise
+        finally:
+            if not discard:
+                try:
+                    conn.rollback()  # end the read transaction the cursor opened
+                except Exception:
+                    discard = True
+            self._release(conn, pooled, discard=discard)
+
+    def execute_many(self, query: str, seq_of_params) -> None:
+        """Execute one write statement per parameter tuple in a single transaction.
+
+        Statements are sent in pages (``execute_batch``), so N rows cost a
+        handful of round trips and one commit instead of N of each.
+        """
+        params = list(seq_of_params)
+        if not params:
+            return
+
+        def op(conn):
+            cursor = conn.cursor()
+            try:
+                execute_batch(cursor, self._translate_query(query), params)
+                conn.commit()
+            except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                raise
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"Database error executing batch {query}: {e}")
+                raise
+        self._run_with_retry(op)
+
     def fetch_one(self, query: str, params: Tuple = ()) -> Optional[Dict]:
         """Fetch a single row."""
         def op(conn):
@@ -3536,6 +3595,25 @@ class Database:
         )
         return cursor.rowcount > 0
 
+    def append_draft_log(self, draft_id: str, entry: Dict) -> bool:
+        """Append one entry to a draft's JSON ``generation_log`` in place.
+
+        A single UPDATE splices the encoded entry onto the stored array, so the
+        log is never read back and re-serialized per line, and two concurrent
+        appends cannot overwrite each other.
+        """
+        import time
+        item = json.dumps(entry)
+        cursor = self.execute(
+            "UPDATE draft_agents SET generation_log = CASE "
+            "WHEN generation_log IS NULL OR generation_log IN ('', '[]') "
+            "THEN '[' || ? || ']' "
+            "ELSE left(generation_log, -1) || ', ' || ? || ']' END, "
+            "updated_at = ? WHERE id = ?",
+            (item, item, int(time.time() * 1000), draft_id),
+        )
+        return cursor.rowcount > 0
+
     def claim_draft_generation(
         self,
         *,
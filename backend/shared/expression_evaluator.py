@@ -5,9 +5,123 @@ Supports Python-like expressions with row context, using AST validation
 for security. Provides fallback to restricted eval for performance.
 '''
 import ast
+import functools
 import math
 import numpy as np
-from typing import Any, Dict, Callable
+from typing import Any, Dict, Callable, Optional
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_source(expression: str):
+    """Bytecode for ``lambda row: <expression>``, shared per expression text.
+
+    The lambda is assembled from the parsed expression rather than by string
+    splicing, so comments or stray parentheses in the text cannot change its
+    shape. ``eval`` of the code against a globals dict yields the function.
+    """
+    body = ast.parse(expression, mode='eval').body
+    fn = ast.Lambda(
+        args=ast.arguments(posonlyargs=[], args=[ast.arg(arg='row')], vararg=None,
+                           kwonlyargs=[], kw_defaults=[], kwarg=None, defaults=[]),
+        body=body,
+    )
+    tree = ast.fix_missing_locations(ast.Expression(body=fn))
+    return compile(tree, '<string>', 'eval')
+
+
+# The NumPy batch path (``evaluate_batch``) covers plain numeric arithmetic and
+# single comparisons over ``row['col']`` lookups, optionally wrapped in
+# ``int(...)``/``float(...)``. Anything else — strings, attribute calls,
+# conditionals, boolean operators — runs row by row.
+_VECTOR_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Compare, ast.Subscript,
+    ast.Name, ast.Constant, ast.Call, ast.Load,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod,
+    ast.USub, ast.UAdd,
+    ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+)
+_VECTOR_CASTS = ('int', 'float')
+# Integers are only vectorized while float64 represents them exactly, so
+# true division and int/float comparisons agree with Python's.
+_EXACT_INT_LIMIT = 2 ** 53
+
+
+def _vector_int(values: np.ndarray) -> np.ndarray:
+    """``int(...)`` over a column."""
+    out = np.array([int(v) for v in values.tolist()], dtype=np.int64)
+    if out.size and np.abs(out).max() >= _EXACT_INT_LIMIT:
+        raise OverflowError("integer outside the exact float range")
+    return out
+
+
+def _vector_float(values: np.ndarray) -> np.ndarray:
+    """``float(...)`` over a column."""
+    return np.array([float(v) for v in values.tolist()], dtype=np.float64)
+
+
+def _is_number(value: Any) -> bool:
+    return type(value) is float or (
+        type(value) is int and abs(value) < _EXACT_INT_LIMIT)
+
+
+_VECTOR_BINOPS = {
+    ast.Add: np.add, ast.Sub: np.subtract, ast.Mult: np.multiply,
+    ast.Div: np.true_divide, ast.FloorDiv: np.floor_divide, ast.Mod: np.remainder,
+}
+_VECTOR_COMPARE = {
+    ast.Eq: np.equal, ast.NotEq: np.not_equal, ast.Lt: np.less,
+    ast.LtE: np.less_equal, ast.Gt: np.greater, ast.GtE: np.greater_equal,
+}
+# int64 results of these can wrap; floor division and modulo only shrink.
+_WRAPPING_OPS = (ast.Add, ast.Sub, ast.Mult)
+
+
+def _arithmetic_operand(value: Any) -> Any:
+    """Reject operands whose NumPy arithmetic differs from Python's."""
+    kind = np.asarray(value).dtype.kind
+    if kind not in 'if':
+        # bool + bool is a logical or in NumPy; object columns are raw values.
+        raise TypeError(f"operand of kind {kind!r} is not vectorized")
+    return value
+
+
+def _vector_eval(node: ast.AST, columns: Dict[str, np.ndarray]) -> Any:
+    """Evaluate a ``_vector_plan`` expression node over whole columns.
+
+    Every integer intermediate must stay within ``_EXACT_INT_LIMIT``, where
+    int64 cannot wrap and float64 is exact, so int/float mixing, true
+    division and comparisons agree with Python's arbitrary-precision ints.
+    Raises on anything outside that envelope; the caller falls back.
+    """
+    if isinstance(node, ast.Subscript):
+        return columns[node.slice.value]
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.Call):
+        cast = _vector_int if node.func.id == 'int' else _vector_float
+        return cast(_vector_eval(node.args[0], columns))
+    if isinstance(node, ast.UnaryOp):
+        operand = _arithmetic_operand(_vector_eval(node.operand, columns))
+        return np.negative(operand) if isinstance(node.op, ast.USub) else operand
+    if isinstance(node, ast.Compare):
+        left = _vector_eval(node.left, columns)
+        right = _vector_eval(node.comparators[0], columns)
+        for operand in (left, right):
+            if np.asarray(operand).dtype.kind not in 'bif':
+                raise TypeError("comparison operand is not numeric")
+        return _VECTOR_COMPARE[type(node.ops[0])](left, right)
+    if isinstance(node, ast.BinOp):
+        left = _arithmetic_operand(_vector_eval(node.left, columns))
+        right = _arithmetic_operand(_vector_eval(node.right, columns))
+        result = _VECTOR_BINOPS[type(node.op)](left, right)
+        if result.dtype.kind == 'i' and isinstance(node.op, _WRAPPING_OPS):
+            # int64 wraps silently; the same operation in float64 does not.
+            wide = _VECTOR_BINOPS[type(node.op)](
+                np.asarray(left, dtype=np.float64), np.asarray(right, dtype=np.float64))
+            if np.abs(wide).max() >= _EXACT_INT_LIMIT:
+                raise OverflowError("integer outside the exact float range")
+        return result
+    raise TypeError(f"unsupported node {type(node).__name__}")
 
 
 class ExpressionEvaluator:
@@ -22,8 +136,8 @@ class ExpressionEvaluator:
     - Safe evaluation with row context
     """
     
-    # Allowed AST node types
-    ALLOWED_NODES = {
+    # Allowed AST node types (frozen: the allowlist cannot be widened at runtime)
+    ALLOWED_NODES = frozenset({
         # Expressions
         ast.Expression, ast.BinOp, ast.UnaryOp, ast.Compare, ast.BoolOp,
         ast.Name, ast.Constant, ast.Subscript, ast.Index, ast.Slice,
@@ -40,7 +154,7 @@ class ExpressionEvaluator:
         ast.IfExp,
         # Context nodes (safe)
         ast.Load, ast.Store, ast.Del,
-    }
+    })
     
     # Allowed built-in functions
     ALLOWED_BUILTINS = {
@@ -70,11 +184,11 @@ class ExpressionEvaluator:
     }
 
     # Allowed attributes (e.g., row.get, row.keys for schema introspection)
-    ALLOWED_ATTRIBUTES = {
+    ALLOWED_ATTRIBUTES = frozenset({
         'get', 'keys', 'values', 'items',
         'lower', 'upper', 'strip', 'replace', 'split', 'startswith', 'endswith',
         'str', 'contains', 'where',
-    }
+    })
     
     def __init__(self, expression: str, use_ast_validation: bool = True):
         """
@@ -103,14 +217,25 @@ class ExpressionEvaluator:
         Validate expression AST for security.
         Raises ValueError if unsafe nodes are found.
         """
+        self._check_source(self.expression)
+
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def _check_source(cls, expression: str) -> None:
+        """Parse and walk ``expression`` once per distinct text; only a clean
+        result is cached, so a rejected expression is re-checked (and
+        re-rejected) on every construction."""
         try:
-            tree = ast.parse(self.expression, mode='eval')
+            tree = ast.parse(expression, mode='eval')
         except SyntaxError as e:
             raise ValueError(f"Invalid expression syntax: {e}")
         
+        allowed_nodes = cls.ALLOWED_NODES
+        allowed_functions = cls.ALLOWED_BUILTINS
+        allowed_attributes = cls.ALLOWED_ATTRIBUTES
         for node in ast.walk(tree):
             node_type = type(node)
-            if node_type not in self.ALLOWED_NODES:
+            if node_type not in allowed_nodes:
                 raise ValueError(
                     f"Unsafe operation detected: {node_type.__name__} "
                     f"at line {node.lineno if hasattr(node, 'lineno') else '?'}"
@@ -123,9 +248,9 @@ class ExpressionEvaluator:
             # ``ast.Attribute`` that is not the callee of a Call (previously
             # unvalidated) reaches the real module/type internals. No
             # legitimate row expression references a dunder, so deny outright.
-            if isinstance(node, ast.Attribute) and self._is_dunder(node.attr):
+            if isinstance(node, ast.Attribute) and cls._is_dunder(node.attr):
                 raise ValueError(f"Disallowed attribute: {node.attr}")
-            if isinstance(node, ast.Name) and self._is_dunder(node.id):
+            if isinstance(node, ast.Name) and cls._is_dunder(node.id):
                 raise ValueError(f"Disallowed name: {node.id}")
 
             # Additional checks for Call nodes
@@ -140,20 +265,19 @@ class ExpressionEvaluator:
                         "Disallowed call target: only named functions and "
                         "attribute methods may be called")
                 # Check function name
+                # (A bare name never contains a dot, so the ``math.*`` keys of
+                # ALLOWED_BUILTINS can only match through the Attribute
+                # branch, which checks ALLOWED_ATTRIBUTES.)
                 if isinstance(node.func, ast.Name):
                     func_name = node.func.id
-                    if func_name not in self.ALLOWED_BUILTINS:
-                        # Check if it's a math function
-                        if not (func_name.startswith('math.') and func_name in self.ALLOWED_BUILTINS):
-                            raise ValueError(f"Disallowed function: {func_name}")
+                    if func_name not in allowed_functions:
+                        raise ValueError(f"Disallowed function: {func_name}")
                 elif isinstance(node.func, ast.Attribute):
-                    # Allow row.get etc.
+                    # Allow row.get etc., and the pandas string chains
+                    # (``.str.contains``, ``.where``) the allowlist names.
                     attr_name = node.func.attr
-                    if attr_name not in self.ALLOWED_ATTRIBUTES:
-                        # Sometimes node.func corresponds to an object's attribute (like pd.Series.str.contains)
-                        # Let's be lenient on pandas attribute chains for string manipulation within eval
-                        if attr_name not in ['contains', 'str', 'where']:
-                            raise ValueError(f"Disallowed attribute: {attr_name}")
+                    if attr_name not in allowed_attributes:
+                        raise ValueError(f"Disallowed attribute: {attr_name}")
     
     def compile(self) -> Callable:
         """
@@ -186,7 +310,6 @@ class ExpressionEvaluator:
             },
             'math': math,
             'np': np,
-            'row': None,  # Placeholder, will be replaced with actual row
         }
         
         # Add math functions individually for easier access
@@ -197,24 +320,13 @@ class ExpressionEvaluator:
             safe_globals[name] = func
         
         try:
-            # Compile expression
-            code = compile(self.expression, '<string>', 'eval')
-            
-            def evaluator(row: Dict[str, Any]) -> Any:
-                """Evaluate expression with given row context."""
-                safe_globals['row'] = row
-                try:
-                    return eval(code, safe_globals, {})
-                except Exception as e:
-                    # Provide more context in error
-                    raise ValueError(
-                        f"Error evaluating expression '{self.expression}': {e}"
-                    ) from e
-            
-            self._compiled = evaluator
-            return evaluator
+            # A real function with ``row`` as its argument: each call is a
+            # plain Python call, with no shared globals rebound per row.
+            evaluator = eval(_compile_source(self.expression), safe_globals)
         except SyntaxError as e:
             raise ValueError(f"Expression compilation failed: {e}")
+        self._compiled = evaluator
+        return evaluator
     
     def evaluate(self, row: Dict[str, Any]) -> Any:
         """
@@ -228,7 +340,13 @@ class ExpressionEvaluator:
         """
         if self._compiled is None:
             self.compile()
-        return self._compiled(row)
+        try:
+            return self._compiled(row)
+        except Exception as e:
+            # Provide more context in error
+            raise ValueError(
+                f"Error evaluating expression '{self.expression}': {e}"
+            ) from e
     
     @classmethod
     def evaluate_batch(
@@ -252,7 +370,11 @@ class ExpressionEvaluator:
         """
         evaluator = cls(expression, use_ast_validation)
         evaluator.compile()
-        
+
+        vectorized = cls._evaluate_vectorized(evaluator.expression, rows)
+        if vectorized is not None:
+            return vectorized
+
         results = []
         for row in rows:
             try:
@@ -262,6 +384,93 @@ class ExpressionEvaluator:
         return results
 
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _vector_plan(expression: str) -> Optional[tuple]:
+        """``(body, row keys)`` of an expression the NumPy path can run, else None."""
+        try:
+            tree = ast.parse(expression, mode='eval')
+        except SyntaxError:
+            return None
+        keys = []
+        subscripted, called = set(), set()
+        for node in ast.walk(tree):
+            if not isinstance(node, _VECTOR_NODES):
+                return None
+            if isinstance(node, ast.Compare) and len(node.ops) != 1:
+                return None
+            if isinstance(node, ast.Subscript):
+                key = node.slice
+                if not (isinstance(node.value, ast.Name) and node.value.id == 'row'
+                        and isinstance(key, ast.Constant) and isinstance(key.value, str)):
+                    return None
+                subscripted.update((id(node.value), id(key)))
+                if key.value not in keys:
+                    keys.append(key.value)
+            elif isinstance(node, ast.Call):
+                if not (isinstance(node.func, ast.Name) and node.func.id in _VECTOR_CASTS
+                        and len(node.args) == 1 and not node.keywords):
+                    return None
+                called.add(id(node.func))
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name) and id(node) not in subscripted | called:
+                return None
+            if (isinstance(node, ast.Constant) and id(node) not in subscripted
+                    and not _is_number(node.value)):
+                return None
+        return (tree.body, tuple(keys)) if keys else None
+
+    @classmethod
+    def _evaluate_vectorized(cls, expression: str,
+                             rows: list[Dict[str, Any]]) -> Optional[list]:
+        """Evaluate a whole batch as NumPy array operations.
+
+        Returns None whenever the result could differ from evaluating row by
+        row — an unsupported expression, a missing key, a non-numeric value
+        used bare, any floating-point error (division by zero, overflow), or
+        an integer intermediate beyond the exact float range — so the caller
+        falls back to the per-row path and its per-row defaults.
+        """
+        plan = cls._vector_plan(expression)
+        if plan is None or not rows:
+            return None
+        body, keys = plan
+        columns = {}
+        for key in keys:
+            try:
+                values = [row[key] for row in rows]
+            except (KeyError, TypeError):
+                return None
+            # A column is numeric only if every value has the same type, so
+            # int rows keep producing ints (a mixed column would be float64).
+            kinds = set(map(type, values))
+            column = None
+            if kinds == {float}:
+                column = np.array(values, dtype=np.float64)
+            elif kinds == {int}:
+                try:
+                    column = np.array(values, dtype=np.int64)
+                except OverflowError:
+                    column = None
+                if column is not None and np.abs(column).max() >= _EXACT_INT_LIMIT:
+                    column = None
+            if column is None:
+                # Only usable through int()/float(); ``_vector_eval``
+                # rejects an object column used bare.
+                column = np.array(values, dtype=object)
+            columns[key] = column
+
+        try:
+            with np.errstate(all='raise'):
+                result = _vector_eval(body, columns)
+        except Exception:
+            return None
+        if (not isinstance(result, np.ndarray) or result.shape != (len(rows),)
+                or result.dtype.kind not in 'bif'):
+            return None
+        return result.tolist()
+
+
 def safe_eval(expression: str, row: Dict[str, Any], default: Any = None) -> Any:
     """
     Convenience function for one-off expression evaluation.
@@ -68,8 +68,9 @@ class FeatureFlags:
             # 033 Wave-0 (C-N16 — context engineering): keep the chat system
             # prompt's stable instruction prefix cache-friendly (volatile
             # file/canvas context moved last) AND tombstone stale tool outputs
-            # mid-loop so a long tool-calling turn doesn't pin volatile/untrusted
-            # text in the window. Byte-identical to today when OFF. Default OFF.
+            # mid-loop (clipping any single oversized result) so a long
+            # tool-calling turn doesn't pin volatile/untrusted text in the
+            # window. Byte-identical to today when OFF. Default OFF.
             "context_engineering": self._read("FF_CONTEXT_ENGINEERING", False),
             # 033 Wave-0 (C-S4 — spotlighting/datamarking): wrap untrusted
             # (non-digest) tool output in unforgeable per-turn sentinel markers
@@ -148,6 +149,12 @@ class FeatureFlags:
             # boundary re-verification reuses the existing gate stack. See
             # specs/057-byo-client-agents/.
             "byo_agents": self._read("FF_BYO_AGENTS", False),
+            # Answer an identical draft codegen prompt (same spec, knowledge
+            # context, model and credential) from a bounded in-process cache
+            # instead of a fresh completion. Only code that passed every gate
+            # unchanged is kept; anything rejected or auto-fixed is forgotten.
+            # Default OFF — a regenerate then returns the same file.
+            "codegen_prompt_cache": self._read("FF_CODEGEN_PROMPT_CACHE", False),
         }
 
     @staticmethod
@@ -8,62 +8,324 @@ gives the other two validators the same behavior).
 
 TTL-based with a kid-miss refetch escape hatch: a key rotation invalidates
 the cache early instead of failing tokens for the rest of the TTL window.
+That refetch is rate-limited per URL, so with the boot warm-up keeping the set
+fresh the validation path stays offline even under a flood of unknown kids.
+Concurrent callers that do need a fetch share one in-flight request.
+
+Verified claims are cached alongside, keyed by the token's SHA-256 (never the
+raw token), so a bearer token reused across requests pays for one RS256
+verification per ``_CLAIMS_TTL_SECONDS`` rather than one per call. An entry
+never outlives the token's own ``exp``, and a failed verification is never
+cached. A token that fails verification is remembered for a second, so the
+same bad token replayed in a burst is refused without another RSA verify.
+
+``signing_key`` picks the token's key out of the set by ``kid`` and keeps the
+constructed RSA key object, so a verification neither re-parses the JWK nor
+tries every key in the set. A fetch builds those key objects up front.
 """
 from __future__ import annotations
 
+import asyncio
+import base64
+import copy
+import functools
+import hashlib
 import json
 import logging
+import os
 import time
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
 import aiohttp
 
 logger = logging.getLogger("shared.jwks_cache")
 
 _TTL_SECONDS = 600
+# At most one kid-miss refetch per URL in this window. Rotation still lands on
+# the first token carrying the new kid; further misses fail closed offline.
+_KID_MISS_REFETCH_SECONDS = 30.0
+_miss_refetched_at: Dict[str, float] = {}
+# url -> the JWKS fetch currently in flight (see _shared_fetch)
+_inflight: Dict[str, "asyncio.Task"] = {}
 _cache: Dict[str, Dict[str, Any]] = {}  # url -> {"jwks": dict, "fetched_at": float}
 
+_CLAIMS_TTL_SECONDS = 300
+_CLAIMS_MAX_ENTRIES = 10_000
+# sha256(token) -> (expires_at, verified payload), least recently used first
+_claims: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+# Tokens that just failed verification: sha256(token) -> rejected_at. A short
+# window, so a replayed bad token is refused without another RSA verify.
+_REJECTED_TTL_SECONDS = 1.0
+_REJECTED_MAX_ENTRIES = 2048
+_rejected: "OrderedDict[bytes, float]" = OrderedDict()
+# kid -> (the JWK it was built from, constructed verification key)
+_keys: Dict[str, Tuple[Dict[str, Any], Any]] = {}
+
 
 def _kids(jwks: Dict[str, Any]) -> set:
     return {k.get("kid") for k in (jwks or {}).get("keys", []) if isinstance(k, dict)}
 
 
-def _token_kid(token: str) -> Optional[str]:
+def token_header(token: str) -> Optional[Dict[str, Any]]:
+    """The decoded JOSE header, or None when it does not decode to an object.
+
+    One validation needs it three times (shape check, kid-miss check, key
+    selection): validators decode it once and pass it to
+    :func:`is_acceptable_token`, :func:`get_jwks` and :func:`signing_key`.
+    """
     try:
-        import base64
         header = token.split(".")[0]
         header += "=" * (-len(header) % 4)
-        return json.loads(base64.urlsafe_b64decode(header)).get("kid")
+        parsed = json.loads(base64.urlsafe_b64decode(header))
     except Exception:
         return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+def _token_kid(token: str, header: Optional[Dict[str, Any]]) -> Optional[str]:
+    if header is None:
+        header = token_header(token)
+    return (header or {}).get("kid")
+
+
+# Signature algorithms a deployment may opt into, with the JWK key type each
+# needs. Asymmetric only; EdDSA is not offered because python-jose has no
+# Ed25519 verifier.
+_ALG_KTY = {"RS256": "RSA", "ES256": "EC"}
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_algorithms(raw: str) -> Tuple[str, ...]:
+    algs = tuple(a for a in (p.strip().upper() for p in raw.split(",")) if a in _ALG_KTY)
+    return algs or ("RS256",)
+
+
+def accepted_algorithms() -> Tuple[str, ...]:
+    """Token signature algorithms accepted (``KEYCLOAK_TOKEN_ALGORITHMS``,
+    comma-separated, default ``RS256``). ES256 verifies faster than RS256;
+    enable it once the realm's active signing key is an EC P-256 key."""
+    return _parse_algorithms(os.getenv("KEYCLOAK_TOKEN_ALGORITHMS", "RS256"))
+
+
+def is_acceptable_token(token: Any, header: Optional[Dict[str, Any]] = None) -> bool:
+    """Cheap shape check run before any key lookup or signature work.
+
+    A compact JWS has exactly three segments and a JSON header whose ``alg``
+    is one of :func:`accepted_algorithms`; anything else (``none``, HS256,
+    an algorithm the deployment has not enabled) is rejected here rather than
+    inside the decode. ``header`` is the already-decoded JOSE header, if any.
+    """
+    if not isinstance(token, str) or token.count(".") != 2:
+        return False
+    if header is None:
+        header = token_header(token)
+    return header is not None and header.get("alg") in accepted_algorithms()
 
 
 async def _fetch(jwks_url: str) -> Dict[str, Any]:
+    """Fetch (or revalidate) the JWKS and stamp the cache entry.
+
+    A cached entry's validators are sent back as ``If-None-Match`` /
+    ``If-Modified-Since``; a ``304`` keeps the cached set without re-reading
+    or re-parsing the document (the background refresh is usually a no-op).
+    """
+    prior = _cache.get(jwks_url)
+    headers = {}
+    if prior:
+        if prior.get("etag"):
+            headers["If-None-Match"] = prior["etag"]
+        if prior.get("last_modified"):
+            headers["If-Modified-Since"] = prior["last_modified"]
     async with aiohttp.ClientSession() as session:
-        async with session.get(jwks_url) as resp:
+        async with session.get(jwks_url, headers=headers) as resp:
+            if resp.status == 304 and prior:
+                prior["fetched_at"] = time.time()
+                return prior["jwks"]
             jwks = await resp.json()
-    _cache[jwks_url] = {"jwks": jwks, "fetched_at": time.time()}
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+    _cache[jwks_url] = {"jwks": jwks, "fetched_at": time.time(), "kids": _kids(jwks),
+                        "etag": etag, "last_modified": last_modified}
+    _prebuild_keys(jwks)
     return jwks
 
 
-async def get_jwks(jwks_url: str, *, token: Optional[str] = None) -> Dict[str, Any]:
+async def get_jwks(jwks_url: str, *, token: Optional[str] = None,
+                   header: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Return the JWKS for ``jwks_url``, cached for up to 10 minutes.
 
     When ``token`` is supplied and its ``kid`` is absent from the cached set
-    (key rotation), the cache is refreshed immediately.
+    (key rotation), the cache is refreshed immediately. ``header`` is the
+    token's already-decoded JOSE header, if any.
     """
     entry = _cache.get(jwks_url)
     if entry and (time.time() - entry["fetched_at"]) < _TTL_SECONDS:
         jwks = entry["jwks"]
         if token is not None:
-            kid = _token_kid(token)
-            if kid and kid not in _kids(jwks):
+            kid = _token_kid(token, header)
+            if kid and kid not in (entry.get("kids") or _kids(jwks)):
+                running = _running_fetch(jwks_url)
+                if running is not None:
+                    return await asyncio.shield(running)
+                now = time.time()
+                if now - _miss_refetched_at.get(jwks_url, 0.0) < _KID_MISS_REFETCH_SECONDS:
+                    # A refetch for an unknown kid ran moments ago: serve the
+                    # cached set (the token fails verification) rather than
+                    # let a stream of bogus kids drive IdP round trips.
+                    return jwks
+                _miss_refetched_at[jwks_url] = now
                 logger.info("jwks_cache: kid %s not in cached set — refetching (rotation?)", kid)
-                return await _fetch(jwks_url)
+                return await _shared_fetch(jwks_url)
         return jwks
-    return await _fetch(jwks_url)
+    return await _shared_fetch(jwks_url)
+
+
+def _running_fetch(jwks_url: str) -> Optional["asyncio.Task"]:
+    task = _inflight.get(jwks_url)
+    if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+        return None
+    return task
+
+
+async def _shared_fetch(jwks_url: str) -> Dict[str, Any]:
+    """``_fetch`` with concurrent callers coalesced onto one in-flight request.
+
+    Shielded, so a caller that gives up (client disconnect) does not cancel
+    the fetch the other waiters are sharing.
+    """
+    task = _running_fetch(jwks_url)
+    if task is None:
+        task = asyncio.get_running_loop().create_task(_fetch(jwks_url))
+        _inflight[jwks_url] = task
+
+        def _done(t: "asyncio.Task", url: str = jwks_url) -> None:
+            if _inflight.get(url) is t:
+                del _inflight[url]
+            if not t.cancelled():
+                t.exception()  # retrieved, even if every waiter went away
+
+        task.add_done_callback(_done)
+    return await asyncio.shield(task)
+
+
+def _jwk_algorithm(jwk_dict: Dict[str, Any]) -> Optional[str]:
+    kty = jwk_dict.get("kty")
+    alg = jwk_dict.get("alg") or {"RSA": "RS256", "EC": "ES256"}.get(kty)
+    if alg == "ES256" and jwk_dict.get("crv", "P-256") != "P-256":
+        return None
+    return alg if _ALG_KTY.get(alg) == kty else None
+
+
+def _build_key(jwk_dict: Dict[str, Any]) -> Any:
+    """Construct (and memoise) the verification key for one signing JWK, or None."""
+    kid = jwk_dict.get("kid")
+    alg = _jwk_algorithm(jwk_dict)
+    if not kid or alg is None or jwk_dict.get("use", "sig") != "sig":
+        return None
+    cached = _keys.get(kid)
+    if cached is not None and (cached[0] is jwk_dict or cached[0] == jwk_dict):
+        return cached[1]
+    try:
+        from jose import jwk
+        key = jwk.construct(jwk_dict, alg)
+    except Exception:
+        return None
+    _keys[kid] = (jwk_dict, key)
+    return key
+
+
+def _prebuild_keys(jwks: Dict[str, Any]) -> None:
+    """Build every signing key of a freshly fetched set on the refresh path,
+    so the first token after a rotation does not pay for the construction."""
+    for jwk_dict in (jwks or {}).get("keys", []):
+        if isinstance(jwk_dict, dict):
+            _build_key(jwk_dict)
+
+
+def signing_key(jwks: Dict[str, Any], token: str,
+                header: Optional[Dict[str, Any]] = None) -> Any:
+    """The constructed key for ``token``'s ``kid``, else ``jwks`` itself.
+
+    Anything unexpected (no kid, kid not in the set, an unsupported or
+    encryption key, a JWK that will not construct) returns the whole set, so
+    the decode behaves exactly as it did before.
+    """
+    kid = _token_kid(token, header)
+    if not kid:
+        return jwks
+    for jwk_dict in (jwks or {}).get("keys", []):
+        if isinstance(jwk_dict, dict) and jwk_dict.get("kid") == kid:
+            break
+    else:
+        return jwks
+    key = _build_key(jwk_dict)
+    return jwks if key is None else key
+
+
+def _claims_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+def cached_claims(token: str) -> Optional[Dict[str, Any]]:
+    """Return a copy of ``token``'s verified payload if it is still cached.
+
+    A copy, because callers extend claim lists (roles) in place.
+    """
+    key = _claims_key(token)
+    entry = _claims.get(key)
+    if entry is None:
+        return None
+    expires_at, payload = entry
+    if expires_at <= time.time():
+        _claims.pop(key, None)
+        return None
+    _claims.move_to_end(key)
+    return copy.deepcopy(payload)
+
+
+def remember_claims(token: str, payload: Dict[str, Any]) -> None:
+    """Cache a payload that just passed signature verification.
+
+    Tokens without a numeric ``exp`` are not cached — there is no bound on
+    how long the verification would stay valid.
+    """
+    exp = payload.get("exp") if isinstance(payload, dict) else None
+    if not isinstance(exp, (int, float)) or isinstance(exp, bool):
+        return
+    expires_at = min(float(exp), time.time() + _CLAIMS_TTL_SECONDS)
+    key = _claims_key(token)
+    _claims[key] = (expires_at, copy.deepcopy(payload))
+    _claims.move_to_end(key)
+    while len(_claims) > _CLAIMS_MAX_ENTRIES:
+        _claims.popitem(last=False)
+
+
+def recently_rejected(token: str) -> bool:
+    """Did ``token`` fail verification within the last ``_REJECTED_TTL_SECONDS``?"""
+    key = _claims_key(token)
+    rejected_at = _rejected.get(key)
+    if rejected_at is None:
+        return False
+    if time.time() - rejected_at >= _REJECTED_TTL_SECONDS:
+        _rejected.pop(key, None)
+        return False
+    return True
+
+
+def remember_rejection(token: str) -> None:
+    """Record a token whose signature or claims failed verification."""
+    key = _claims_key(token)
+    _rejected[key] = time.time()
+    _rejected.move_to_end(key)
+    while len(_rejected) > _REJECTED_MAX_ENTRIES:
+        _rejected.popitem(last=False)
 
 
 def clear() -> None:
     """Test helper."""
     _cache.clear()
+    _claims.clear()
+    _keys.clear()
+    _miss_refetched_at.clear()
+    _rejected.clear()
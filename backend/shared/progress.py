@@ -15,6 +15,9 @@ from enum import Enum
 
 logger = logging.getLogger("ProgressSystem")
 
+# Minimum spacing between non-forced emissions (100ms), on the monotonic clock.
+_EMIT_INTERVAL_NS = 100_000_000
+
 
 class ProgressPhase(str, Enum):
     """Phase of the agent creation process."""
@@ -52,6 +55,34 @@ class ProgressStep(str, Enum):
     INFO = "info"
 
 
+# ``Enum.value`` is a descriptor lookup; every emitted event reads two.
+_PHASE_VALUES = {member: member.value for member in ProgressPhase}
+_STEP_VALUES = {member: member.value for member in ProgressStep}
+
+
+# Default percentage of each step within its phase, for events (warnings)
+# emitted without an explicit percentage.
+_STEP_PERCENTAGES = {
+    (ProgressPhase.GENERATION, ProgressStep.PROMPT_CONSTRUCTION): 10,
+    (ProgressPhase.GENERATION, ProgressStep.LLM_API_CALL): 30,
+    (ProgressPhase.GENERATION, ProgressStep.RESPONSE_RECEIVED): 40,
+    (ProgressPhase.GENERATION, ProgressStep.JSON_PARSING): 50,
+    (ProgressPhase.GENERATION, ProgressStep.STRUCTURE_VALIDATION): 60,
+    (ProgressPhase.GENERATION, ProgressStep.CODE_CLEANING): 70,
+    (ProgressPhase.GENERATION, ProgressStep.GENERATION_COMPLETE): 100,
+    (ProgressPhase.TESTING, ProgressStep.SAVING_FILES): 10,
+    (ProgressPhase.TESTING, ProgressStep.STARTING_PROCESS): 20,
+    (ProgressPhase.TESTING, ProgressStep.WAITING_FOR_BOOT): 30,
+    (ProgressPhase.TESTING, ProgressStep.WEBSOCKET_CONNECTION): 40,
+    (ProgressPhase.TESTING, ProgressStep.AGENT_REGISTRATION): 50,
+    (ProgressPhase.TESTING, ProgressStep.TOOLS_LIST_TEST): 60,
+    (ProgressPhase.TESTING, ProgressStep.TOOLS_CALL_TEST): 70,
+    (ProgressPhase.TESTING, ProgressStep.VALIDATION_COMPLETE): 80,
+    (ProgressPhase.TESTING, ProgressStep.INTEGRATION_READY): 90,
+    (ProgressPhase.TESTING, ProgressStep.TESTING_COMPLETE): 100,
+}
+
+
 @dataclass
 class ProgressEvent:
     """Structured progress event for tracking agent creation progress."""
@@ -75,8 +106,8 @@ class ProgressEvent:
         """Convert to dictionary for JSON serialization."""
         return {
             "type": "progress",
-            "phase": self.phase.value,
-            "step": self.step.value,
+            "phase": _PHASE_VALUES[self.phase],
+            "step": _STEP_VALUES[self.step],
             "percentage": self.percentage,
             "message": self.message,
             "data": self.data or {},
@@ -110,7 +141,7 @@ class ProgressEmitter:
         self.callback = callback
         self.current_step: Optional[ProgressStep] = None
         self.start_time = time.time()
-        self.last_emit_time = 0.0
+        self.last_emit_ns = -_EMIT_INTERVAL_NS
         self.emit_count = 0
     
     def emit(self, 
@@ -133,8 +164,8 @@ class ProgressEmitter:
             The emitted ProgressEvent
         """
         # Throttle rapid emissions (min 100ms between events)
-        current_time = time.time()
-        if not force and current_time - self.last_emit_time < 0.1:
+        now_ns = time.monotonic_ns()
+        if not force and now_ns - self.last_emit_ns < _EMIT_INTERVAL_NS:
             # Skip rapid emissions to avoid overwhelming the client
             return None
         
@@ -147,11 +178,12 @@ class ProgressEmitter:
         )
         
         self.current_step = step
-        self.last_emit_time = current_time
+        self.last_emit_ns = now_ns
         self.emit_count += 1
         
         # Log for debugging
-        logger.debug(f"Progress: {self.phase.value}.{step.value} ({percentage}%): {message}")
+        logger.debug("Progress: %s.%s (%s%%): %s", _PHASE_VALUES[self.phase],
+                     _STEP_VALUES[step], percentage, message)
         
         # Call callback if provided
         if self.callback:
@@ -221,39 +253,8 @@ class ProgressEmitter:
         return time.time() - self.start_time
     
     def _get_current_percentage(self) -> int:
-        """Get current percentage based on phase and step."""
-        # Default mapping if not explicitly provided
-        phase_steps = {
-            ProgressPhase.GENERATION: [
-                (ProgressStep.PROMPT_CONSTRUCTION, 10),
-                (ProgressStep.LLM_API_CALL, 30),
-                (ProgressStep.RESPONSE_RECEIVED, 40),
-                (ProgressStep.JSON_PARSING, 50),
-                (ProgressStep.STRUCTURE_VALIDATION, 60),
-                (ProgressStep.CODE_CLEANING, 70),
-                (ProgressStep.GENERATION_COMPLETE, 100)
-            ],
-            ProgressPhase.TESTING: [
-                (ProgressStep.SAVING_FILES, 10),
-                (ProgressStep.STARTING_PROCESS, 20),
-                (ProgressStep.WAITING_FOR_BOOT, 30),
-                (ProgressStep.WEBSOCKET_CONNECTION, 40),
-                (ProgressStep.AGENT_REGISTRATION, 50),
-                (ProgressStep.TOOLS_LIST_TEST, 60),
-                (ProgressStep.TOOLS_CALL_TEST, 70),
-                (ProgressStep.VALIDATION_COMPLETE, 80),
-                (ProgressStep.INTEGRATION_READY, 90),
-                (ProgressStep.TESTING_COMPLETE, 100)
-            ]
-        }
-        
-        steps = phase_steps.get(self.phase, [])
-        for step_def, percentage in steps:
-            if self.current_step == step_def:
-                return percentage
-        
-        # Default to 0 if not found
-        return 0
+        """Get current percentage based on phase and step (0 if unmapped)."""
+        return _STEP_PERCENTAGES.get((self.phase, self.current_step), 0)
 
 
 def create_log_event(message: str, status: str = "log") -> str:
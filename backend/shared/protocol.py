@@ -79,71 +79,131 @@ def _require_snake_case(value: object, field_name: str) -> str:
         raise ProtocolValidationError(f"{field_name} must be a snake-case value")
     return value
 
+
+# Dataclass field names, reflected once per class: every encode and every
+# strict ``from_dict`` needs them, and ``fields()`` rebuilds them per call.
+_FIELD_NAMES: Dict[type, tuple] = {}
+_FIELD_SETS: Dict[type, frozenset] = {}
+
+
+def _field_names(cls: type) -> tuple:
+    """Field names of dataclass ``cls`` in declaration order."""
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = tuple(item.name for item in fields(cls))
+    return names
+
+
+def _field_set(cls: type) -> frozenset:
+    """Field names of dataclass ``cls`` for membership and equality checks."""
+    names = _FIELD_SETS.get(cls)
+    if names is None:
+        names = _FIELD_SETS[cls] = frozenset(_field_names(cls))
+    return names
+
 # --- Base Message ---
 @dataclass
 class Message:
     type: str
 
     def to_json(self) -> str:
-        return json.dumps(asdict(self))
+        return json.dumps(self._wire_dict())
+
+    def _wire_dict(self) -> Dict[str, Any]:
+        """This message's fields as a shallow dict, ready for ``json.dumps``.
+
+        ``asdict`` deep-copies every nested container (a render's whole
+        component tree) only for the encoder to read it once. Wire fields
+        hold plain JSON values, so they are read directly; messages that
+        nest a dataclass (``RegisterAgent``, ``RegisterUI``) keep their own
+        ``asdict``-based encoders.
+        """
+        return {name: getattr(self, name) for name in _field_names(type(self))}
 
     @staticmethod
     def from_json(json_str: str) -> 'Message':
-        data = json.loads(json_str)
+        return Message.from_dict(json.loads(json_str))
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'Message':
+        """Materialize an already-parsed frame without a second ``json.loads``."""
         msg_type = data.get('type')
-        if msg_type == 'mcp_request':
-            return MCPRequest(**data)
-        elif msg_type == 'mcp_response':
-            return MCPResponse(**data)
-        elif msg_type == 'ui_event':
-            return UIEvent(**data)
-        elif msg_type == 'ui_render':
-            return UIRender(**data)
-        elif msg_type == 'ui_update':
-            return UIUpdate(**data)
-        elif msg_type == 'ui_append':
-            return UIAppend(**data)
-        elif msg_type == 'ui_upsert':
-            return UIUpsert(**data)
-        elif msg_type == 'auth_required':
-            return AuthRequired(**data)
-        elif msg_type == 'register_agent':
-            return RegisterAgent.from_json(json_str)
-        elif msg_type == 'register_ui':
-            return RegisterUI.from_json(json_str)
-        elif msg_type == 'tool_progress':
-            return ToolProgress(**data)
-        elif msg_type == 'tool_stream_data':
-            return ToolStreamData(**data)
-        elif msg_type == 'tool_stream_end':
-            return ToolStreamEnd(**data)
-        elif msg_type == 'tool_stream_cancel':
-            return ToolStreamCancel(**data)
-        elif msg_type == 'audit_append':
-            return AuditAppend(**data)
-        elif msg_type == 'llm_config_set':
-            return LLMConfigSet(**data)
-        elif msg_type == 'llm_config_clear':
-            return LLMConfigClear(**data)
-        elif msg_type == 'llm_config_ack':
-            return LLMConfigAck(**data)
-        elif msg_type == 'llm_usage_report':
-            return LLMUsageReport(**data)
-        elif msg_type == 'agent_hop_request':
-            return AgentHopRequest(**data)
-        elif msg_type == 'agent_hop_response':
-            return AgentHopResponse(**data)
-        elif msg_type == 'conversation_snapshot':
-            return ConversationSnapshot.from_dict(data)
-        elif msg_type == 'conversation_commit_ready':
-            return ConversationCommitReady.from_dict(data)
-        elif msg_type == 'operation_status':
-            return OperationStatus.from_dict(data)
-        elif msg_type == 'agent_lifecycle':
-            return AgentLifecycle.from_dict(data)
-        elif msg_type == 'agent_host_registered':
-            return AgentHostRegistered.from_dict(data)
-        return Message(**data)
+        if not isinstance(msg_type, str):
+            return Message(**data)
+        decode = _MESSAGE_DECODERS.get(msg_type)
+        if decode is not None:
+            return decode(data)
+        return _MESSAGE_TYPES.get(msg_type, Message)(**data)
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WS = re.compile(r"[ \t\n\r]*")
+
+
+def _decode_object_spans(text: str, idx: int, descend: Optional[str] = None):
+    """Decode the JSON object at ``text[idx]`` recording each member's span.
+
+    Returns ``(obj, spans, nested, end)`` where ``spans`` maps member name to
+    the ``(start, end)`` slice of its raw value text. When ``descend`` names
+    a member whose value is an object, that object is decoded the same way
+    (once, not twice) and its spans are returned as ``nested``. Raises
+    ``ValueError`` on anything that is not a well-formed object.
+    """
+    idx = _JSON_WS.match(text, idx).end()
+    if text[idx:idx + 1] != "{":
+        raise ValueError("expected a JSON object")
+    idx = _JSON_WS.match(text, idx + 1).end()
+    obj: Dict[str, Any] = {}
+    spans: Dict[str, tuple] = {}
+    nested: Dict[str, tuple] = {}
+    if text[idx:idx + 1] == "}":
+        return obj, spans, nested, idx + 1
+    while True:
+        if text[idx:idx + 1] != '"':
+            raise ValueError("expected a member name")
+        key, idx = json.decoder.scanstring(text, idx + 1)
+        idx = _JSON_WS.match(text, idx).end()
+        if text[idx:idx + 1] != ":":
+            raise ValueError("expected ':'")
+        idx = _JSON_WS.match(text, idx + 1).end()
+        if key == descend and text[idx:idx + 1] == "{":
+            value, nested, _, end = _decode_object_spans(text, idx)
+        else:
+            value, end = _JSON_DECODER.raw_decode(text, idx)
+        obj[key] = value
+        spans[key] = (idx, end)
+        idx = _JSON_WS.match(text, end).end()
+        sep = text[idx:idx + 1]
+        if sep == ",":
+            idx = _JSON_WS.match(text, idx + 1).end()
+        elif sep == "}":
+            return obj, spans, nested, idx + 1
+        else:
+            raise ValueError("expected ',' or '}'")
+
+
+def decode_agent_frame(text: str) -> 'Message':
+    """``Message.from_json`` for agent frames that keeps raw tool output.
+
+    An ``mcp_response`` is decoded in a single pass that also records where
+    ``result`` (and ``result["_data"]``) sit in the frame, so the response
+    carries their original JSON text. Anything unusual (not an object,
+    trailing data, a decoding error) falls back to ``Message.from_json``.
+    """
+    try:
+        data, spans, nested, end = _decode_object_spans(text, 0, descend="result")
+        if _JSON_WS.match(text, end).end() != len(text):
+            raise ValueError("trailing data")
+    except ValueError:
+        return Message.from_json(text)
+    msg = Message.from_dict(data)
+    if isinstance(msg, MCPResponse) and "result" in spans:
+        start, stop = spans["result"]
+        msg.raw_result_json = text[start:stop]
+        if "_data" in nested:
+            start, stop = nested["_data"]
+            msg.raw_data_json = text[start:stop]
+    return msg
+
 
 # --- MCP Protocol Wrappers ---
 @dataclass
@@ -184,6 +244,16 @@ class MCPResponse(Message):
     # context closes; agents do not set it.
     correlation_id: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        # Raw JSON text of ``result`` (and of ``result["_data"]``) exactly as
+        # the agent serialized it, set by :func:`decode_agent_frame` so the
+        # orchestrator can hand the tool output to the LLM without re-encoding
+        # the dict it just decoded. Plain instance attributes, not dataclass
+        # fields: they never appear on the wire or in equality. Tool results
+        # are read-only after receipt.
+        self.raw_result_json: Optional[str] = None
+        self.raw_data_json: Optional[str] = None
+
 @dataclass
 class AgentHopRequest(Message):
     """056 US1 — an agent's request for a MEDIATED hop to a peer agent's tool.
@@ -339,7 +409,7 @@ class UIRender(Message):
     speech: Optional[Dict[str, str]] = None
 
     def to_json(self) -> str:
-        data = asdict(self)
+        data = self._wire_dict()
         if data.get("speech") is None:
             data.pop("speech", None)
         return json.dumps(data)
@@ -375,7 +445,7 @@ class UIUpsert(Message):
     speech: Optional[Dict[str, str]] = None
 
     def to_json(self) -> str:
-        data = asdict(self)
+        data = self._wire_dict()
         if data.get("speech") is None:
             data.pop("speech", None)
         return json.dumps(data)
@@ -480,7 +550,7 @@ class ConversationCommitReady(Message):
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "ConversationCommitReady":
-        expected = {item.name for item in fields(cls)}
+        expected = _field_set(cls)
         if set(data) != expected:
             raise ProtocolValidationError(
                 "conversation_commit_ready must contain exactly its canonical fields"
@@ -609,7 +679,7 @@ class ConversationSnapshot(Message):
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "ConversationSnapshot":
-        expected = {item.name for item in fields(cls)}
+        expected = _field_set(cls)
         if set(data) != expected:
             raise ProtocolValidationError(
                 "conversation_snapshot must contain exactly its canonical fields"
@@ -714,7 +784,7 @@ class OperationStatus(Message):
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "OperationStatus":
-        expected = {item.name for item in fields(cls)}
+        expected = _field_set(cls)
         if set(data) != expected:
             raise ProtocolValidationError(
                 "operation_status must contain exactly its canonical fields"
@@ -796,7 +866,7 @@ class AgentLifecycle(Message):
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "AgentLifecycle":
-        expected = {item.name for item in fields(cls)}
+        expected = _field_set(cls)
         if set(data) != expected:
             raise ProtocolValidationError(
                 "agent_lifecycle must contain exactly its canonical fields"
@@ -971,7 +1041,7 @@ class RuntimeFence:
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "RuntimeFence":
-        expected = {item.name for item in fields(cls)}
+        expected = _field_set(cls)
         if set(data) != expected:
             raise ProtocolValidationError(
                 "runtime fence must contain exactly its canonical fields"
@@ -1045,7 +1115,11 @@ class RegisterAgent(Message):
 
     @staticmethod
     def from_json(json_str: str) -> 'RegisterAgent':
-        data = json.loads(json_str)
+        return RegisterAgent.from_dict(json.loads(json_str))
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'RegisterAgent':
+        data = dict(data)
         if 'agent_card' in data and data['agent_card']:
             data['agent_card'] = AgentCard.from_dict(data['agent_card'])
         return RegisterAgent(**data)
@@ -1193,7 +1267,7 @@ class AgentHostRegistration:
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "AgentHostRegistration":
-        expected = {item.name for item in fields(cls)}
+        expected = _field_set(cls)
         if set(data) != expected:
             raise ProtocolValidationError(
                 "agent_host must contain exactly its structured v2 fields"
@@ -1235,7 +1309,7 @@ class AgentHostRegistered(Message):
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "AgentHostRegistered":
-        expected = {item.name for item in fields(cls)}
+        expected = _field_set(cls)
         if set(data) != expected:
             raise ProtocolValidationError(
                 "agent_host_registered must contain exactly its canonical fields"
@@ -1461,10 +1535,13 @@ class RegisterUI(Message):
 
     @staticmethod
     def from_json(json_str: str) -> 'RegisterUI':
-        data = json.loads(json_str)
+        return RegisterUI.from_dict(json.loads(json_str))
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'RegisterUI':
         # Filter unknown keys so older servers parsing newer payloads (and
         # vice versa) don't crash on additive fields.
-        valid_fields = {f.name for f in RegisterUI.__dataclass_fields__.values()}
+        valid_fields = _field_set(RegisterUI)
         data = {k: v for k, v in data.items() if k in valid_fields}
         if isinstance(data.get("agent_host"), dict):
             data["agent_host"] = AgentHostRegistration.from_dict(data["agent_host"])
@@ -1527,6 +1604,41 @@ class LLMUsageReport(Message):
     at: str = ""                 # ISO 8601 timestamp
 
 
+# ``Message.from_dict`` dispatch: one lookup per frame instead of a chain of
+# string compares. Types with a strict or nested decoder use its from_dict;
+# the rest are built straight from their fields.
+_MESSAGE_TYPES: Dict[str, type] = {
+    'mcp_request': MCPRequest,
+    'mcp_response': MCPResponse,
+    'ui_event': UIEvent,
+    'ui_render': UIRender,
+    'ui_update': UIUpdate,
+    'ui_append': UIAppend,
+    'ui_upsert': UIUpsert,
+    'auth_required': AuthRequired,
+    'tool_progress': ToolProgress,
+    'tool_stream_data': ToolStreamData,
+    'tool_stream_end': ToolStreamEnd,
+    'tool_stream_cancel': ToolStreamCancel,
+    'audit_append': AuditAppend,
+    'llm_config_set': LLMConfigSet,
+    'llm_config_clear': LLMConfigClear,
+    'llm_config_ack': LLMConfigAck,
+    'llm_usage_report': LLMUsageReport,
+    'agent_hop_request': AgentHopRequest,
+    'agent_hop_response': AgentHopResponse,
+}
+_MESSAGE_DECODERS: Dict[str, Any] = {
+    'register_agent': RegisterAgent.from_dict,
+    'register_ui': RegisterUI.from_dict,
+    'conversation_snapshot': ConversationSnapshot.from_dict,
+    'conversation_commit_ready': ConversationCommitReady.from_dict,
+    'operation_status': OperationStatus.from_dict,
+    'agent_lifecycle': AgentLifecycle.from_dict,
+    'agent_host_registered': AgentHostRegistered.from_dict,
+}
+
+
 # --- Streaming tool metadata validation (001-tool-stream-ui) ---
 def validate_streaming_metadata(metadata: Dict[str, Any]) -> None:
     """Validate the streaming-related fields of an ``AgentSkill.metadata``.
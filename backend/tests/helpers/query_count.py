@@ -9,16 +9,17 @@ Usage:
     assert counter.count == 1
     assert "FROM chats" in counter.queries[0]
 
-``count_queries`` wraps the instance's ``execute``/``fetch_one``/``fetch_all``
-methods, so every database round trip made through that ``Database`` object
-(including calls issued from other threads, e.g. ``asyncio.to_thread``) is
-counted and its SQL text recorded. The wrapping is reverted on exit.
+``count_queries`` wraps the instance's ``execute``/``execute_many``/
+``fetch_one``/``fetch_all`` methods, so every database call made through that
+``Database`` object (including calls issued from other threads, e.g.
+``asyncio.to_thread``) is counted and its SQL text recorded; a batch counts
+once. The wrapping is reverted on exit.
 """
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from typing import List
 
-_WRAPPED_METHODS = ("execute", "fetch_one", "fetch_all")
+_WRAPPED_METHODS = ("execute", "execute_many", "fetch_one", "fetch_all")
 _MISSING = object()
 
 
@@ -32,7 +33,7 @@ class QueryCounter:
 
 @contextmanager
 def count_queries(db):
-    """Count every execute/fetch_one/fetch_all round trip made through ``db``.
+    """Count every execute/execute_many/fetch_one/fetch_all call made through ``db``.
 
     Yields a :class:`QueryCounter` whose ``count`` and ``queries`` update as
     calls happen. Accepts any object exposing the ``shared.database.Database``
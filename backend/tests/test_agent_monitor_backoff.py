@@ -0,0 +1,70 @@
+"""Agent discovery monitor backoff.
+
+``_monitor_agents`` skips ports that already belong to a connected agent,
+backs its sweep interval off while the agent set stays the same, and is woken
+early when an agent disconnects. Card probes reuse one pooled HTTP session.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from orchestrator import orchestrator as orch_mod  # noqa: E402
+from orchestrator.orchestrator import Orchestrator  # noqa: E402
+
+
+async def test_monitor_backs_off_and_wakes():
+    orch = Orchestrator.__new__(Orchestrator)
+    orch.agents = {"a-1": object()}
+    orch.agent_urls = {"a-1": "http://localhost:9001"}
+    probed: list = []
+    timeouts: list = []
+
+    async def discover_agent(url):
+        probed.append(url)
+
+    async def monitor_sleep(wake, timeout):
+        timeouts.append(timeout)
+        if len(timeouts) >= 5:
+            raise asyncio.CancelledError
+        if len(timeouts) == 3:
+            wake.set()
+            return await Orchestrator._agent_monitor_sleep(orch, wake, timeout)
+        return False
+
+    orch.discover_agent = discover_agent
+    orch._agent_monitor_sleep = monitor_sleep
+    with pytest.raises(asyncio.CancelledError):
+        await orch._monitor_agents(9000, 3)
+
+    assert "http://localhost:9001" not in probed
+    assert probed[:2] == ["http://localhost:9000", "http://localhost:9002"]
+    lo = orch_mod._AGENT_MONITOR_MIN_INTERVAL
+    assert timeouts[:3] == [lo * 2, lo * 4, lo * 8]
+    # The wake cut the third sleep short, so the next sweep starts over.
+    assert timeouts[3] == lo
+
+
+
+async def test_monitor_sleep_reports_whether_it_was_woken():
+    orch = Orchestrator.__new__(Orchestrator)
+    wake = asyncio.Event()
+    assert await orch._agent_monitor_sleep(wake, 0.01) is False
+    wake.set()
+    assert await orch._agent_monitor_sleep(wake, 5) is True
+
+async def test_discovery_probes_share_one_session():
+    orch = Orchestrator.__new__(Orchestrator)
+    session = orch._http_session()
+    try:
+        assert orch._http_session() is session
+    finally:
+        await session.close()
+    replacement = orch._http_session()
+    assert replacement is not session and not replacement.closed
+    await replacement.close()
@@ -361,11 +361,11 @@ def test_cookie_session_real_mode_serves_export(client, orch, monkeypatch):
     monkeypatch.setenv("KEYCLOAK_CLIENT_ID", "astral-frontend")
 
     async def _sess(request):
-        return {"access_token": "signed.jwt.token", "refresh_token": "",
+        return {"access_token": "eyJhbGciOiJSUzI1NiJ9.e30.sig", "refresh_token": "",
                 "sub": USER_ID, "created_at": 0, "resumed": True, "sid": "s"}
     monkeypatch.setattr(web_auth, "ensure_session", _sess)
 
-    async def _jwks(url, token=None):
+    async def _jwks(url, token=None, header=None):
         return {"keys": [{"kid": "k"}]}
     monkeypatch.setattr("shared.jwks_cache.get_jwks", _jwks)
     monkeypatch.setattr(
@@ -274,7 +274,7 @@ async def test_validate_token_rejects_iss_mismatch(monkeypatch):
 
     fake = SimpleNamespace()
     fake.validate_token = types.MethodType(Orchestrator.validate_token, fake)
-    result = await fake.validate_token("a.b.c")
+    result = await fake.validate_token("eyJhbGciOiJSUzI1NiJ9.e30.sig")
     assert result is None
 
 
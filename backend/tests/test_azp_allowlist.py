@@ -37,3 +37,12 @@ def test_allowlist_parses_csv_and_whitespace(monkeypatch):
     monkeypatch.setenv("KEYCLOAK_ALLOWED_AZP", " astral-desktop , astral-cli ,, ")
     assert auth_clients.allowed_azps() == {"astral-frontend", "astral-desktop", "astral-cli"}
     assert not auth_clients.is_azp_allowed("evil-client")
+
+
+def test_allowlist_change_applies_without_restart(monkeypatch):
+    monkeypatch.setenv("KEYCLOAK_CLIENT_ID", "astral-frontend")
+    monkeypatch.setenv("KEYCLOAK_ALLOWED_AZP", "astral-desktop")
+    assert auth_clients.is_azp_allowed("astral-desktop")
+    monkeypatch.setenv("KEYCLOAK_ALLOWED_AZP", "astral-cli")
+    assert not auth_clients.is_azp_allowed("astral-desktop")
+    assert auth_clients.is_azp_allowed("astral-cli")
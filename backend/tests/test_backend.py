@@ -104,6 +104,45 @@ class TestProtocolMessages:
         render = Message.from_json('{"type": "ui_render", "components": []}')
         assert isinstance(render, UIRender)
 
+    def test_message_from_dict_dispatch_covers_every_wire_type(self):
+        from shared import protocol
+        from shared.protocol import Message
+        decoders = {**protocol._MESSAGE_TYPES,
+                    **{t: getattr(protocol, d.__qualname__.split(".")[0])
+                       for t, d in protocol._MESSAGE_DECODERS.items()}}
+        for msg_type, cls in decoders.items():
+            assert cls.__dataclass_fields__["type"].default == msg_type
+        assert type(Message.from_dict({"type": "ui_render"})) is protocol.UIRender
+        assert type(Message.from_dict({"type": "unknown"})) is Message
+        assert type(Message.from_dict({"type": ["ui_render"]})) is Message
+
+    def test_decode_agent_frame_matches_from_json(self):
+        from shared.protocol import MCPResponse, Message, decode_agent_frame
+        frames = [
+            MCPResponse(request_id="r", result={"_data": {"k": [1, {"a": None}]}},
+                        ui_components=[{"type": "text"}]).to_json(),
+            '{ "type" : "mcp_response" , "request_id":"r", "result" : "plain" }',
+            '{"type": "ui_event", "action": "x", "payload": {}}',
+            '{"type": "mcp_response", "result": {}}',
+        ]
+        for frame in frames:
+            assert decode_agent_frame(frame) == Message.from_json(frame)
+        spaced = decode_agent_frame(frames[1])
+        assert spaced.raw_result_json == '"plain"'
+        with pytest.raises(ValueError):
+            decode_agent_frame('{"type": "mcp_response"} trailing')
+
+    def test_message_from_dict_matches_from_json_without_mutating(self):
+        from shared.protocol import AgentCard, Message, RegisterAgent, UIEvent
+        evt = Message.from_dict({"type": "ui_event", "action": "test", "payload": {}})
+        assert isinstance(evt, UIEvent) and evt.action == "test"
+        frame = {"type": "register_agent",
+                 "agent_card": {"name": "A", "description": "d", "agent_id": "a-1"}}
+        reg = Message.from_dict(frame)
+        assert isinstance(reg, RegisterAgent)
+        assert isinstance(reg.agent_card, AgentCard)
+        assert isinstance(frame["agent_card"], dict)
+
 
 # =============================================================================
 # PRIMITIVES TESTS
@@ -654,5 +693,40 @@ class TestLLMRouting:
             loop.close()
 
 
+    def test_agent_disconnect_fails_its_pending_requests(self, orchestrator):
+        loop = asyncio.new_event_loop()
+        try:
+            mine, other = loop.create_future(), loop.create_future()
+            orchestrator.pending_requests.update({"req-a": mine, "req-b": other})
+            orchestrator._pending_request_agent.update(
+                {"req-a": "agent-1", "req-b": "agent-2"})
+
+            orchestrator._fail_pending_requests("agent-1")
+
+            assert mine.result().error["retryable"] is True
+            assert "disconnected" in mine.result().error["message"]
+            assert not other.done()
+        finally:
+            for key in ("req-a", "req-b"):
+                orchestrator.pending_requests.pop(key, None)
+                orchestrator._pending_request_agent.pop(key, None)
+            loop.close()
+
+    def test_ui_client_registry_keeps_connect_order(self):
+        from orchestrator.orchestrator import _UIClientRegistry
+        reg = _UIClientRegistry()
+        a, b, c = object(), object(), object()
+        for ws in (a, b, c):
+            reg.append(ws)
+        reg.remove(b)
+        assert list(reg) == [a, c] and len(reg) == 2
+        assert b not in reg and a in reg
+        # Iteration walks a snapshot, so a fan-out may see clients leave.
+        for ws in reg:
+            reg.remove(ws)
+        assert len(reg) == 0
+        with pytest.raises(ValueError):
+            reg.remove(a)
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
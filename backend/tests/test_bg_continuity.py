@@ -409,3 +409,20 @@ async def test_completion_with_no_real_sockets_stays_unnotified(orch):
         user_id, {"type": "task_completed", "payload": {"task_id": task.task_id}})
     assert delivered == 0, "vws must never count as a notified device"
     orch.ui_sessions.pop(vws, None)
+
+
+async def test_send_to_user_sockets_reaches_every_device_once(orch):
+    """The multi-device fan serializes once and reaches each of the user's
+    real sockets exactly once; another user's socket is never touched."""
+    user_id = f"bgc-{uuid.uuid4().hex[:8]}"
+    ws1, ws2 = _capture_socket(orch, user_id), _capture_socket(orch, user_id)
+    other = _capture_socket(orch, f"bgc-{uuid.uuid4().hex[:8]}")
+    delivered = await orch._send_to_user_sockets(
+        user_id, {"type": "task_completed", "payload": {"task_id": "t"}})
+    assert delivered == 2
+    assert [f["type"] for f in ws1.task.outputs] == ["task_completed"]
+    assert [f["type"] for f in ws2.task.outputs] == ["task_completed"]
+    assert other.task.outputs == []
+    for ws in (ws1, ws2, other):
+        orch.ui_sessions.pop(ws, None)
+        orch.ui_clients.remove(ws)
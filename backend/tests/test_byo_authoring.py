@@ -399,6 +399,27 @@ async def test_backend_coupled_tools_file_is_refused_and_not_delivered(real_life
     assert aa._bundle_files(gen) == {}      # nothing to ship
 
 
+async def test_uncompilable_tools_file_gets_one_repair_round(real_lifecycle):
+    real_lifecycle.generator.generate_tools_file = AsyncMock(
+        return_value="def greet(:\n    pass\n")
+    gen = await _gen_byo(real_lifecycle, "ua-repair-uown", name="Byo Repair")
+    assert gen["status"] != "error"
+    real_lifecycle.generator.refine_tools_file.assert_awaited()
+    fix_prompt = real_lifecycle.generator.refine_tools_file.await_args_list[0].kwargs
+    assert "Syntax error in mcp_tools.py" in fix_prompt["user_message"]
+    assert aa._bundle_files(gen)["mcp_tools.py"] == CANNED_TOOLS
+
+
+async def test_a_repair_that_still_does_not_compile_fails_the_draft(real_lifecycle):
+    broken = "def greet(:\n    pass\n"
+    real_lifecycle.generator.generate_tools_file = AsyncMock(return_value=broken)
+    real_lifecycle.generator.refine_tools_file = AsyncMock(return_value=broken)
+    gen = await _gen_byo(real_lifecycle, "ua-norepair-uown", name="Byo Norepair")
+    assert gen["status"] == "error"
+    assert "Syntax error in mcp_tools.py" in (gen["error_message"] or "")
+    real_lifecycle.generator.refine_tools_file.assert_awaited_once()
+
+
 async def test_authoring_refuses_to_deliver_an_empty_bundle():
     o = _fake_orch()
     o.lifecycle_manager.generate_code = AsyncMock(return_value={"status": "generated"})
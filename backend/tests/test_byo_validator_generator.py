@@ -202,3 +202,15 @@ async def test_aresolve_client_degrades_to_none_when_the_resolver_raises():
     # A broken resolver must NOT crash codegen — it degrades to "no client",
     # which the callers surface as an honest "LLM not configured".
     assert await gen._aresolve_client() == (None, None)
+
+
+# ── generator: reply → source ────────────────────────────────────────────────
+
+def test_extract_code_takes_the_fenced_block_out_of_surrounding_prose():
+    from orchestrator.agent_generator import _extract_code
+    reply = "Here is the file:\n```python\nTOOL_REGISTRY = {}\n```\nEnjoy."
+    assert _extract_code(reply) == "TOOL_REGISTRY = {}"
+    assert _extract_code("```python\nx = 1\n```") == "x = 1"
+    # Valid code that merely CONTAINS a fence (a markdown string) is untouched.
+    literal = 'DOC = """\n```\nexample\n```\n"""'
+    assert _extract_code(literal) == literal
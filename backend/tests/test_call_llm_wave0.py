@@ -198,6 +198,14 @@ async def test_transient_error_not_misread_as_param_problem():
         "503 Service Unavailable", {"reasoning_effort": "high"}) == set()
 
 
+async def test_fatal_error_is_not_retried():
+    comp = _FakeCompletions(fail_on=lambda kw: "Error code: 401 - Invalid username")
+    orch = _bare_orch(comp)
+    with pytest.raises(Exception, match="401"):
+        await orch._call_llm(None, [{"role": "user", "content": "hi"}])
+    assert len(comp.calls) == 1
+
+
 async def test_named_param_only_drops_that_param():
     drop = Orchestrator._llm_unsupported_extras(
         "400 unrecognized parameter: response_format",
@@ -212,6 +220,48 @@ async def test_generic_400_drops_all_extras():
     assert drop == {"response_format", "reasoning_effort"}
 
 
+# --------------------------------------------------------------------------
+# Prefix-cache routing hint on the chat loop's route calls
+# --------------------------------------------------------------------------
+
+async def _route_call(orch):
+    from orchestrator.orchestrator import _NARRATIVE_STREAM_CHAT
+    token = _NARRATIVE_STREAM_CHAT.set("chat-1")
+    try:
+        return await orch._call_llm(None, [{"role": "user", "content": "hi"}])
+    finally:
+        _NARRATIVE_STREAM_CHAT.reset(token)
+
+
+async def test_prompt_cache_key_sent_on_chat_route_calls(monkeypatch):
+    from shared.feature_flags import flags
+    monkeypatch.setitem(flags._flags, "context_engineering", True)
+    comp = _FakeCompletions()
+    orch = _bare_orch(comp)
+    await _route_call(orch)
+    await orch._call_llm(None, [{"role": "user", "content": "hi"}])
+    assert comp.calls[0]["prompt_cache_key"] == "chat:chat-1"
+    assert "prompt_cache_key" not in comp.calls[1]      # not a chat route call
+
+
+async def test_prompt_cache_key_off_by_default_and_probed(monkeypatch):
+    from shared.feature_flags import flags
+    monkeypatch.setitem(flags._flags, "context_engineering", False)
+    comp = _FakeCompletions()
+    await _route_call(_bare_orch(comp))
+    assert "prompt_cache_key" not in comp.calls[0]
+
+    monkeypatch.setitem(flags._flags, "context_engineering", True)
+
+    def fail_on(kw):
+        return "400 unknown parameter: prompt_cache_key" if "prompt_cache_key" in kw else None
+
+    comp = _FakeCompletions(fail_on=fail_on)
+    msg, _ = await _route_call(_bare_orch(comp))
+    assert msg is not None
+    assert "prompt_cache_key" not in comp.calls[-1]
+
+
 # --------------------------------------------------------------------------
 # C-N14 — enforced structured output
 # --------------------------------------------------------------------------
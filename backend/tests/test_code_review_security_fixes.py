@@ -46,6 +46,15 @@ def test_sandbox_still_allows_legitimate_expressions(expr, row, expected):
     assert ExpressionEvaluator(expr).evaluate(row) == expected
 
 
+def test_cached_checks_never_launder_a_rejected_expression():
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            ExpressionEvaluator("row.__class__")
+    first, second = (ExpressionEvaluator("row['x'] + 1") for _ in range(2))
+    assert first.evaluate({"x": 1}) == 2 and second.evaluate({"x": 10}) == 11
+    assert first.evaluate({"x": 2}) == 3
+
+
 # ---------------------------------------------------------------------------
 # Finding 4 — is_tool_in_scope must not launder authority via the fallback
 # ---------------------------------------------------------------------------
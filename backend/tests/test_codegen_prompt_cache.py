@@ -0,0 +1,91 @@
+"""Draft codegen prompt reuse: the ``FF_CODEGEN_PROMPT_CACHE`` answer cache and
+the stable system prefix the provider can cache.
+
+An identical ``generate_tools_file`` prompt on the same model and credential is
+answered from the generator's bounded cache; the lifecycle forgets any answer
+that did not pass its gates unchanged, and the flag OFF always calls the LLM.
+"""
+from __future__ import annotations
+
+import os
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from orchestrator.agent_generator import AgentCodeGenerator  # noqa: E402
+from shared.feature_flags import flags  # noqa: E402
+
+_SPEC = [{"name": "t", "description": "d"}]
+
+
+def _client(api_key="k", code="TOOL_REGISTRY = {}"):
+    client = MagicMock()
+    client.base_url = "http://llm.invalid/v1"
+    client.api_key = api_key
+    client.chat.completions.create.return_value = SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=code))])
+    return client
+
+
+async def _generate(gen):
+    return await gen.generate_tools_file(
+        agent_name="X", description="d", tools_spec=_SPEC)
+
+
+@pytest.fixture
+def cache_on(monkeypatch):
+    monkeypatch.setitem(flags._flags, "codegen_prompt_cache", True)
+
+
+async def test_identical_prompt_is_answered_from_the_cache(cache_on):
+    client = _client()
+    gen = AgentCodeGenerator(llm_client=client, llm_model="m")
+    assert await _generate(gen) == await _generate(gen) == "TOOL_REGISTRY = {}"
+    assert client.chat.completions.create.call_count == 1
+
+
+async def test_forgotten_code_is_generated_again(cache_on):
+    client = _client()
+    gen = AgentCodeGenerator(llm_client=client, llm_model="m")
+    code = await _generate(gen)
+    gen.forget_tools_file(code)
+    await _generate(gen)
+    assert client.chat.completions.create.call_count == 2
+
+
+async def test_another_credential_never_shares_an_entry(cache_on):
+    first, second = _client("owner-a"), _client("owner-b")
+    gen = AgentCodeGenerator(llm_client=first, llm_model="m")
+    await _generate(gen)
+    gen.llm_client = second
+    await _generate(gen)
+    assert second.chat.completions.create.call_count == 1
+
+
+async def test_flag_off_always_calls_the_llm(monkeypatch):
+    monkeypatch.setitem(flags._flags, "codegen_prompt_cache", False)
+    client = _client()
+    gen = AgentCodeGenerator(llm_client=client, llm_model="m")
+    await _generate(gen)
+    await _generate(gen)
+    assert client.chat.completions.create.call_count == 2
+    assert not gen._tools_cache
+
+
+async def test_agent_specifics_stay_out_of_the_shared_system_prefix():
+    client = _client()
+    gen = AgentCodeGenerator(llm_client=client, llm_model="m")
+    await gen.generate_tools_file(agent_name="Alpha", description="first",
+                                  tools_spec=_SPEC)
+    await gen.generate_tools_file(agent_name="Beta", description="second",
+                                  tools_spec=_SPEC)
+    first, second = (c.kwargs["messages"]
+                     for c in client.chat.completions.create.call_args_list)
+    assert first[0] == second[0]
+    assert "Alpha" not in first[0]["content"]
+    assert "SECURITY RULES" in first[0]["content"]
+    assert "Alpha" in first[1]["content"] and "Beta" in second[1]["content"]
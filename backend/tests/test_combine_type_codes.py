@@ -0,0 +1,114 @@
+"""Combine/condense prompt type codes.
+
+The combine prompt carries a one-line legend of numeric type codes instead of
+per-primitive JSON skeletons; the LLM answers with ``t`` codes and
+``_combine_components_llm`` maps them back to primitive type names before the
+tree validator runs. A model that ignores the legend and emits ``type`` keeps
+working unchanged.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import types
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from orchestrator.orchestrator import (  # noqa: E402
+    _COMBINE_SCHEMA,
+    _COMBINE_TYPE_CODES,
+    Orchestrator,
+    _decode_combine_type_codes,
+)
+
+
+def _fake_orch(reply: str, prompts: list):
+    async def get_system():
+        return object()
+
+    async def _call_llm(websocket, messages, tools_desc=None, temperature=None):
+        prompts.append(messages[-1]["content"])
+        return types.SimpleNamespace(content=reply), None
+
+    fake = types.SimpleNamespace(
+        _llm_store=types.SimpleNamespace(get_system=get_system),
+        _call_llm=_call_llm,
+    )
+    fake._validate_component_tree = types.MethodType(
+        Orchestrator._validate_component_tree, fake)
+    return fake
+
+
+_COMPONENTS = [
+    {"title": "A", "component_type": "metric",
+     "component_data": {"type": "metric", "title": "A", "value": "1"}},
+    {"title": "B", "component_type": "text",
+     "component_data": {"type": "text", "content": "b"}},
+]
+
+
+def test_legend_covers_every_code_once():
+    for code, name in _COMBINE_TYPE_CODES.items():
+        assert f"{code}={name}" in _COMBINE_SCHEMA
+    assert len(set(_COMBINE_TYPE_CODES.values())) == len(_COMBINE_TYPE_CODES)
+
+
+def test_decode_maps_codes_and_keeps_explicit_type():
+    tree = {"t": 2, "title": "x", "content": [
+        {"t": "3", "value": "1"},
+        {"type": "text", "content": "kept"},
+        {"t": 999},
+    ]}
+    _decode_combine_type_codes(tree)
+    assert tree["type"] == "card" and "t" not in tree
+    assert tree["content"][0]["type"] == "metric"
+    assert tree["content"][1] == {"type": "text", "content": "kept"}
+    assert tree["content"][2]["type"] == "999"
+
+
+def test_decode_leaves_data_rows_alone():
+    row = {"t": "12:00", "v": 1}
+    tree = {"t": 6, "children": [
+        {"t": 4, "headers": ["t", "v"], "rows": [[row]], "data": {"t": 5, "v": 2}},
+        {"t": 10, "datasets": [{"t": 1, "data": [1]}]},
+    ]}
+    _decode_combine_type_codes([tree])
+    table, chart = tree["children"]
+    assert (tree["type"], table["type"], chart["type"]) == ("container", "table", "bar_chart")
+    assert row == {"t": "12:00", "v": 1}
+    assert table["data"] == {"t": 5, "v": 2}
+    assert chart["datasets"] == [{"t": 1, "data": [1]}]
+
+
+def test_legend_keeps_value_constraints():
+    for constraint in ("variant:body|h1|h2|h3|caption|markdown", "progress:0.0-1.0",
+                       "variant:default|warning|error|success", "variant:default|detailed",
+                       "variant:info|success|warning|error", "show_percentage", "colors[]"):
+        assert constraint in _COMBINE_SCHEMA
+
+
+async def test_combine_decodes_coded_reply():
+    prompts: list = []
+    reply = json.dumps({"components": [{
+        "component_data": {"t": 2, "title": "Merged", "content": [
+            {"t": 3, "title": "A", "value": "1"}, {"t": 1, "content": "b"}]},
+        "title": "Merged",
+    }]})
+    fake = _fake_orch(reply, prompts)
+    result = await Orchestrator._combine_components_llm(fake, _COMPONENTS)
+    data = result["components"][0]["component_data"]
+    assert data["type"] == "card"
+    assert [c["type"] for c in data["content"]] == ["metric", "text"]
+    assert result["components"][0]["component_type"] == "card"
+    assert _COMBINE_SCHEMA in prompts[0]
+
+
+async def test_combine_accepts_uncoded_reply():
+    reply = json.dumps({"components": [{
+        "component_data": {"type": "card", "title": "M", "content": []},
+        "component_type": "card", "title": "M",
+    }]})
+    result = await Orchestrator._combine_components_llm(
+        _fake_orch(reply, []), _COMPONENTS, mode="condense")
+    assert result["components"][0]["component_data"]["type"] == "card"
@@ -6,9 +6,12 @@ Exercises the two pure helpers directly:
   substitution; on-path moves volatile sections last behind a stable prefix.
 * ``edit_context`` — tombstones stale tool outputs while preserving the
   assistant→tool pairing the API requires.
+* ``clip_tool_output`` — bounds one oversized tool result to an outline plus
+  the head of its text.
 """
 from __future__ import annotations
 
+import json
 import sys
 from pathlib import Path
 
@@ -186,3 +189,27 @@ def test_malformed_input_passes_through():
              _assistant("c0"), _tool("c0", "y" * 1000)]
     out, n = ce.edit_context(weird, keep_last_tool_rounds=0)
     assert n == 1
+
+
+# --------------------------------------------------------------------------
+# clip_tool_output
+# --------------------------------------------------------------------------
+
+def test_small_output_is_returned_unchanged():
+    text = json.dumps({"rows": [1, 2, 3]})
+    assert ce.clip_tool_output(text) is text
+
+
+def test_large_json_output_is_outlined_and_bounded():
+    text = json.dumps({"rows": [[i, "x" * 20] for i in range(2000)], "total": 2000})
+    out = ce.clip_tool_output(text, max_chars=1000)
+    assert len(out) <= 1000
+    assert f"{len(text):,} chars total" in out
+    assert "rows (list, 2000 items)" in out and "total (int)" in out
+    assert out.endswith(text[:len(out) - out.index("\n") - 1])
+
+
+def test_large_plain_text_is_clipped_without_structure():
+    out = ce.clip_tool_output("y" * 5000, max_chars=500)
+    assert len(out) <= 500 and "structure" not in out
+    assert ce.clip_tool_output(None) is None
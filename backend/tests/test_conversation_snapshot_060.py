@@ -692,6 +692,10 @@ def test_transient_scope_is_exact_sequenced_and_never_relabels_snapshots() -> No
     assert json.loads(
         orchestrator._scope_conversation_transient(socket, json.dumps(snapshot))
     ) == snapshot
+    status = json.dumps({"type": "chat_status", "status": "done", "message": ""})
+    assert orchestrator._scope_conversation_transient(socket, status) is status
+    mentions_ui = json.dumps({"type": "chat_status", "message": '"ui_render"'})
+    assert orchestrator._scope_conversation_transient(socket, mentions_ui) == mentions_ui
     assert orchestrator._conversation_scopes[id(socket)]["frame_sequence"] == 2
 
 
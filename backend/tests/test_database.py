@@ -22,6 +22,14 @@ class TestHistoryManagerPostgres(unittest.TestCase):
         )
         self.assertEqual(row['count'], 1)
 
+    def test_init_creates_per_chat_time_indexes(self):
+        hm = HistoryManager(data_dir=self.data_dir)
+        rows = hm.db.fetch_all(
+            "SELECT indexname FROM pg_indexes WHERE indexname IN (?, ?, ?)",
+            ("idx_messages_chat_ts", "idx_saved_components_chat", "idx_chat_files_chat"),
+        )
+        self.assertEqual(len(rows), 3)
+
     def test_create_chat(self):
         hm = HistoryManager(data_dir=self.data_dir)
         chat_id = hm.create_chat()
@@ -54,5 +62,72 @@ class TestHistoryManagerPostgres(unittest.TestCase):
         hm.db.execute("DELETE FROM messages WHERE chat_id = ?", (chat_id,))
         hm.db.execute("DELETE FROM chats WHERE id = ?", (chat_id,))
 
+    def test_message_content_decodes_only_json(self):
+        hm = HistoryManager(data_dir=self.data_dir)
+        chat_id = hm.create_chat()
+        try:
+            for text in ("Hello World", "  [1, 2]", "not {json}", "null"):
+                hm.add_message(chat_id, "user", text)
+            contents = [m["content"] for m in hm.get_chat(chat_id)["messages"]]
+            self.assertEqual(contents, ["Hello World", [1, 2], "not {json}", None])
+        finally:
+            hm.db.execute("DELETE FROM messages WHERE chat_id = ?", (chat_id,))
+            hm.db.execute("DELETE FROM chats WHERE id = ?", (chat_id,))
+
+    def test_append_draft_log_splices_entries_in_order(self):
+        import json
+        import uuid
+        hm = HistoryManager(data_dir=self.data_dir)
+        draft_id = f"log-{uuid.uuid4().hex[:8]}"
+        hm.db.create_draft_agent(draft_id, "log-user", "Log", draft_id, "d")
+        try:
+            hm.db.append_draft_log(draft_id, {"message": "one", "timestamp": 1})
+            hm.db.append_draft_log(draft_id, {"message": 'two "quoted"', "timestamp": 2})
+            log = json.loads(hm.db.get_draft_agent(draft_id)["generation_log"])
+            self.assertEqual([e["message"] for e in log], ["one", 'two "quoted"'])
+            self.assertFalse(hm.db.append_draft_log("missing-draft", {"message": "x"}))
+        finally:
+            hm.db.execute("DELETE FROM draft_agents WHERE id = ?", (draft_id,))
+
+    def test_execute_many_writes_every_row_in_one_call(self):
+        import uuid
+        hm = HistoryManager(data_dir=self.data_dir)
+        user = f"batch-{uuid.uuid4().hex[:8]}"
+        try:
+            hm.db.execute_many(
+                "INSERT INTO agent_scopes (user_id, agent_id, scope, enabled, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(user, "a-1", scope, True, 1) for scope in ("tools:read", "tools:write")],
+            )
+            hm.db.execute_many("DELETE FROM agent_scopes WHERE user_id = ?", [])
+            rows = hm.db.fetch_all(
+                "SELECT scope FROM agent_scopes WHERE user_id = ? ORDER BY scope", (user,))
+            self.assertEqual([r["scope"] for r in rows], ["tools:read", "tools:write"])
+        finally:
+            hm.db.execute("DELETE FROM agent_scopes WHERE user_id = ?", (user,))
+
+    def test_iter_all_streams_rows_and_releases_on_early_close(self):
+        hm = HistoryManager(data_dir=self.data_dir)
+        rows = hm.db.iter_all(
+            "SELECT n FROM generate_series(1, 25) AS n WHERE n > ? ORDER BY n", (0,),
+            batch_size=4)
+        self.assertEqual([next(rows)["n"] for _ in range(3)], [1, 2, 3])
+        rows.close()
+        self.assertEqual(
+            [r["n"] for r in hm.db.iter_all("SELECT n FROM generate_series(1, 9) AS n")],
+            list(range(1, 10)))
+
+    def test_iter_all_discards_the_connection_when_a_fetch_fails(self):
+        from unittest import mock
+        import psycopg2
+        hm = HistoryManager(data_dir=self.data_dir)
+        with mock.patch.object(hm.db, "_release", wraps=hm.db._release) as release:
+            rows = hm.db.iter_all(
+                "SELECT 1 / (n - 5) AS q FROM generate_series(1, 9) AS n", batch_size=2)
+            with self.assertRaises(psycopg2.DataError):
+                list(rows)
+        self.assertTrue(release.call_args.kwargs["discard"])
+        self.assertEqual(hm.db.fetch_one("SELECT 1 AS one")["one"], 1)
+
 if __name__ == '__main__':
     unittest.main()
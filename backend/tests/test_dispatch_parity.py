@@ -196,3 +196,83 @@ async def test_real_agent_hop_cannot_reach_meta_tools(orch):
     through the normal gates (here: no such registered agent)."""
     msg = await _single(orch, tool="create_capability", agent="evil-agent-1")
     assert "No agent available" in msg
+
+
+@pytest.mark.asyncio
+async def test_parallel_wave_shapes_keep_order_and_errors(orch, monkeypatch):
+    """A lone call (awaited in place), a wave within the cap, and a wave over
+    it all return results in call order with raised errors surfaced."""
+    async def fake_exec(websocket, agent_id, tool_name, args, chat_id, user_id):
+        if tool_name == "boom":
+            raise RuntimeError("agent went away")
+        return MCPResponse(result=tool_name)
+
+    monkeypatch.setattr(orch, "_execute_with_retry_audited", fake_exec)
+    monkeypatch.setattr(orch, "_MAX_PARALLEL_CONCURRENCY", 2)
+    for names in (["boom"], ["t1", "boom"], ["t1", "t2", "boom", "t3"]):
+        results = await orch.execute_parallel_tools(
+            MagicMock(), [_tc(n) for n in names], {n: "a1" for n in names},
+            "c1", user_id="u1")
+        assert [r.result or r.error["message"] for r in results] == [
+            "agent went away" if n == "boom" else n for n in names]
+
+
+@pytest.mark.asyncio
+async def test_parallel_wave_reports_calls_still_running(orch, monkeypatch):
+    """As each call of a wave finishes, the status narrows to the ones still
+    running; results keep call order."""
+    import asyncio
+
+    gates = {"slow": asyncio.Event()}
+
+    async def fake_exec(websocket, agent_id, tool_name, args, chat_id, user_id):
+        if tool_name in gates:
+            await gates[tool_name].wait()
+        return MCPResponse(result=tool_name)
+
+    sent = []
+
+    async def fake_send(ws, data):
+        sent.append(json.loads(data))
+        gates["slow"].set()
+        return True
+
+    monkeypatch.setattr(orch, "_execute_with_retry_audited", fake_exec)
+    monkeypatch.setattr(orch, "_safe_send", fake_send)
+    names = ["slow", "fast"]
+    results = await orch.execute_parallel_tools(
+        MagicMock(), [_tc(n) for n in names], {n: "a1" for n in names},
+        "c1", user_id="u1")
+    assert [r.result for r in results] == names
+    assert sent == [{"type": "chat_status", "status": "executing",
+                     "message": "Running: slow... (1/2 done)"}]
+
+
+@pytest.mark.asyncio
+async def test_aborted_wave_reaps_cancelled_calls(orch, monkeypatch):
+    """When the wave is abandoned mid-flight, the calls still running are
+    cancelled and awaited, so their outcome is retrieved before returning."""
+    import asyncio
+
+    reaped = []
+
+    async def fake_exec(websocket, agent_id, tool_name, args, chat_id, user_id):
+        if tool_name == "slow":
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                reaped.append(tool_name)
+                raise RuntimeError("cleanup failed")
+        return MCPResponse(result=tool_name)
+
+    async def failing_send(ws, data):
+        raise ConnectionError("socket gone")
+
+    monkeypatch.setattr(orch, "_execute_with_retry_audited", fake_exec)
+    monkeypatch.setattr(orch, "_safe_send", failing_send)
+    names = ["slow", "fast"]
+    with pytest.raises(ConnectionError):
+        await orch.execute_parallel_tools(
+            MagicMock(), [_tc(n) for n in names], {n: "a1" for n in names},
+            "c1", user_id="u1")
+    assert reaped == ["slow"]
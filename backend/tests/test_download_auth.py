@@ -181,7 +181,7 @@ def test_cookie_token_failing_jwks_validation_is_401(real_auth_env, client, user
     """A session whose access token does not validate must be rejected."""
     monkeypatch.setattr(web_auth, "ensure_session", _session(token="not-a-real-jwt"))
 
-    async def _jwks(url, token=None):
+    async def _jwks(url, token=None, header=None):
         return {"keys": []}
     monkeypatch.setattr("shared.jwks_cache.get_jwks", _jwks)
 
@@ -191,9 +191,9 @@ def test_cookie_token_failing_jwks_validation_is_401(real_auth_env, client, user
 
 def test_cookie_token_valid_via_jwks(real_auth_env, client, user_file, monkeypatch):
     """Non-mock: the session's access token flows through the real JWKS path."""
-    monkeypatch.setattr(web_auth, "ensure_session", _session(token="signed.jwt.token"))
+    monkeypatch.setattr(web_auth, "ensure_session", _session(token="eyJhbGciOiJSUzI1NiJ9.e30.sig"))
 
-    async def _jwks(url, token=None):
+    async def _jwks(url, token=None, header=None):
         return {"keys": [{"kid": "k"}]}
     monkeypatch.setattr("shared.jwks_cache.get_jwks", _jwks)
     monkeypatch.setattr(
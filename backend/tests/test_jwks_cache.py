@@ -213,6 +213,23 @@ def test_kid_miss_refetches_once_and_returns_rotated_key(fetch_counter):
     assert "k2" in jwks_cache._kids(jwks)
 
 
+def test_repeated_kid_misses_refetch_once_per_window(fetch_counter, fake_clock):
+    """Unknown kids inside the cooldown are served the cached set offline."""
+    url = _url()
+
+    async def run(kid):
+        return await jwks_cache.get_jwks(url, token=_make_token(kid))
+
+    asyncio.run(jwks_cache.get_jwks(url))
+    for kid in ("bogus-1", "bogus-2", "bogus-3"):
+        asyncio.run(run(kid))
+    assert fetch_counter["calls"] == 2
+
+    fake_clock["now"] += jwks_cache._KID_MISS_REFETCH_SECONDS
+    asyncio.run(run("bogus-4"))
+    assert fetch_counter["calls"] == 3
+
+
 @pytest.mark.asyncio
 async def test_kid_miss_refetch_updates_cache_for_subsequent_calls():
     """028 D8: the rotation refetch repopulates the cache, so a follow-up
@@ -246,6 +263,30 @@ async def test_kid_miss_refetch_updates_cache_for_subsequent_calls():
     assert rotated == again == docs[1]
 
 
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_fetch(monkeypatch):
+    """A cold cache hit by many requests at once makes one IdP round trip."""
+    calls = {"n": 0}
+    release = asyncio.Event()
+
+    async def _slow_fetch(jwks_url):
+        calls["n"] += 1
+        await release.wait()
+        jwks = {"keys": [{"kid": "k1", "kty": "RSA"}]}
+        jwks_cache._cache[jwks_url] = {"jwks": jwks, "fetched_at": jwks_cache.time.time()}
+        return jwks
+
+    monkeypatch.setattr(jwks_cache, "_fetch", _slow_fetch)
+    url = _url()
+    waiters = [asyncio.create_task(jwks_cache.get_jwks(url)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*waiters)
+    assert calls["n"] == 1
+    assert all(r is results[0] for r in results)
+    assert url not in jwks_cache._inflight
+
+
 # ---------------------------------------------------------------------------
 # (4) clear()
 # ---------------------------------------------------------------------------
@@ -265,6 +306,240 @@ def test_clear_empties_cache_and_forces_refetch(fetch_counter):
     assert fetch_counter["calls"] == 2
 
 
+# ---------------------------------------------------------------------------
+# Conditional refetch
+# ---------------------------------------------------------------------------
+
+def test_refetch_revalidates_with_etag(monkeypatch):
+    """A refresh sends the cached validators; a 304 keeps the cached set."""
+    sent = []
+    replies = [
+        (200, {"keys": [{"kid": "k1"}]}, {"ETag": '"v1"', "Last-Modified": "Mon"}),
+        (304, None, {}),
+    ]
+
+    class _Resp:
+        def __init__(self, status, body, headers):
+            self.status, self._body, self.headers = status, body, headers
+
+        async def json(self):
+            return self._body
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+    class _Session:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        def get(self, url, headers=None):
+            sent.append(dict(headers or {}))
+            return _Resp(*replies.pop(0))
+
+    monkeypatch.setattr(jwks_cache, "aiohttp",
+                        types.SimpleNamespace(ClientSession=_Session))
+    url = _url()
+    first = asyncio.run(jwks_cache._fetch(url))
+    again = asyncio.run(jwks_cache._fetch(url))
+
+    assert sent[0] == {}
+    assert sent[1] == {"If-None-Match": '"v1"', "If-Modified-Since": "Mon"}
+    assert again is first == {"keys": [{"kid": "k1"}]}
+
+
+# ---------------------------------------------------------------------------
+# Per-kid signing key
+# ---------------------------------------------------------------------------
+
+def _rsa_jwks(kid: str):
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from jose import jwk
+
+    private = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = private.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption())
+    public = jwk.construct(pem, "RS256").public_key().to_dict()
+    public.update({"kid": kid, "use": "sig"})
+    enc = dict(public, kid="enc-key", use="enc")
+    return pem, {"keys": [enc, public]}
+
+
+def test_signing_key_is_built_once_per_kid_and_verifies():
+    from jose import jwt as jose_jwt
+
+    pem, jwks = _rsa_jwks("sig-key")
+    token = jose_jwt.encode({"sub": "u1"}, pem, algorithm="RS256",
+                            headers={"kid": "sig-key"})
+    key = jwks_cache.signing_key(jwks, token)
+    assert key is not jwks
+    assert jwks_cache.signing_key(jwks, token) is key
+    assert jose_jwt.decode(token, key, algorithms=["RS256"])["sub"] == "u1"
+
+
+def test_fetch_prebuilds_signing_keys(monkeypatch):
+    _, jwks = _rsa_jwks("sig-key")
+
+    class _Resp:
+        status = 200
+        headers: dict = {}
+
+        async def json(self):
+            return jwks
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+    class _Session:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        def get(self, url, headers=None):
+            return _Resp()
+
+    monkeypatch.setattr(jwks_cache, "aiohttp",
+                        types.SimpleNamespace(ClientSession=_Session))
+    asyncio.run(jwks_cache._fetch(_url()))
+    assert set(jwks_cache._keys) == {"sig-key"}  # the enc key is skipped
+
+
+def test_signing_key_falls_back_to_the_whole_set():
+    _, jwks = _rsa_jwks("sig-key")
+    assert jwks_cache.signing_key(jwks, _make_token("other")) is jwks
+    assert jwks_cache.signing_key(jwks, _make_token("enc-key")) is jwks
+    assert jwks_cache.signing_key(jwks, "not-a-jwt") is jwks
+    assert jwks_cache.signing_key({}, _make_token("sig-key")) == {}
+
+
+def test_is_acceptable_token_rejects_malformed_and_other_algs(monkeypatch):
+    monkeypatch.delenv("KEYCLOAK_TOKEN_ALGORITHMS", raising=False)
+    def _tok(header):
+        seg = base64.urlsafe_b64encode(json.dumps(header).encode()).rstrip(b"=").decode()
+        return f"{seg}.e30.sig"
+
+    assert jwks_cache.is_acceptable_token(_tok({"alg": "RS256", "kid": "k1"}))
+    assert not jwks_cache.is_acceptable_token(_tok({"alg": "none"}))
+    assert not jwks_cache.is_acceptable_token(_tok({"alg": "HS256"}))
+    assert not jwks_cache.is_acceptable_token(_tok(["RS256"]))
+    assert not jwks_cache.is_acceptable_token("a.b.c")
+    assert not jwks_cache.is_acceptable_token("only.two")
+    assert not jwks_cache.is_acceptable_token(_tok({"alg": "RS256"}) + ".extra")
+    assert not jwks_cache.is_acceptable_token(None)
+
+
+def test_header_is_decoded_once_per_validation(fetch_counter, monkeypatch):
+    decodes = []
+    real = jwks_cache.base64.urlsafe_b64decode
+    monkeypatch.setattr(jwks_cache.base64, "urlsafe_b64decode",
+                        lambda b: decodes.append(b) or real(b))
+    url = _url()
+    token = _make_token("k1")
+
+    async def validate():
+        header = jwks_cache.token_header(token)
+        assert jwks_cache.is_acceptable_token(token, header)
+        jwks = await jwks_cache.get_jwks(url, token=token, header=header)
+        return jwks_cache.signing_key(jwks, token, header)
+
+    asyncio.run(validate())
+    header_segment = token.split(".")[0]
+    assert sum(1 for b in decodes if str(b).startswith(header_segment)) == 1
+
+
+def test_es256_accepted_only_when_enabled(monkeypatch):
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from jose import jwk
+    from jose import jwt as jose_jwt
+
+    private = ec.generate_private_key(ec.SECP256R1())
+    pem = private.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption())
+    public = jwk.construct(pem, "ES256").public_key().to_dict()
+    public.update({"kid": "ec-key", "use": "sig"})
+    token = jose_jwt.encode({"sub": "u1"}, pem, algorithm="ES256",
+                            headers={"kid": "ec-key"})
+
+    monkeypatch.delenv("KEYCLOAK_TOKEN_ALGORITHMS", raising=False)
+    assert jwks_cache.accepted_algorithms() == ("RS256",)
+    assert not jwks_cache.is_acceptable_token(token)
+
+    monkeypatch.setenv("KEYCLOAK_TOKEN_ALGORITHMS", "es256, RS256, none, HS256")
+    assert jwks_cache.accepted_algorithms() == ("ES256", "RS256")
+    assert jwks_cache.is_acceptable_token(token)
+    key = jwks_cache.signing_key({"keys": [public]}, token)
+    assert jose_jwt.decode(token, key,
+                           algorithms=list(jwks_cache.accepted_algorithms()))["sub"] == "u1"
+
+
+# ---------------------------------------------------------------------------
+# Verified-claims cache
+# ---------------------------------------------------------------------------
+
+def test_claims_cached_until_exp_and_returned_as_copies(fake_clock):
+    token = _make_token("k1")
+    payload = {"sub": "u1", "exp": fake_clock["now"] + 60,
+               "realm_access": {"roles": ["user"]}}
+    jwks_cache.remember_claims(token, payload)
+
+    hit = jwks_cache.cached_claims(token)
+    assert hit == payload
+    hit["realm_access"]["roles"].append("admin")
+    assert jwks_cache.cached_claims(token)["realm_access"]["roles"] == ["user"]
+    assert jwks_cache.cached_claims(_make_token("k2")) is None
+
+    fake_clock["now"] += 60
+    assert jwks_cache.cached_claims(token) is None
+
+
+def test_claims_ttl_caps_long_lived_tokens(fake_clock):
+    token = _make_token("k1")
+    jwks_cache.remember_claims(token, {"sub": "u1", "exp": fake_clock["now"] + 86400})
+    fake_clock["now"] += jwks_cache._CLAIMS_TTL_SECONDS
+    assert jwks_cache.cached_claims(token) is None
+
+
+def test_claims_without_exp_are_not_cached():
+    token = _make_token("k1")
+    jwks_cache.remember_claims(token, {"sub": "u1"})
+    assert jwks_cache.cached_claims(token) is None
+    assert not jwks_cache._claims
+
+
+def test_claims_keyed_by_token_hash_and_bounded(monkeypatch, fake_clock):
+    monkeypatch.setattr(jwks_cache, "_CLAIMS_MAX_ENTRIES", 2)
+    tokens = [_make_token(f"k{i}") for i in range(3)]
+    for t in tokens:
+        jwks_cache.remember_claims(t, {"sub": t, "exp": fake_clock["now"] + 60})
+    assert all(t.encode() not in k for k in jwks_cache._claims for t in tokens)
+    assert jwks_cache.cached_claims(tokens[0]) is None
+    assert jwks_cache.cached_claims(tokens[2])["sub"] == tokens[2]
+
+
+def test_rejections_remembered_briefly(fake_clock):
+    token = _make_token("k1")
+    assert not jwks_cache.recently_rejected(token)
+    jwks_cache.remember_rejection(token)
+    assert jwks_cache.recently_rejected(token)
+    assert not jwks_cache.recently_rejected(_make_token("k2"))
+    fake_clock["now"] += jwks_cache._REJECTED_TTL_SECONDS
+    assert not jwks_cache.recently_rejected(token)
+
+
 # ---------------------------------------------------------------------------
 # (5) Call-site wiring — both 028 validators route through the shared cache
 # ---------------------------------------------------------------------------
@@ -290,3 +565,24 @@ def test_orchestrator_auth_module_uses_shared_jwks_cache():
     fn_src = inspect.getsource(auth_mod.get_current_user_payload)
     assert "shared.jwks_cache" in fn_src
     assert "get_jwks" in fn_src
+
+
+def test_auth_wrapper_rejects_malformed_token_without_error_log(monkeypatch, caplog):
+    """Deliberate 401s (malformed token) are not logged as validation faults."""
+    import logging
+
+    from fastapi import HTTPException
+    from fastapi.security import HTTPAuthorizationCredentials
+
+    import orchestrator.auth as auth_mod
+
+    monkeypatch.delenv("USE_MOCK_AUTH", raising=False)
+    monkeypatch.setenv("KEYCLOAK_AUTHORITY", "https://kc.invalid/realms/x")
+    monkeypatch.setenv("KEYCLOAK_CLIENT_ID", "astral-frontend")
+    request = types.SimpleNamespace(method="GET", query_params={},
+                                    state=types.SimpleNamespace())
+    creds = HTTPAuthorizationCredentials(scheme="Bearer", credentials="a.b.c")
+    with caplog.at_level(logging.INFO), pytest.raises(HTTPException) as excinfo:
+        asyncio.run(auth_mod.get_current_user_payload(request, creds))
+    assert excinfo.value.status_code == 401
+    assert not [r for r in caplog.records if r.levelno >= logging.ERROR]
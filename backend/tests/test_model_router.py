@@ -148,3 +148,41 @@ def test_route_sets_ondevice_hint():
                  device_caps={"has_browser_ai": True})
     assert d.ondevice is True
     assert ONDEVICE < d.tier  # server still resolves a real tier as fallback
+
+
+# ───────────────────────── chat-title call site ──────────────────────────────
+
+async def test_chat_title_runs_on_small_tier(monkeypatch):
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock, MagicMock
+
+    from orchestrator.orchestrator import Orchestrator
+
+    monkeypatch.setenv("FF_MODEL_ROUTER", "true")
+    monkeypatch.setenv("MODEL_TIERS", '{"small": "tiny-model"}')
+    sent = {}
+
+    def create(**kwargs):
+        sent.update(kwargs)
+        msg = SimpleNamespace(content="Weather In Paris")
+        return SimpleNamespace(choices=[SimpleNamespace(message=msg)], usage=None)
+
+    client = SimpleNamespace(chat=SimpleNamespace(
+        completions=SimpleNamespace(create=create)))
+    orch = Orchestrator.__new__(Orchestrator)
+    orch._LLMUnavailable = RuntimeError
+    orch._CredentialSource = SimpleNamespace(USER="user")
+    orch._resolve_llm_client_for = AsyncMock(return_value=(
+        client, "system", SimpleNamespace(model="big-model")))
+    orch._llm_audit_principals = MagicMock(return_value=("u", "u"))
+    orch._record_llm_call = AsyncMock()
+    orch.audit_recorder = MagicMock()
+    orch.history = MagicMock()
+    orch._broadcast_user_history = AsyncMock()
+
+    await orch.summarize_chat_title("c1", "what's the weather in paris", user_id="u")
+
+    assert sent["model"] == "tiny-model"
+    assert sent["temperature"] == 0 and sent["max_tokens"] == 20
+    orch.history.update_chat_title.assert_called_once_with(
+        "c1", "Weather In Paris", user_id="u")
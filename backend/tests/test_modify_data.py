@@ -213,6 +213,33 @@ def test_backward_compatibility_with_file():
     os.remove(file_path)
 
 
+def test_batch_evaluation_matches_row_by_row():
+    """The NumPy batch path returns exactly what per-row evaluation does."""
+    from shared.expression_evaluator import ExpressionEvaluator
+
+    rows = [{"n": n, "p": n * 0.5, "q": str(n % 3), "mixed": n if n % 2 else float(n),
+             "a": 2 ** 33 + n, "b": 2 ** 33, "c": 7}
+            for n in range(1, 40)]
+    for expr in ("row['n'] * 3 + 1", "int(row['q']) * row['p']", "row['n'] > 7",
+                 "row['n'] // (row['n'] % 5)", "row['mixed'] + 1", "row['q'] * 2",
+                 "row['n'] ** 40",
+                 # int64 intermediates that wrap must not leak into float,
+                 # bool or cast results
+                 "row['a'] * row['b'] / row['c']", "row['a'] * row['b'] > 0",
+                 "float(row['a'] * row['b'])", "row['a'] * row['b'] - row['a'] * row['b']",
+                 "(row['n'] > 3) + (row['n'] > 5)"):
+        evaluator = ExpressionEvaluator(expr)
+        expected = []
+        for row in rows:
+            try:
+                expected.append(evaluator.evaluate(row))
+            except Exception:
+                expected.append(None)
+        got = ExpressionEvaluator.evaluate_batch(expr, rows)
+        assert got == expected, expr
+        assert [type(v) for v in got] == [type(v) for v in expected], expr
+
+
 if __name__ == "__main__":
     # Run all tests
     test_basic_add_column()
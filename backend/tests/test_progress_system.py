@@ -169,6 +169,16 @@ def test_progress_emitter_throttling():
     print("✓ ProgressEmitter throttling tests passed")
 
 
+def test_progress_emitter_throttle_ignores_wall_clock_jumps():
+    """A wall-clock step backwards must not hold events back."""
+    from unittest.mock import patch
+    emitter = ProgressEmitter(phase=ProgressPhase.TESTING)
+    assert emitter.emit(ProgressStep.SAVING_FILES, 10, "first") is not None
+    emitter.last_emit_ns -= 200_000_000  # 200ms of monotonic time passes
+    with patch("shared.progress.time.time", return_value=0.0):
+        assert emitter.emit(ProgressStep.STARTING_PROCESS, 20, "second") is not None
+
+
 def test_progress_emitter_error_warning():
     """Test error and warning emission."""
     mock_callback = Mock()
@@ -0,0 +1,111 @@
+"""Prompt-prefix stability for the chat ReAct loop.
+
+The tool schema travels in every completion request ahead of the
+conversation, so provider-side automatic prefix caching only hits when it is
+byte-identical from call to call. The agent tool definitions handed to
+``_call_llm`` are therefore emitted in LLM-name order, independent of the
+order agents happened to register in.
+
+Uses a real Postgres-backed Orchestrator with every LLM/websocket side effect
+mocked, matching ``test_chat_text_only.py``.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+_USER = "prompt-cache-test-user"
+
+
+@pytest.fixture
+def orchestrator():
+    from orchestrator.orchestrator import Orchestrator
+
+    try:
+        orch = Orchestrator()
+    except Exception as exc:
+        pytest.skip(f"orchestrator/database unavailable: {exc}")
+    orch._llm_store.set_sync(_USER, provider="custom",
+                             base_url="http://test.invalid/v1",
+                             model="test-model", api_key="test-key")
+    orch.audit_recorder = MagicMock()
+    orch.audit_recorder.record = AsyncMock()
+    orch._record_llm_call = AsyncMock()
+    orch._record_llm_unconfigured = AsyncMock()
+    orch._safe_send = AsyncMock()
+    orch.send_ui_render = AsyncMock()
+    fake_heartbeat = MagicMock()
+    fake_heartbeat.cancel = MagicMock()
+    orch._start_heartbeat = AsyncMock(return_value=fake_heartbeat)
+    orch._send_or_replace_components = AsyncMock()
+    orch._emit_llm_usage_report = AsyncMock()
+    orch.tool_permissions = MagicMock()
+    orch.tool_permissions.is_tool_allowed.return_value = True
+    return orch
+
+
+def _card(agent_id, *skill_ids):
+    from shared.protocol import AgentCard, AgentSkill
+    return AgentCard(
+        name=agent_id, description="d", agent_id=agent_id,
+        skills=[AgentSkill(name=s, description=s, id=s,
+                           input_schema={"type": "object"}) for s in skill_ids],
+    )
+
+
+async def _turn_tools(orch, cards):
+    orch.agent_cards.clear()
+    orch.agents.clear()
+    for card in cards:
+        orch.agent_cards[card.agent_id] = card
+        orch.agents[card.agent_id] = MagicMock()
+    ws = MagicMock()
+    orch.ui_sessions[ws] = {"sub": _USER, "preferred_username": _USER}
+    chat_id = f"prefix-{uuid.uuid4().hex[:8]}"
+    await asyncio.to_thread(orch.history.create_chat, chat_id, user_id=_USER)
+    captured = {}
+
+    async def fake_call_llm(websocket, messages, tools_desc=None, temperature=None,
+                            feature: str = "tool_dispatch"):
+        captured.setdefault("tools_desc", tools_desc)
+        return SimpleNamespace(content="ok", tool_calls=None,
+                               reasoning_content=None), None
+
+    orch._call_llm = fake_call_llm
+    await orch.handle_chat_message(ws, "hello", chat_id, user_id=_USER)
+    await asyncio.to_thread(orch.history.delete_chat, chat_id, user_id=_USER)
+    return captured["tools_desc"]
+
+
+async def test_agent_tools_are_emitted_in_name_order(orchestrator):
+    first = await _turn_tools(orchestrator, [
+        _card("zeta-1", "zz_tool", "alpha_tool"), _card("beta-1", "mid_tool")])
+    second = await _turn_tools(orchestrator, [
+        _card("beta-1", "mid_tool"), _card("zeta-1", "alpha_tool", "zz_tool")])
+    names = [t["function"]["name"] for t in first]
+    agent_names = [n for n in names if n in {"alpha_tool", "mid_tool", "zz_tool"}]
+    assert agent_names == ["alpha_tool", "mid_tool", "zz_tool"]
+    assert json.dumps(first, sort_keys=False) == json.dumps(second, sort_keys=False)
+
+
+async def test_tool_definitions_reused_until_the_card_changes(orchestrator):
+    card = _card("beta-1", "mid_tool")
+    first = await _turn_tools(orchestrator, [card])
+    again = await _turn_tools(orchestrator, [card])
+    replaced = await _turn_tools(orchestrator, [_card("beta-1", "mid_tool")])
+
+    def _mid(tools):
+        return next(t for t in tools if t["function"]["name"] == "mid_tool")
+
+    assert _mid(first) is _mid(again)
+    assert _mid(replaced) is not _mid(first)
+    assert _mid(replaced) == _mid(first)
@@ -53,6 +53,29 @@ def test_plain_result_serialized_whole():
     assert _to_content(res) == json.dumps({"x": 1, "y": 2})
 
 
+def test_agent_frame_raw_text_reused_byte_identically():
+    from shared.protocol import MCPResponse, decode_agent_frame
+    frame = MCPResponse(
+        request_id="r1",
+        result={"_data": {"rows": [[1, "é"]], "n": 1.5}, "_ui_components": []},
+    ).to_json()
+    res = decode_agent_frame(frame)
+    assert res.raw_data_json == json.dumps({"rows": [[1, "é"]], "n": 1.5})
+    assert _to_content(res) == json.dumps(res.result["_data"])
+    whole = decode_agent_frame(MCPResponse(request_id="r2", result={"x": [1, 2]}).to_json())
+    assert whole.raw_data_json is None
+    assert _to_content(whole) == json.dumps({"x": [1, 2]})
+    # Raw text is instance state only: never re-sent, never part of equality.
+    assert "raw_result_json" not in json.loads(res.to_json())
+    assert res == MCPResponse(**json.loads(frame))
+
+
+def test_constructed_response_without_raw_text_still_serializes():
+    from shared.protocol import MCPResponse
+    res = MCPResponse(request_id="r3", result={"_data": [1]})
+    assert res.raw_result_json is None
+    assert _to_content(res) == json.dumps([1])
+
 # --------------------------------------------------------------------------
 # C-N15 — digest tier
 # --------------------------------------------------------------------------
@@ -0,0 +1,65 @@
+"""Runtime registry load (``AgentSpecValidator._load_registry``) vs. the
+process-global ``sys.path``.
+
+Draft validation runs on worker threads (``agent_lifecycle``), so the loader
+must serialize its exec of generated code and must not restore a stale
+``sys.path`` snapshot over entries other code added in the meantime.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from orchestrator import agent_validator  # noqa: E402
+from orchestrator.agent_validator import AgentSpecValidator, ValidationReport  # noqa: E402
+
+
+def _write_tools(agents_dir, slug, body):
+    os.makedirs(agents_dir / slug)
+    (agents_dir / slug / "mcp_tools.py").write_text(
+        "import sys\n"
+        "from orchestrator import agent_validator\n"
+        f"{body}\n"
+        "TOOL_REGISTRY = {'t': {'function': lambda **kw: None}}\n"
+    )
+
+
+def test_load_keeps_sys_path_entries_added_during_the_load(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    agents_dir = tmp_path / "agents"
+    sentinel = str(tmp_path / "added-elsewhere")
+    _write_tools(agents_dir, "grow", f"sys.path.append({sentinel!r})")
+
+    report = ValidationReport()
+    registry = AgentSpecValidator()._load_registry(
+        "", "grow", str(agents_dir), report)
+
+    assert registry is not None, report.findings
+    assert sentinel in sys.path
+    assert str(tmp_path) not in sys.path
+
+
+def test_concurrent_loads_are_serialized(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    agents_dir = tmp_path / "agents"
+    _write_tools(agents_dir, "held",
+                 "assert agent_validator._REGISTRY_LOAD_LOCK.locked()")
+    v = AgentSpecValidator()
+    results = []
+
+    def _load():
+        report = ValidationReport()
+        results.append(v._load_registry("", "held", str(agents_dir), report))
+
+    threads = [threading.Thread(target=_load) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(results) == 8 and all(r is not None for r in results)
+    assert not agent_validator._REGISTRY_LOAD_LOCK.locked()
+    assert sys.path.count(str(tmp_path)) == 0
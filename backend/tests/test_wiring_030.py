@@ -633,7 +633,9 @@ def test_narrative_is_long_detects_length_headings_tables():
     assert Orchestrator._narrative_is_long("x" * 800) is True
     assert Orchestrator._narrative_is_long("## Specific Aims\nshort") is True
     assert Orchestrator._narrative_is_long("| a | b |\n| 1 | 2 |") is True
+    assert Orchestrator._narrative_is_long("intro\n| a | b |\nafter") is True
     assert Orchestrator._narrative_is_long("A short plain answer.") is False
+    assert Orchestrator._narrative_is_long("a | b | c\n#hashtag") is False
 
 
 def test_concise_lead_strips_structure_and_ends_at_sentence():
@@ -30,6 +30,16 @@ def test_uiupdate_carries_html():
     assert data["type"] == "ui_update" and data["html"] and data["components"] == comps
 
 
+def test_nested_component_tree_serializes_like_asdict():
+    from dataclasses import asdict
+    inner = ap.Text(content="leaf").to_dict()
+    comps = [{"type": "container", "children": [{"type": "card", "children": [inner]}]}]
+    msg = UIRender(components=comps, target="chat")
+    expected = asdict(msg)
+    del expected["speech"]                       # absent, not null, off-watch
+    assert json.loads(msg.to_json()) == expected
+
+
 def test_stream_chunk_wire_shape():
     # mirrors stream_manager._send_chunk_to_subscribers wire_msg
     comps = [ap.Text(content="chunk").to_dict()]